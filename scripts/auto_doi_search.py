@@ -4,12 +4,17 @@
 CrossRef API로 CsPbCl3 관련 논문 자동 검색 → PDF 다운로드 → 데이터 추출
 """
 
-import requests
+import sys
 import time
 from pathlib import Path
 from typing import List, Dict
 import logging
 
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.http_client import get_client
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -22,6 +27,7 @@ class AutoDOICollector:
     def __init__(self):
         self.crossref_api = "https://api.crossref.org/works"
         self.email = "your_email@example.com"  # CrossRef 정책: 이메일 추가
+        self.http = get_client()  # 쿼리 간 CrossRef 연결 재사용
         
     def search_crossref(
         self, 
@@ -58,7 +64,7 @@ class AutoDOICollector:
         logger.info(f"🔍 CrossRef 검색: '{query}' (최대 {limit}개)")
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 self.crossref_api,
                 params=params,
                 timeout=30
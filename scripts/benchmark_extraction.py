@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+PDF 데이터 추출 성능 벤치마크
+생성한 고정 코퍼스(PDF + 텍스트)로 오프라인에서 단계별 실행 시간을 측정하고
+저장된 기준값(baseline)과 비교하여 성능 저하를 감지
+
+기계마다 절대 시간이 다르므로 같은 실행에서 측정한 기준 작업(reference: 추출기 코드와
+무관한 고정 텍스트 처리) 대비 상대 시간으로 비교합니다.
+
+사용 예:
+    python scripts/benchmark_extraction.py                    # 측정 + 기준값 비교
+    python scripts/benchmark_extraction.py --update-baseline  # 기준값 갱신
+"""
+
+import sys
+import json
+import random
+import re
+import zlib
+from collections import Counter
+import argparse
+import tempfile
+import time
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.pdf_data_extractor import PDFDataExtractor
+from src.table_model import normalize_tables
+from src.memory_usage import peak_rss_mb
+from src.text_normalize import normalize_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = project_root / "results" / "benchmark_baseline.json"
+DEFAULT_TOLERANCE = 0.25  # 기준값 대비 25% 이상 느려지면 성능 저하
+
+
+# ============================================================================
+# 고정 코퍼스 생성 (외부 라이브러리 없이 최소 PDF 직접 작성)
+# ============================================================================
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+FONT_SIZE, LEADING = 10, 13
+CHARS_PER_LINE = 95
+LINES_PER_PAGE = 52
+
+FILLER_SENTENCES = [
+    "Lead halide perovskite nanocrystals have attracted attention for optoelectronic applications.",
+    "The optical properties depend strongly on the surface chemistry of the nanocrystals.",
+    "Figure 2 shows the TEM images and the corresponding size distribution histograms.",
+    "Ligand exchange was monitored by FTIR and NMR spectroscopy of the purified samples.",
+    "Blue emitting perovskites remain less efficient than their green and red counterparts.",
+    "The XRD patterns match the cubic phase without any detectable secondary phases.",
+    "Time resolved PL decays were fitted with a biexponential function.",
+    "Chloride vacancies introduce trap states that quench the band edge emission.",
+]
+
+SYNTHESIS_TEMPLATE = (
+    "CsPbCl3 quantum dots were synthesized by the hot-injection method. "
+    "PbCl2 ({pb} mmol), ODE ({ode} mL), OA ({oa} mL) and OLA ({ola} mL) were loaded into a "
+    "flask and dried under vacuum. Cs-oleate prepared from Cs2CO3 was swiftly injected at "
+    "{temp} °C and the reaction was quenched after {time} s in an ice bath."
+)
+
+PROPERTY_TEMPLATE = (
+    "The nanocrystals have an average size of {size} nm. The PL peak is located at {pl} nm "
+    "with a FWHM of {fwhm} nm and a PLQY of {plqy}%. The first excitonic absorption peak "
+    "appears at {abs} nm."
+)
+
+
+def _pdf_string(text: str) -> bytes:
+    """PDF 문자열 리터럴 (WinAnsi 인코딩, 괄호/역슬래시 이스케이프)"""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    return b'(' + escaped.encode('cp1252', errors='replace') + b')'
+
+
+def _wrap(paragraph: str) -> List[str]:
+    """문단을 CHARS_PER_LINE 폭으로 줄바꿈"""
+    lines, line = [], ''
+    for word in paragraph.split():
+        if line and len(line) + 1 + len(word) > CHARS_PER_LINE:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _text_page_stream(lines: List[str]) -> bytes:
+    """텍스트 줄로 된 페이지 내용 스트림"""
+    ops = [b'BT', f'/F1 {FONT_SIZE} Tf {LEADING} TL 54 {PAGE_HEIGHT - 60} Td'.encode()]
+    for line in lines:
+        ops.append(_pdf_string(line) + b" Tj T*")
+    ops.append(b'ET')
+    return b'\n'.join(ops)
+
+
+def _table_page_stream(caption: str, rows: List[List[str]]) -> bytes:
+    """캡션 + 격자선 표 페이지 내용 스트림 (pdfplumber 선 기반 표 인식 대상)"""
+    col_width, row_height = 120, 20
+    left, top = 54, PAGE_HEIGHT - 100
+    n_cols = len(rows[0])
+    right = left + col_width * n_cols
+    bottom = top - row_height * len(rows)
+
+    ops = [b'BT', f'/F1 {FONT_SIZE} Tf {left} {PAGE_HEIGHT - 70} Td'.encode(),
+           _pdf_string(caption) + b' Tj', b'ET', b'0.5 w']
+    for r in range(len(rows) + 1):
+        y = top - r * row_height
+        ops.append(f'{left} {y} m {right} {y} l S'.encode())
+    for c in range(n_cols + 1):
+        x = left + c * col_width
+        ops.append(f'{x} {top} m {x} {bottom} l S'.encode())
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            x = left + c * col_width + 4
+            y = top - (r + 1) * row_height + 6
+            ops.append(b'BT ' + f'/F1 {FONT_SIZE} Tf {x} {y} Td '.encode()
+                       + _pdf_string(cell) + b' Tj ET')
+    return b'\n'.join(ops)
+
+
+def write_pdf(path: Path, streams: List[bytes]):
+    """페이지 내용 스트림 목록으로 최소 PDF 파일 작성 (Helvetica, WinAnsi)"""
+    n_pages = len(streams)
+    # 객체 번호: 1 카탈로그, 2 페이지 트리, 3 폰트, 이후 (페이지, 내용) 쌍
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        ('<< /Type /Pages /Count %d /Kids [%s] >>' % (
+            n_pages, ' '.join(f'{4 + 2 * i} 0 R' for i in range(n_pages)))).encode(),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+    ]
+    for i, stream in enumerate(streams):
+        objects.append((f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] '
+                        f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>').encode())
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n'.encode() + stream + b'\nendstream')
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n'.encode() + body + b'\nendobj\n'
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode()
+    for offset in offsets:
+        out += f'{offset:010d} 00000 n \n'.encode()
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode()
+    path.write_bytes(bytes(out))
+
+
+def _paper_paragraphs(rng: random.Random, n_pages: int) -> Tuple[List[str], Dict]:
+    """논문 한 편 분량의 문단 (서론 - 실험 - 결과 - 참고문헌)"""
+    values = {
+        'pb': rng.choice(['0.188', '0.2', '0.376']), 'ode': rng.choice(['5', '10']),
+        'oa': rng.choice(['0.5', '1.0']), 'ola': rng.choice(['0.5', '1.0']),
+        'temp': rng.randint(140, 200), 'time': rng.choice([5, 10, 30]),
+        'size': round(rng.uniform(6, 14), 1), 'pl': rng.randint(400, 415),
+        'fwhm': rng.randint(10, 16), 'plqy': rng.randint(20, 90), 'abs': rng.randint(390, 405),
+    }
+
+    def filler(n):
+        return ' '.join(rng.choice(FILLER_SENTENCES) for _ in range(n))
+
+    body_lines = max(1, n_pages - 2) * LINES_PER_PAGE
+    n_filler = max(2, body_lines // 6)  # 채움 문단 하나 ≈ 6줄
+    paragraphs = ["Introduction", filler(6), "Experimental Section",
+                  SYNTHESIS_TEMPLATE.format(**values), "Results and Discussion",
+                  PROPERTY_TEMPLATE.format(**values)]
+    paragraphs += [filler(6) for _ in range(n_filler)]
+    paragraphs += ["References"]
+    paragraphs += [f"({i}) Author, A.; Author, B. J. Phys. Chem. Lett. 20{rng.randint(10, 24)}, "
+                   f"{rng.randint(1, 15)}, {rng.randint(100, 9999)}." for i in range(1, 41)]
+    return paragraphs, values
+
+
+def generate_corpus(corpus_dir: Path, n_docs: int = 8, pages_per_doc: int = 12,
+                    seed: int = 0) -> Dict:
+    """
+    벤치마크용 고정 코퍼스 생성 (같은 seed면 항상 같은 파일)
+
+    Returns:
+        Dict: {'pdfs': [...], 'texts': [...], 'pages': 총 페이지 수}
+    """
+    rng = random.Random(seed)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    pdfs, texts = [], []
+    total_pages = 0
+
+    for doc in range(n_docs):
+        paragraphs, values = _paper_paragraphs(rng, pages_per_doc)
+        lines = [line for paragraph in paragraphs for line in (_wrap(paragraph) or [''])]
+        pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+
+        streams = [_text_page_stream(page) for page in pages]
+        # 합성/특성 표 페이지 (결과 섹션 뒤)
+        streams.insert(min(3, len(streams)), _table_page_stream(
+            "Table 1. Synthesis conditions of CsPbCl3 quantum dots",
+            [['Sample', 'Temperature (°C)', 'PbCl2 (mmol)', 'OA (mL)'],
+             ['QD-1', str(values['temp']), values['pb'], values['oa']],
+             ['QD-2', str(values['temp'] + 10), values['pb'], values['oa']]]))
+        streams.insert(min(4, len(streams)), _table_page_stream(
+            "Table 2. Optical properties",
+            [['Sample', 'PL (nm)', 'FWHM (nm)', 'PLQY (%)'],
+             ['QD-1', str(values['pl']), str(values['fwhm']), str(values['plqy'])],
+             ['QD-2', str(values['pl'] + 2), str(values['fwhm'] + 1), str(values['plqy'] - 5)]]))
+
+        pdf_path = corpus_dir / f"bench_{doc:03d}.pdf"
+        write_pdf(pdf_path, streams)
+        pdfs.append(pdf_path)
+        total_pages += len(streams)
+
+        text_path = corpus_dir / f"bench_{doc:03d}.txt"
+        text_path.write_text('\n'.join(lines), encoding='utf-8')
+        texts.append(text_path)
+
+    return {'pdfs': pdfs, 'texts': texts, 'pages': total_pages}
+
+
+# ============================================================================
+# 측정
+# ============================================================================
+
+def _time_stage(func: Callable, items: list, repeat: int) -> float:
+    """items 각각에 func를 repeat번 실행한 총 시간 (초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    return time.perf_counter() - start
+
+
+def _reference_work(text: str):
+    """기준 작업: 추출기 코드와 무관한 고정 텍스트 처리 (정규식 토큰화 + 집계 + 압축)"""
+    Counter(re.findall(r'[a-z]+', text.lower()))
+    zlib.compress(text.encode('utf-8'), 6)
+
+
+def time_reference(texts: List[str], repeat: int = 5, trials: int = 3) -> float:
+    """기준 작업 1회(코퍼스 전체) 시간 (초, trials번 중 최소 - 잡음 제거)"""
+    return min(_time_stage(_reference_work, texts, repeat) / repeat for _ in range(trials))
+
+
+def run_benchmark(corpus: Dict, repeat: int = 3) -> Dict:
+    """
+    단계별 실행 시간 측정 (캐시/Selenium/네트워크 없이)
+
+    Returns:
+        Dict: 단계별 총 시간, 문서당 ms, 처리량, 최대 RSS
+    """
+    corpus_dir = corpus['pdfs'][0].parent
+    extractor = PDFDataExtractor(corpus_dir, use_selenium=False, use_cache=False)
+
+    pdfs = corpus['pdfs']
+    texts = [path.read_text(encoding='utf-8') for path in corpus['texts']]
+    n_docs = len(pdfs)
+
+    # PDF 단계는 한 번만 (pdfplumber가 느리고 매번 같은 작업)
+    pdf_text = []
+    pdf_tables = []
+    stages = {
+        'extract_text_from_pdf': _time_stage(
+            lambda path: pdf_text.append(extractor.extract_text_from_pdf(path)), pdfs, 1),
+        'extract_tables_from_pdf': _time_stage(
+            lambda path: pdf_tables.append(normalize_tables(extractor.extract_tables_from_pdf(path))),
+            pdfs, 1),
+    }
+
+    # 파서 단계는 repeat번 반복 후 1회 기준으로 환산
+    stages['parse_synthesis_from_table'] = _time_stage(
+        extractor.parse_synthesis_from_table, pdf_tables, repeat) / repeat
+    stages['parse_properties_from_table'] = _time_stage(
+        extractor.parse_properties_from_table, pdf_tables, repeat) / repeat
+    # 텍스트 정규화는 파이프라인과 같이 문서당 한 번 (추출 단계는 정규화된 텍스트 사용)
+    normalized = []
+    stages['normalize_text'] = _time_stage(
+        lambda text: normalized.append(normalize_text(text)), texts, 1)
+    texts = normalized
+    stages['extract_synthesis_conditions'] = _time_stage(
+        extractor.extract_synthesis_conditions, texts, repeat) / repeat
+    stages['extract_qd_properties'] = _time_stage(
+        extractor.extract_qd_properties, texts, repeat) / repeat
+
+    reference = time_reference(texts)
+    report = {
+        'corpus': {'documents': n_docs, 'pages': corpus['pages']},
+        'reference_ms': round(reference * 1000, 3),
+        'stages': {},
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+    for name, seconds in stages.items():
+        entry = {
+            'seconds': round(seconds, 4),
+            'per_doc_ms': round(seconds / n_docs * 1000, 3),
+            'docs_per_sec': round(n_docs / seconds, 2) if seconds else None,
+            'relative': round(seconds / reference, 4),  # 기준 작업 대비 (기계 간 비교용)
+        }
+        if name.endswith('_from_pdf'):
+            entry['pages_per_sec'] = round(corpus['pages'] / seconds, 2) if seconds else None
+        report['stages'][name] = entry
+
+    # PDF에서 추출한 텍스트로도 필드가 나오는지 (코퍼스 손상 감지용)
+    report['fields_found'] = len(extractor.extract_qd_properties(pdf_text[0])) if pdf_text else 0
+    return report
+
+
+def compare_with_baseline(report: Dict, baseline: Dict,
+                          tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """
+    기준값 대비 단계별 시간 비교 (같은 실행의 기준 작업 대비 상대 시간끼리 비교)
+
+    기준값에 상대 시간이 없으면(이전 형식) 문서당 절대 시간으로 비교하며,
+    이 경우 기준값을 만든 기계에서만 의미가 있습니다.
+
+    Returns:
+        List[str]: 허용 범위를 넘게 느려진 단계 목록
+    """
+    if baseline.get('corpus') != report['corpus']:
+        logger.warning("⚠️ 기준값과 코퍼스 크기가 다름 - 비교 결과는 참고용")
+    relative = 'reference_ms' in baseline
+    if not relative:
+        logger.warning("⚠️ 기준값에 기준 작업 시간이 없음 - 절대 시간 비교 (--update-baseline으로 갱신)")
+
+    regressions = []
+    for name, entry in report['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        key = 'relative' if relative else 'per_doc_ms'
+        if not base or not base.get(key):
+            print(f"  {name:32s} {entry['per_doc_ms']:10.3f} ms/doc   (기준값 없음)")
+            continue
+        ratio = entry[key] / base[key]
+        mark = '❌' if ratio > 1 + tolerance else ('✅' if ratio < 1 - tolerance else '  ')
+        print(f"{mark}{name:32s} {entry['per_doc_ms']:10.3f} ms/doc   "
+              f"기준 {base['per_doc_ms']:10.3f}   x{ratio:.2f} (기준 작업 대비)" if relative else
+              f"{mark}{name:32s} {entry['per_doc_ms']:10.3f} ms/doc   "
+              f"기준 {base['per_doc_ms']:10.3f}   x{ratio:.2f}")
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def print_report(report: Dict):
+    """측정 결과 출력"""
+    corpus = report['corpus']
+    print(f"\n📚 코퍼스: {corpus['documents']}개 문서, {corpus['pages']}페이지")
+    print(f"📏 기준 작업: {report['reference_ms']:.1f} ms")
+    for name, entry in report['stages'].items():
+        throughput = (f"{entry['pages_per_sec']:8.1f} pages/s" if 'pages_per_sec' in entry
+                      else f"{entry['docs_per_sec']:8.1f} docs/s")
+        print(f"  {name:32s} {entry['seconds']:8.3f} s   {throughput}")
+    print(f"💾 최대 RSS: {report['peak_rss_mb']} MB")
+    if not report['fields_found']:
+        print("⚠️ PDF 텍스트에서 추출된 필드 없음 - 코퍼스 또는 추출기 확인 필요")
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description="PDF 데이터 추출 성능 벤치마크")
+    parser.add_argument('--docs', type=int, default=8, help="코퍼스 문서 수")
+    parser.add_argument('--pages', type=int, default=12, help="문서당 본문 페이지 수")
+    parser.add_argument('--repeat', type=int, default=3, help="텍스트/표 파서 반복 횟수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--corpus-dir', type=Path, help="코퍼스 위치 (기본: 임시 디렉토리)")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument('--update-baseline', action='store_true', help="측정 결과를 기준값으로 저장")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print("=" * 80)
+    print("⏱️ PDF 데이터 추출 벤치마크")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus_dir or Path(tmp)
+        corpus = generate_corpus(corpus_dir, args.docs, args.pages, args.seed)
+        report = run_benchmark(corpus, repeat=args.repeat)
+
+    print_report(report)
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+        print(f"\n💾 기준값 저장: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\n💡 기준값 없음 - --update-baseline으로 생성: {args.baseline}")
+        return 0
+
+    print(f"\n📊 기준값 비교 (허용 {args.tolerance:.0%})")
+    regressions = compare_with_baseline(report, json.loads(args.baseline.read_text()),
+                                        args.tolerance)
+    if regressions:
+        print(f"\n❌ 성능 저하: {', '.join(regressions)}")
+        return 1
+
+    print("\n✅ 성능 저하 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
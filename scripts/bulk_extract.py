@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+로컬 PDF 일괄 추출 (오프라인)
+이미 내려받은 PDF 디렉토리(pdf/downloaded/** 등)를 프로세스 풀로 나누어 처리하고
+결과를 한 행씩 CSV에 바로 기록 (PDF별 처리 결과는 <출력>.status.jsonl)
+다운로드/Selenium/CrossRef를 사용하지 않으므로 네트워크 없이 전체 코어로 재처리 가능
+
+사용 예:
+    python scripts/bulk_extract.py                              # pdf/downloaded/** 전체
+    python scripts/bulk_extract.py pdf/supplementary -w 8       # 다른 디렉토리, 8개 프로세스
+    python scripts/bulk_extract.py -o data/bulk.csv --resume    # 중단된 작업 이어서
+"""
+
+import sys
+import csv
+import json
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.pdf_data_extractor import PDFDataExtractor, TEMPLATE_PATH, filename_to_doi
+from src.page_filter import DEFAULT_BOILERPLATE_PATH, PageFilter
+from src.stage_timer import aggregate_timings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PDF_DIR = project_root / "pdf" / "downloaded"
+EXTRA_COLUMNS = ['pdf_file']
+
+# 워커 프로세스마다 하나씩 만드는 추출기 (Selenium 없음)
+_extractor: Optional[PDFDataExtractor] = None
+
+
+def find_pdfs(roots: Iterable[Path]) -> List[Path]:
+    """디렉토리(하위 포함)의 PDF 목록 (경로 순 정렬, 중복 제거)"""
+    found = set()
+    for root in roots:
+        root = Path(root)
+        if root.is_file():
+            found.add(root.resolve())
+        else:
+            found.update(path.resolve() for path in root.rglob("*.pdf"))
+    return sorted(found)
+
+
+def output_columns() -> List[str]:
+    """출력 CSV 열 (템플릿 열 + PDF 경로)"""
+    try:
+        with open(TEMPLATE_PATH, newline='', encoding='utf-8') as f:
+            columns = next(csv.reader(f), [])
+    except OSError:
+        columns = ['paper_id', 'doi', 'notes']
+    return [column.strip() for column in columns] + EXTRA_COLUMNS
+
+
+def status_path(output_path: Path) -> Path:
+    """PDF별 처리 결과(성공/데이터 없음/실패)를 기록하는 사이드카 경로"""
+    return output_path.with_suffix('.status.jsonl')
+
+
+def processed_files(output_path: Path) -> Set[str]:
+    """
+    이미 처리된 PDF 경로 (--resume용)
+    출력 CSV에 행이 있는 PDF와 상태 사이드카에 기록된 PDF(데이터 없음/실패 포함)
+    """
+    done = set()
+    if output_path.exists():
+        with open(output_path, newline='', encoding='utf-8') as f:
+            done.update(row['pdf_file'] for row in csv.DictReader(f) if row.get('pdf_file'))
+
+    sidecar = status_path(output_path)
+    if sidecar.exists():
+        with open(sidecar, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    done.add(json.loads(line)['pdf_file'])
+                except (ValueError, KeyError):
+                    continue  # 중단으로 잘린 마지막 줄
+    return done
+
+
+def _init_worker(options: Dict):
+    """워커 프로세스 초기화 (추출기 생성)"""
+    global _extractor
+    logging.basicConfig(level=options['log_level'],
+                        format='%(asctime)s - [Worker-%(process)d] - %(levelname)s - %(message)s')
+    _extractor = PDFDataExtractor(options['pdf_dir'], use_selenium=False,
+                                  use_cache=options['use_cache'],
+                                  low_memory=options['low_memory'],
+                                  text_backend=options['text_backend'],
+                                  skip_pages=options['skip_pages'])
+
+
+def _extract_file(pdf_path: Path, paper_id: str, fetch_metadata: bool) -> Dict:
+    """
+    워커에서 PDF 하나 처리
+
+    Returns:
+        Dict: {'pdf_file', 'status', 'data', 'timings'} (예외도 결과로 반환)
+    """
+    doi = filename_to_doi(pdf_path) or ''
+    try:
+        data = _extractor.extract_local_pdf(pdf_path, doi, paper_id, fetch_metadata=fetch_metadata)
+        status = 'success' if data else 'no_data'
+        error = None
+    except Exception as e:
+        data, status, error = None, 'error', str(e)
+
+    return {
+        'pdf_file': str(pdf_path),
+        'status': status,
+        'data': data,
+        'error': error,
+        'timings': _extractor.last_timings,
+    }
+
+
+def run_bulk(pdfs: List[Path], output_path: Path, workers: int,
+             fetch_metadata: bool = False, use_cache: bool = True,
+             low_memory: bool = False, text_backend: Optional[str] = None,
+             skip_pages: bool = True, log_level: int = logging.WARNING) -> Dict:
+    """
+    PDF 목록을 프로세스 풀로 처리하면서 결과 행을 output_path에 바로 추가
+
+    Returns:
+        Dict: 상태별 개수
+    """
+    columns = output_columns()
+    write_header = not output_path.exists() or output_path.stat().st_size == 0
+    timings_path = output_path.with_suffix('.timings.jsonl')
+    options = {
+        'pdf_dir': DEFAULT_PDF_DIR,
+        'use_cache': use_cache,
+        'low_memory': low_memory,
+        'text_backend': text_backend,
+        'skip_pages': skip_pages,
+        'log_level': log_level,
+    }
+
+    counts = {'success': 0, 'no_data': 0, 'error': 0}
+    timings = []
+    start_time = time.time()
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'a', newline='', encoding='utf-8') as out, \
+            open(timings_path, 'a', encoding='utf-8') as timing_out, \
+            open(status_path(output_path), 'a', encoding='utf-8') as status_out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(options,)) as executor:
+        writer = csv.DictWriter(out, fieldnames=columns, extrasaction='ignore')
+        if write_header:
+            writer.writeheader()
+
+        futures = [executor.submit(_extract_file, pdf_path, f"B{i:05d}", fetch_metadata)
+                   for i, pdf_path in enumerate(pdfs, 1)]
+
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            counts[result['status']] += 1
+
+            if result['data']:
+                writer.writerow({**result['data'], 'pdf_file': result['pdf_file']})
+                out.flush()
+            elif result['status'] == 'error':
+                logger.error(f"❌ {Path(result['pdf_file']).name}: {result['error']}")
+
+            # 데이터 행이 없는 결과도 남겨 --resume 시 다시 처리하지 않음
+            status_out.write(json.dumps({'pdf_file': result['pdf_file'],
+                                         'status': result['status'],
+                                         'error': result['error']}, ensure_ascii=False) + '\n')
+            status_out.flush()
+
+            if result['timings']:
+                timings.append(result['timings'])
+                timing_out.write(json.dumps({'pdf_file': result['pdf_file'],
+                                             'status': result['status'],
+                                             **result['timings']}, ensure_ascii=False) + '\n')
+
+            elapsed = time.time() - start_time
+            print(f"\r📊 진행: {done}/{len(pdfs)} "
+                  f"(성공: {counts['success']}, 데이터없음: {counts['no_data']}, "
+                  f"실패: {counts['error']}) | {done / elapsed:.2f}개/초", end='')
+
+    print()
+    summary = aggregate_timings(timings)
+    if summary['documents']:
+        print(f"📄 파싱 페이지: {summary.get('pages_parsed', 0)}, "
+              f"💾 문서당 최대 메모리: {summary.get('peak_rss_mb', 0):.0f} MB")
+    return counts
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description="로컬 PDF 일괄 데이터 추출 (오프라인)")
+    parser.add_argument('paths', nargs='*', type=Path, default=[DEFAULT_PDF_DIR],
+                        help="PDF 파일 또는 디렉토리 (하위 디렉토리 포함, 기본: pdf/downloaded)")
+    parser.add_argument('-o', '--output', type=Path,
+                        default=project_root / "data" /
+                        f"bulk_extracted_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--resume', action='store_true', help="이미 처리된 PDF 건너뛰기 "
+                        "(출력 CSV 행 + <출력>.status.jsonl의 데이터 없음/실패 기록)")
+    parser.add_argument('--metadata', action='store_true', help="CrossRef 메타데이터 조회 (네트워크 사용)")
+    parser.add_argument('--no-cache', action='store_true', help="파싱 캐시 사용 안 함")
+    parser.add_argument('--low-memory', action='store_true', help="저메모리 페이지 처리")
+    parser.add_argument('--text-backend', help="텍스트 엔진 (pdfplumber, pdfium, pymupdf, auto / "
+                        "기본: 환경 변수 PDF_TEXT_BACKEND)")
+    parser.add_argument('--no-skip-pages', action='store_true',
+                        help="이미지 전용/상투 페이지도 분석 (페이지 필터 사용 안 함)")
+    parser.add_argument('--reset-boilerplate', action='store_true',
+                        help="학습한 상투 페이지 지문을 지우고 다시 학습")
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+
+    print("=" * 80)
+    print("📚 로컬 PDF 일괄 추출 (오프라인)")
+    print("=" * 80)
+
+    if args.reset_boilerplate:
+        PageFilter(DEFAULT_BOILERPLATE_PATH).reset()
+        print(f"🗑️  상투 페이지 학습 초기화: {DEFAULT_BOILERPLATE_PATH}")
+
+    pdfs = find_pdfs(args.paths)
+    if args.resume:
+        done = processed_files(args.output)
+        pdfs = [path for path in pdfs if str(path) not in done]
+        print(f"⏭️  이미 처리된 PDF {len(done)}개 건너뜀")
+
+    if not pdfs:
+        print("❌ 처리할 PDF가 없습니다.")
+        return
+
+    print(f"📄 PDF: {len(pdfs)}개")
+    print(f"👷 프로세스: {args.workers}개")
+    print(f"💾 출력: {args.output}")
+    print("=" * 80)
+
+    start_time = time.time()
+    counts = run_bulk(pdfs, args.output, args.workers,
+                      fetch_metadata=args.metadata, use_cache=not args.no_cache,
+                      low_memory=args.low_memory, text_backend=args.text_backend,
+                      skip_pages=not args.no_skip_pages,
+                      log_level=logging.INFO if args.verbose else logging.WARNING)
+
+    print("=" * 80)
+    print("✅ 일괄 추출 완료!")
+    print(f"   ✅ 성공: {counts['success']}개")
+    print(f"   ⚠️ 데이터 없음: {counts['no_data']}개")
+    print(f"   ❌ 실패: {counts['error']}개")
+    print(f"⏱️  소요 시간: {(time.time() - start_time) / 60:.1f}분")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+근접 결합 어순 동등성 검사
+합성 조건의 양/부피 필드가 값-키워드 어순("0.188 mmol PbCl2")과
+키워드-값 어순("PbCl2 (0.188 mmol)")에서 같은 값으로 추출되는지 비교
+(같은 문장 안에 다른 전구체/용매의 값을 방해 값으로 둠)
+
+사용 예:
+    python scripts/check_proximity_parity.py
+"""
+
+import sys
+import logging
+from pathlib import Path
+from typing import List, Tuple
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.pdf_data_extractor import PDFDataExtractor
+
+# (필드, 기대 값, 문장) - 필드마다 두 어순을 모두 포함
+PHRASINGS: Tuple[Tuple[str, float, str], ...] = (
+    ('Pb_amount_mmol', 0.188, "0.188 mmol PbCl2 and 0.5 mmol Cs2CO3 were mixed."),
+    ('Pb_amount_mmol', 0.2, "0.2 mmol of PbCl2, 0.1 mmol of CsOAc were loaded."),
+    ('Pb_amount_mmol', 0.188, "PbCl2 (0.188 mmol) and Cs2CO3 (0.5 mmol) were mixed."),
+    ('Pb_amount_mmol', 0.2, "0.5 mmol Cs2CO3, PbCl2 0.2 mmol were loaded."),
+    ('OA_volume_ml', 1.0, "1 mL OA, 0.5 mL OLA and 10 mL ODE were added."),
+    ('OA_volume_ml', 1.0, "OA (1 mL), OLA (0.5 mL) and ODE (10 mL) were added."),
+    ('OLA_volume_ml', 0.5, "0.5 mL of oleylamine and 1 mL of oleic acid were added."),
+    ('OLA_volume_ml', 0.5, "oleylamine 0.5 mL, oleic acid 1 mL were added."),
+    ('ODE_volume_ml', 10.0, "10 mL of ODE, 1 mL of OA were loaded."),
+    ('ODE_volume_ml', 10.0, "ODE (10 mL), OA (1 mL) were loaded."),
+)
+
+
+def check_phrasings(extractor: PDFDataExtractor) -> List[Tuple[str, str, float, object]]:
+    """
+    문장마다 합성 조건을 추출하여 기대 값과 비교
+
+    Returns:
+        List: 불일치 (필드, 문장, 기대 값, 추출 값)
+    """
+    mismatches = []
+    for field, expected, sentence in PHRASINGS:
+        text = f"Experimental Section\n{sentence}"
+        actual = extractor.extract_synthesis_conditions(text).get(field)
+        if actual is None or float(actual) != expected:
+            mismatches.append((field, sentence, expected, actual))
+    return mismatches
+
+
+def main():
+    """메인 실행"""
+    logging.basicConfig(level=logging.WARNING)
+
+    print("=" * 80)
+    print("🔍 근접 결합 어순 동등성 검사 (값-키워드 / 키워드-값)")
+    print("=" * 80)
+
+    extractor = PDFDataExtractor(project_root, use_selenium=False, use_cache=False)
+    mismatches = check_phrasings(extractor)
+
+    mark = '✅' if not mismatches else '❌'
+    print(f"{mark} 문장 {len(PHRASINGS)}개, 불일치 {len(mismatches)}개")
+    for field, sentence, expected, actual in mismatches:
+        print(f"      {field} = {actual!r} (기대 {expected!r}): {sentence}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
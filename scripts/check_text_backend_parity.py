@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+텍스트 추출 엔진 동등성 검사
+같은 PDF를 pdfplumber와 다른 엔진(pdfium, pymupdf)으로 추출한 뒤
+정규식 필드(합성 조건 + QD 특성)가 같게 나오는지 비교
+
+사용 예:
+    python scripts/check_text_backend_parity.py pdf/downloaded          # 설치된 모든 엔진
+    python scripts/check_text_backend_parity.py pdf/references -b pdfium
+    python scripts/check_text_backend_parity.py                         # 벤치마크 코퍼스 생성 후 비교
+"""
+
+import sys
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.pdf_data_extractor import PDFDataExtractor
+from scripts.bulk_extract import find_pdfs
+from scripts.benchmark_extraction import generate_corpus
+from src.pdf_pages import walk_pages, join_page_text
+from src.text_backends import PDFPLUMBER, available_backends
+
+logger = logging.getLogger(__name__)
+
+
+def text_fields(extractor: PDFDataExtractor, text: str) -> Dict:
+    """텍스트에서 정규식으로 추출한 필드 (합성 조건 + QD 특성)"""
+    budget = extractor.new_regex_budget()
+    return {**extractor.extract_synthesis_conditions(text, budget),
+            **extractor.extract_qd_properties(text, budget)}
+
+
+def compare_backends(pdfs: List[Path], backends: List[str]) -> Dict:
+    """
+    PDF마다 엔진별 필드를 pdfplumber 결과와 비교
+
+    Returns:
+        Dict: {엔진: {'seconds', 'mismatches': [(파일, 필드, pdfplumber 값, 엔진 값)]}}
+    """
+    extractor = PDFDataExtractor(pdfs[0].parent, use_selenium=False, use_cache=False)
+    report = {name: {'seconds': 0.0, 'mismatches': []} for name in [PDFPLUMBER] + backends}
+
+    for pdf_path in pdfs:
+        fields = {}
+        for name in report:
+            start = time.perf_counter()
+            try:
+                pages = walk_pages(pdf_path, want_tables=False, text_backend=name)
+            except Exception as e:
+                logger.warning(f"⚠️ {pdf_path.name} ({name}) 텍스트 추출 실패: {e}")
+                pages = []
+            report[name]['seconds'] += time.perf_counter() - start
+            fields[name] = text_fields(extractor, join_page_text(pages))
+
+        reference = fields[PDFPLUMBER]
+        for name in backends:
+            for field in sorted(set(reference) | set(fields[name])):
+                if reference.get(field) != fields[name].get(field):
+                    report[name]['mismatches'].append(
+                        (pdf_path.name, field, reference.get(field), fields[name].get(field)))
+
+    return report
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description="텍스트 추출 엔진 필드 동등성 검사")
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help="PDF 파일 또는 디렉토리 (없으면 벤치마크 코퍼스 생성)")
+    parser.add_argument('-b', '--backend', action='append',
+                        help="비교할 엔진 (여러 번 지정 가능, 기본: 설치된 모든 엔진)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    backends = args.backend or [name for name in available_backends() if name != PDFPLUMBER]
+    backends = [name for name in backends if name != PDFPLUMBER]
+    if not backends:
+        print("❌ 비교할 엔진이 없습니다 (pypdfium2 또는 PyMuPDF 설치 필요)")
+        return 1
+
+    print("=" * 80)
+    print(f"🔍 텍스트 엔진 동등성 검사: {PDFPLUMBER} vs {', '.join(backends)}")
+    print("=" * 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.paths:
+            pdfs = find_pdfs(args.paths)
+        else:
+            pdfs = generate_corpus(Path(tmp))['pdfs']
+        if not pdfs:
+            print("❌ PDF가 없습니다.")
+            return 1
+        report = compare_backends(pdfs, backends)
+
+    print(f"📄 PDF: {len(pdfs)}개")
+    print(f"   {PDFPLUMBER:12s} {report[PDFPLUMBER]['seconds']:8.2f}초")
+    failed = False
+    for name in backends:
+        mismatches = report[name]['mismatches']
+        speedup = report[PDFPLUMBER]['seconds'] / max(report[name]['seconds'], 1e-9)
+        mark = '✅' if not mismatches else '❌'
+        print(f"{mark} {name:12s} {report[name]['seconds']:8.2f}초 (x{speedup:.1f}), "
+              f"필드 불일치 {len(mismatches)}개")
+        for file_name, field, expected, actual in mismatches[:20]:
+            print(f"      {file_name}: {field} = {expected!r} (pdfplumber) / {actual!r} ({name})")
+        failed = failed or bool(mismatches)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
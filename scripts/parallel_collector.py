@@ -20,6 +20,10 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from scripts.pdf_data_extractor import PDFDataExtractor
+from src.stage_timer import aggregate_timings
+from src.pdf_cache import DEFAULT_CACHE_DIR
+from src.crossref_cache import CrossRefCache, DEFAULT_DB_NAME
+from src.http_client import get_client
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,15 +36,33 @@ logger = logging.getLogger(__name__)
 class ParallelCollector:
     """병렬 데이터 수집기"""
     
-    def __init__(self, num_workers: int = 4):
+    def __init__(self, num_workers: int = 4, page_workers: int = 1):
+        """
+        Args:
+            num_workers: DOI 처리 워커 수
+            page_workers: 워커당 큰 PDF 페이지 병렬 파싱 프로세스 수
+                          (기본 1 - 워커 프로세스가 이미 코어를 나누어 쓰므로 중첩 풀을 만들지 않음,
+                           2 이상이면 워커마다 spawn 프로세스 풀 생성)
+        """
         self.num_workers = num_workers
+        self.page_workers = page_workers
         self.project_root = Path(__file__).parent.parent
         self.queue_file = self.project_root / "data" / "papers_queue.txt"
         self.pdf_dir = self.project_root / "pdf" / "downloaded"
         self.results_dir = self.project_root / "data"
         
-    def load_queue(self):
-        """큐에서 DOI 로드"""
+        # CrossRef 메타데이터: 큐 적재 시 일괄 선조회하여 작업과 함께 워커에 전달
+        self.metadata_cache = CrossRefCache(DEFAULT_CACHE_DIR / DEFAULT_DB_NAME)
+        self.metadata = {}
+        self._metadata_seeded = False
+        
+    def load_queue(self, prefetch: bool = True):
+        """
+        큐에서 DOI 로드
+        
+        Args:
+            prefetch: True면 DOI들의 CrossRef 메타데이터를 일괄 선조회하여 self.metadata에 보관
+        """
         if not self.queue_file.exists():
             return []
         
@@ -48,15 +70,33 @@ class ParallelCollector:
         dois = [line.strip() for line in lines 
                 if line.strip() and not line.startswith('#')]
         
+        if prefetch and dois:
+            self.prefetch_metadata(dois)
+        
         return dois
     
+    def prefetch_metadata(self, dois: list):
+        """캐시에 없는 DOI만 CrossRef works 필터 쿼리 몇 번으로 한꺼번에 조회"""
+        # 이전 배치 결과의 메타데이터로 캐시 채우기 (이미 수집한 DOI는 API 호출 생략, 최초 1회)
+        if not self._metadata_seeded:
+            seeded = self.metadata_cache.seed_from_csv(
+                sorted(self.results_dir.glob("parallel_collected_*.csv")))
+            self._metadata_seeded = True
+            if seeded:
+                logger.info(f"🗂️ 이전 배치 메타데이터: {seeded}개 DOI")
+        
+        start = time.time()
+        self.metadata.update(self.metadata_cache.prefetch(dois, get_client()))
+        found = sum(1 for doi in dois if doi in self.metadata)
+        logger.info(f"📚 메타데이터 선조회: {found}/{len(dois)}개 DOI ({time.time() - start:.1f}초)")
+    
     def worker(self, worker_id: int, task_queue: Queue, result_queue: Queue):
         """
         워커 프로세스
         
         Args:
             worker_id: 워커 ID
-            task_queue: 작업 큐 (DOI 입력)
+            task_queue: 작업 큐 ((DOI, 선조회 메타데이터 또는 None) 입력)
             result_queue: 결과 큐 (성공/실패 출력)
         """
         logger.info(f"🚀 워커 {worker_id} 시작")
@@ -67,7 +107,8 @@ class ParallelCollector:
         
         # PDF 추출기 초기화 (Selenium headless)
         try:
-            extractor = PDFDataExtractor(worker_pdf_dir, use_selenium=True)
+            extractor = PDFDataExtractor(worker_pdf_dir, use_selenium=True,
+                                         page_workers=self.page_workers)
             logger.info(f"✅ 워커 {worker_id}: PDF 추출기 초기화 완료")
         except Exception as e:
             logger.error(f"❌ 워커 {worker_id}: 초기화 실패 - {str(e)}")
@@ -78,19 +119,20 @@ class ParallelCollector:
         while True:
             try:
                 # 큐에서 DOI 가져오기 (타임아웃 5초)
-                doi = task_queue.get(timeout=5)
+                task = task_queue.get(timeout=5)
                 
-                if doi is None:  # 종료 신호
+                if task is None:  # 종료 신호
                     logger.info(f"🛑 워커 {worker_id} 종료 (처리: {processed}개)")
                     break
                 
+                doi, metadata = task
                 logger.info(f"📥 워커 {worker_id}: {doi} 처리 시작")
                 
                 # PDF 다운로드 + 데이터 추출
                 paper_id = f"W{worker_id}_P{processed+1:03d}"
                 
                 try:
-                    data = extractor.extract_all_data(doi, paper_id)
+                    data = extractor.extract_all_data(doi, paper_id, metadata)
                     
                     if data:
                         logger.info(f"✅ 워커 {worker_id}: {doi} 성공")
@@ -98,7 +140,8 @@ class ParallelCollector:
                             'worker_id': worker_id,
                             'doi': doi,
                             'status': 'success',
-                            'data': data
+                            'data': data,
+                            'timings': extractor.last_timings
                         })
                     else:
                         logger.warning(f"⚠️ 워커 {worker_id}: {doi} 데이터 없음")
@@ -106,7 +149,8 @@ class ParallelCollector:
                             'worker_id': worker_id,
                             'doi': doi,
                             'status': 'no_data',
-                            'data': None
+                            'data': None,
+                            'timings': extractor.last_timings
                         })
                     
                     processed += 1
@@ -117,7 +161,8 @@ class ParallelCollector:
                         'worker_id': worker_id,
                         'doi': doi,
                         'status': 'error',
-                        'error': str(e)
+                        'error': str(e),
+                        'timings': extractor.last_timings
                     })
                 
             except Queue.Empty:
@@ -161,7 +206,7 @@ class ParallelCollector:
         
         # DOI를 작업 큐에 추가
         for doi in dois:
-            task_queue.put(doi)
+            task_queue.put((doi, self.metadata.get(doi)))
         
         # 종료 신호 추가 (워커 수만큼)
         for _ in range(self.num_workers):
@@ -230,6 +275,7 @@ class ParallelCollector:
         # 데이터 저장
         if results['success']:
             self.save_results(results['success'])
+        self.save_timings(results)
     
     
     def auto_refill_queue(self, min_dois: int = 10):
@@ -269,7 +315,7 @@ class ParallelCollector:
                 print("\n✅ 새 DOI가 큐에 추가되었습니다!")
                 
                 # 새로 추가된 DOI 개수 확인
-                new_dois = self.load_queue()
+                new_dois = self.load_queue(prefetch=False)
                 print(f"📋 현재 큐: {len(new_dois)}개 DOI")
                 return True
             else:
@@ -373,7 +419,7 @@ class ParallelCollector:
         
         # DOI를 작업 큐에 추가
         for doi in dois:
-            task_queue.put(doi)
+            task_queue.put((doi, self.metadata.get(doi)))
         
         # 종료 신호 추가
         for _ in range(self.num_workers):
@@ -436,6 +482,7 @@ class ParallelCollector:
         # 데이터 저장
         if results['success']:
             self.save_results(results['success'])
+        self.save_timings(results)
     
     
     def remove_processed_dois(self, processed_dois: list):
@@ -482,6 +529,42 @@ class ParallelCollector:
         logger.info(f"💾 결과 저장: {output_file}")
 
 
+    def save_timings(self, results: dict):
+        """
+        문서별 단계 계측 기록을 JSONL로 저장하고 단계별 합계 출력
+        
+        Args:
+            results: 상태별 결과 목록 ({'success': [...], 'no_data': [...], 'error': [...]})
+        """
+        import json
+        
+        records = [result for status_results in results.values() for result in status_results
+                   if result.get('timings')]
+        if not records:
+            return
+        
+        output_file = self.results_dir / f"parallel_timings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for result in records:
+                f.write(json.dumps({
+                    'doi': result['doi'],
+                    'worker_id': result['worker_id'],
+                    'status': result['status'],
+                    **result['timings']
+                }, ensure_ascii=False) + '\n')
+        
+        summary = aggregate_timings(result['timings'] for result in records)
+        print(f"\n⏱️  단계별 시간 ({summary['documents']}개 문서, 합계 / 최대):")
+        for name, stage in sorted(summary['stages'].items(), key=lambda item: -item[1]['wall_s']):
+            print(f"   {name:12s} {stage['wall_s']:8.1f}초 (CPU {stage['cpu_s']:7.1f}초) / "
+                  f"{stage['max_wall_s']:6.1f}초")
+        print(f"   📥 다운로드: {summary.get('bytes_downloaded', 0) / 1e6:.1f} MB, "
+              f"📄 파싱 페이지: {summary.get('pages_parsed', 0)}, "
+              f"💾 문서당 최대 메모리: {summary.get('peak_rss_mb', 0):.0f} MB")
+        
+        logger.info(f"💾 계측 기록 저장: {output_file}")
+
+
 def show_menu():
     """대화형 메뉴 표시"""
     print("\n" + "="*80)
@@ -5,14 +5,17 @@ PDF 자동 데이터 추출 모듈
 Selenium을 통한 기관 구독 활용 지원
 """
 
+import sys
+import csv
+import itertools
 import re
-import requests
-import pdfplumber
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Set, Tuple
 import logging
 import time
 import glob
+from concurrent.futures import Future
+from contextlib import nullcontext
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -21,17 +24,174 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.pdf_pages import (PageContent, walk_pages, iter_pages, join_page_text,
+                           join_normalized_text, collect_tables, PARALLEL_MIN_PAGES)
+from src.pdf_cache import PDFParseCache, DEFAULT_CACHE_DIR
+from src.field_scanner import (DocumentScanner, scan_fields, select_fields,
+                               SYNTHESIS_FIELDS, PROPERTY_FIELDS)
+from src.section_index import SectionIndex
+from src.regex_guard import RegexBudget, DEFAULT_PATTERN_TIMEOUT, DEFAULT_DOCUMENT_TIMEOUT
+from src.table_model import (NormalizedTable, normalize_tables, SYNTHESIS_TABLE_KEYWORDS,
+                             PROPERTY_TABLE_KEYWORDS)
+from src.stage_timer import StageTimer
+from src.memory_usage import reset_peak_rss, peak_rss_mb
+from src.text_backends import resolve_backend
+from src.text_normalize import normalize_text
+from src.keyword_automaton import KeywordAutomaton
+from src.page_filter import PageFilter, document_key
+from src.http_client import get_client, DownloadTooLarge
+from src.crossref_cache import CrossRefCache, DEFAULT_DB_NAME, parse_work
+from src.oa_cache import (OACache, OAStatus, parse_unpaywall, DEFAULT_DB_NAME as OA_DB_NAME,
+                          DEFAULT_OPEN_RECHECK_DAYS, DEFAULT_CLOSED_RECHECK_DAYS)
+
 logger = logging.getLogger(__name__)
 
+# 다운로드 최대 크기 (초과 시 중단 - 수백 MB SI 파일이 워커 디스크/메모리를 잡아먹지 않도록)
+DEFAULT_MAX_PDF_MB = 200
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
+
+# 열 기반 표 파싱: (필드, 헤더 키워드, 최소, 최대, 변환)
+SYNTHESIS_TABLE_COLUMNS = [
+    ('injection_temp_C', ('temp', 'injection'), 100, 250, float),
+    ('Pb_amount_mmol', ('pbcl2', 'lead'), 0.01, 10, float),
+    ('OA_volume_ml', ('oleic', 'oa'), 0.1, 20, float),
+    ('OLA_volume_ml', ('oleylamine', 'ola'), 0.1, 20, float),
+    ('ODE_volume_ml', ('octadecene', 'ode'), 1, 50, float),
+]
+
+PROPERTY_TABLE_COLUMNS = [
+    ('size_nm', ('size', 'diameter'), 2, 50, float),
+    ('PL_peak_nm', ('pl', 'emission'), 350, 500, int),
+    ('PLQY_percent', ('plqy', 'quantum yield'), 0, 100, float),
+    ('FWHM_nm', ('fwhm', 'width'), 5, 100, float),
+]
+
+# 표 판정 + 행 항목 키워드 오토마톤 (import 시 한 번 생성, 표마다 텍스트를 한 번만 스캔)
+TABLE_KEYWORDS = KeywordAutomaton(
+    SYNTHESIS_TABLE_KEYWORDS + PROPERTY_TABLE_KEYWORDS
+    + tuple(keyword for column in SYNTHESIS_TABLE_COLUMNS + PROPERTY_TABLE_COLUMNS
+            for keyword in column[1])
+)
+
+# 스트리밍 모드 조기 종료 대상: 템플릿 열 중 이 추출기가 PDF에서 채울 수 있는 필드
+# (Cl 양, 비율/합계 열, 메타데이터 열은 PDF에서 추출하지 않으므로 처음부터 부재로 확정,
+#  Cl_source는 Pb_source에서 파생)
+TEMPLATE_PATH = project_root / "data" / "literature_data_template.csv"
+PDF_FIELDS = (
+    {spec.name for spec in SYNTHESIS_FIELDS + PROPERTY_FIELDS}
+    | {column[0] for column in SYNTHESIS_TABLE_COLUMNS + PROPERTY_TABLE_COLUMNS}
+)
+
+
+def load_stream_targets(template_path: Path = TEMPLATE_PATH) -> Set[str]:
+    """템플릿 열 중 PDF에서 추출 가능한 필드 (템플릿이 없으면 추출 가능한 필드 전체)"""
+    try:
+        with open(template_path, newline='', encoding='utf-8') as f:
+            columns = next(csv.reader(f), [])
+    except OSError:
+        return set(PDF_FIELDS)
+    return {column.strip() for column in columns} & PDF_FIELDS
+
+
+# PDF 파일명 = DOI의 '/'를 '_'로 바꾼 것 (예: 10.1038_srep45906.pdf)
+_DOI_FILENAME = re.compile(r'^(10\.\d{4,9})_(.+)$')
+
+
+def doi_to_filename(doi: str) -> str:
+    """DOI의 PDF 파일명 ('/'를 '_'로)"""
+    return f"{doi.replace('/', '_')}.pdf"
+
+
+def filename_to_doi(path: Path) -> Optional[str]:
+    """
+    PDF 파일명에서 DOI 복원 (doi_to_filename의 역변환)
+    
+    DOI 접두사(10.xxxx) 뒤 첫 '_'만 '/'로 되돌립니다. 접미사 안의 '/'는
+    '_'와 구분할 수 없으므로 그대로 '_'로 남습니다.
+    
+    Returns:
+        str 또는 None (DOI 형식 파일명이 아님)
+    """
+    match = _DOI_FILENAME.match(Path(path).stem)
+    if not match:
+        return None
+    return f"{match.group(1)}/{match.group(2)}"
+
+
 class PDFDataExtractor:
     """PDF에서 CsPbCl3 합성 데이터 추출"""
     
-    def __init__(self, pdf_dir: Path, use_selenium: bool = True):
+    def __init__(self, pdf_dir: Path, use_selenium: bool = True,
+                 use_cache: bool = True, cache_dir: Path = DEFAULT_CACHE_DIR,
+                 page_workers: int = 1, parallel_min_pages: int = PARALLEL_MIN_PAGES,
+                 regex_timeout: float = DEFAULT_PATTERN_TIMEOUT,
+                 regex_document_timeout: float = DEFAULT_DOCUMENT_TIMEOUT,
+                 table_page_gate: bool = True, streaming: bool = False,
+                 low_memory: bool = False, text_backend: Optional[str] = None,
+                 skip_pages: bool = True, boilerplate_path: Optional[Path] = None,
+                 oa_open_recheck_days: float = DEFAULT_OPEN_RECHECK_DAYS,
+                 oa_closed_recheck_days: float = DEFAULT_CLOSED_RECHECK_DAYS,
+                 max_pdf_mb: float = DEFAULT_MAX_PDF_MB,
+                 download_progress: Optional[Callable[[int, Optional[int]], None]] = None):
         self.pdf_dir = pdf_dir
         self.pdf_dir.mkdir(exist_ok=True)
         self.use_selenium = use_selenium
         self.driver = None
         
+        # 파싱 결과 캐시 (PDF SHA-256 기준, 재실행 시 pdfplumber 생략)
+        self.parse_cache = PDFParseCache(cache_dir) if use_cache else None
+        
+        # 큰 PDF(parallel_min_pages 이상)는 페이지를 page_workers개 프로세스로 나누어 파싱
+        self.page_workers = page_workers
+        self.parallel_min_pages = parallel_min_pages
+        
+        # 표 키워드(cspbcl3, pbcl2, plqy, fwhm 등)가 있는 페이지만 표 탐지
+        self.table_page_gate = table_page_gate
+        
+        # 저메모리 모드: 페이지마다 pdfminer 객체 캐시까지 비움 (수백 페이지 SI 문서용)
+        # (페이지 레이아웃 캐시는 모드와 관계없이 페이지 처리 직후 해제)
+        self.low_memory = low_memory
+        
+        # 텍스트 추출 엔진 (None이면 환경 변수 PDF_TEXT_BACKEND, 없으면 pdfplumber / 표는 항상 pdfplumber)
+        self.text_backend = resolve_backend(text_backend)
+        
+        # 이미지 전용/상투(표지, 라이선스) 페이지는 레이아웃 분석 없이 건너뜀
+        # (상투 페이지 지문은 처리한 문서에서 학습하여 boilerplate_path에 저장 - 지정하지 않으면
+        #  캐시 사용 시 캐시 디렉토리, 캐시를 쓰지 않으면 이번 실행 안에서만 학습하고 저장하지 않음)
+        if boilerplate_path is None and use_cache:
+            boilerplate_path = Path(cache_dir) / "boilerplate_pages.json"
+        self.page_filter = PageFilter(boilerplate_path) if skip_pages else None
+        
+        # 스트리밍 모드: 앞 페이지부터 읽다가 대상 필드가 모두 채워지면 파싱 중단
+        self.streaming = streaming
+        self.stream_targets = load_stream_targets()
+        
+        # CrossRef 메타데이터 캐시 (재실행/이미 수집한 DOI는 API 호출 없이 조회)
+        self.metadata_cache = CrossRefCache(Path(cache_dir) / DEFAULT_DB_NAME) if use_cache else None
+        
+        # Unpaywall OA 상태 캐시 (OA PDF URL은 바로 사용, OA PDF 없는 DOI는 재확인 주기까지 조회 생략)
+        self.oa_cache = (OACache(Path(cache_dir) / OA_DB_NAME, oa_open_recheck_days,
+                                 oa_closed_recheck_days) if use_cache else None)
+        
+        # 공유 HTTP 클라이언트 (호스트별 연결 재사용, 메타데이터 조회를 다운로드/파싱과 동시 진행)
+        self.http = get_client()
+        
+        # PDF 다운로드: 조각 단위로 임시 파일에 저장 (최대 크기 초과 시 중단, 진행 콜백(받은 바이트, 전체))
+        self.max_pdf_bytes = int(max_pdf_mb * 1024 * 1024)
+        self.download_progress = download_progress
+        
+        # 정규식 시간 예산 (패턴당 / 문서당, 초)
+        self.regex_timeout = regex_timeout
+        self.regex_document_timeout = regex_document_timeout
+        
+        # 단계별 계측 (extract_all_data 실행 중에만 timer 존재, 끝나면 last_timings에 기록)
+        self.timer: Optional[StageTimer] = None
+        self.last_timings: Optional[Dict] = None
+        
         if use_selenium:
             self._init_selenium()
     
@@ -88,6 +248,15 @@ class PDFDataExtractor:
             except:
                 pass
     
+    def _stage(self, name: str):
+        """진행 중인 문서의 name 단계 시간 계측 (계측 중이 아니면 아무것도 하지 않음)"""
+        return self.timer.stage(name) if self.timer else nullcontext()
+    
+    def _count(self, name: str, amount: int):
+        """진행 중인 문서의 카운터 증가"""
+        if self.timer:
+            self.timer.count(name, amount)
+    
     def _download_with_selenium(self, doi: str, pdf_path: Path) -> bool:
         """Selenium을 통한 PDF 다운로드 (기관 구독 활용)"""
         if not self.driver:
@@ -237,93 +406,260 @@ class PDFDataExtractor:
         """PDF 다운로드 (여러 소스 시도)"""
         
         # 1. 이미 다운로드된 PDF 확인
-        pdf_path = self.pdf_dir / f"{doi.replace('/', '_')}.pdf"
+        pdf_path = self.pdf_dir / doi_to_filename(doi)
         if pdf_path.exists():
             logger.info(f"✅ 기존 PDF 사용: {pdf_path.name}")
             return pdf_path
         
-        # 2. Selenium을 통한 다운로드 시도 (기관 구독 활용) ⭐ 신규!
+        # 2. 캐시에 OA PDF URL이 있으면 바로 다운로드 (Selenium/Unpaywall 조회 생략)
+        oa = self.oa_cache.get(doi) if self.oa_cache is not None else None
+        requeried = False
+        if oa is not None and oa.pdf_url:
+            logger.info(f"📥 OA PDF 다운로드 중 (캐시): {oa.pdf_url}")
+            if self._download_oa_pdf(oa.pdf_url, pdf_path):
+                return pdf_path
+            
+            # 캐시된 URL이 죽었으면 항목을 지우고 Selenium보다 먼저 Unpaywall을 한 번 다시 조회
+            logger.info(f"♻️  캐시된 OA URL 실패, Unpaywall 재조회: {doi}")
+            self.oa_cache.invalidate(doi)
+            dead_url = oa.pdf_url
+            oa = self._unpaywall_status(doi)
+            requeried = True
+            if oa is not None and oa.pdf_url and oa.pdf_url != dead_url:
+                logger.info(f"📥 OA PDF 다운로드 중 (새 URL): {oa.pdf_url}")
+                if self._download_oa_pdf(oa.pdf_url, pdf_path):
+                    return pdf_path
+        
+        # 3. Selenium을 통한 다운로드 시도 (기관 구독 활용) ⭐ 신규!
         if self.use_selenium:
             logger.info(f"🔍 Selenium으로 PDF 다운로드 시도: {doi}")
-            if self._download_with_selenium(doi, pdf_path):
+            with self._stage('selenium'):
+                downloaded = self._download_with_selenium(doi, pdf_path)
+            if downloaded:
+                self._count('bytes_downloaded', pdf_path.stat().st_size)
                 return pdf_path
         
-        # 3. Unpaywall API 시도
+        # 4. Unpaywall API 시도 (OA 상태를 모르고 2단계에서 재조회하지 않았을 때만)
+        if oa is None and not requeried:
+            oa = self._unpaywall_status(doi)
+            if oa is not None and oa.pdf_url:
+                logger.info(f"📥 PDF 다운로드 중: {oa.pdf_url}")
+                if self._download_oa_pdf(oa.pdf_url, pdf_path):
+                    return pdf_path
+        elif oa is not None and not oa.pdf_url and not requeried:
+            logger.info(f"🔒 OA PDF 없음 (캐시), Unpaywall 생략: {doi}")
+        
+        # 5. DOI.org 직접 접근 시도
+        try:
+            logger.info(f"🔗 DOI.org 접근 시도: {doi}")
+            doi_url = f"https://doi.org/{doi}"
+            # PDF 응답일 때만 본문을 받음 (HTML 랜딩 페이지는 읽지 않음)
+            if self._download_to(doi_url, pdf_path, timeout=10, content_type='application/pdf',
+                                 headers={'User-Agent': BROWSER_USER_AGENT,
+                                          'Accept': 'application/pdf'}):
+                logger.info(f"✅ DOI.org에서 PDF 저장: {pdf_path.name}")
+                return pdf_path
+        
+        except Exception as e:
+            logger.debug(f"DOI.org 접근 실패: {e}")
+        
+        logger.warning(f"⚠️  PDF 다운로드 실패 (모든 소스): {doi}")
+        return None
+    
+    def _unpaywall_status(self, doi: str) -> Optional[OAStatus]:
+        """
+        Unpaywall에서 OA 상태 조회 후 캐시에 저장
+        
+        Returns:
+            OAStatus (Unpaywall에 없는 DOI는 OA 아님으로 기록), 일시적 오류면 None (캐시 안 함)
+        """
         email = "research@example.com"
         url = f"https://api.unpaywall.org/v2/{doi}?email={email}"
         
         try:
             logger.info(f"🔍 Unpaywall PDF 검색 중: {doi}")
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                
-                # 오픈액세스 PDF URL 찾기
-                pdf_url = None
-                if data.get('is_oa'):
-                    best_oa = data.get('best_oa_location', {})
-                    pdf_url = best_oa.get('url_for_pdf')
-                
-                if pdf_url:
-                    logger.info(f"📥 PDF 다운로드 중: {pdf_url}")
-                    pdf_response = requests.get(pdf_url, timeout=30, headers={
-                        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)'
-                    })
-                    
-                    if pdf_response.status_code == 200:
-                        pdf_path.write_bytes(pdf_response.content)
-                        logger.info(f"✅ PDF 저장: {pdf_path.name}")
-                        return pdf_path
-        
+                status = parse_unpaywall(response.json())
+            elif response.status_code == 404:
+                status = OAStatus(False, None, time.time())
+            else:
+                logger.debug(f"Unpaywall 실패: HTTP {response.status_code}")
+                return None
         except Exception as e:
             logger.debug(f"Unpaywall 실패: {e}")
+            return None
         
-        # 4. DOI.org 직접 접근 시도
+        if self.oa_cache is not None:
+            self.oa_cache.put(doi, status)
+        return status
+    
+    def _download_oa_pdf(self, pdf_url: str, pdf_path: Path) -> bool:
+        """OA PDF URL에서 다운로드"""
         try:
-            logger.info(f"🔗 DOI.org 접근 시도: {doi}")
-            doi_url = f"https://doi.org/{doi}"
-            response = requests.get(doi_url, timeout=10, allow_redirects=True, headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)',
-                'Accept': 'application/pdf'
-            })
-            
-            # PDF인지 확인
-            if 'application/pdf' in response.headers.get('Content-Type', ''):
-                pdf_path.write_bytes(response.content)
-                logger.info(f"✅ DOI.org에서 PDF 저장: {pdf_path.name}")
-                return pdf_path
-        
+            if self._download_to(pdf_url, pdf_path, timeout=30,
+                                 headers={'User-Agent': BROWSER_USER_AGENT}):
+                logger.info(f"✅ PDF 저장: {pdf_path.name}")
+                return True
         except Exception as e:
-            logger.debug(f"DOI.org 접근 실패: {e}")
+            logger.debug(f"OA PDF 다운로드 실패: {e}")
+        return False
+    
+    def _download_to(self, url: str, pdf_path: Path, **kwargs) -> bool:
+        """
+        스트리밍 다운로드 (임시 파일에 조각 단위로 쓰고 완료 시 pdf_path로 이름 변경)
         
-        logger.warning(f"⚠️  PDF 다운로드 실패 (모든 소스): {doi}")
-        return None
+        이전에 끊긴 임시 파일이 있으면 이어받고, 최대 크기를 넘으면 중단합니다.
+        """
+        try:
+            received = self.http.download(url, pdf_path, max_bytes=self.max_pdf_bytes,
+                                          progress=self.download_progress, **kwargs)
+        except DownloadTooLarge as e:
+            logger.warning(f"⚠️  PDF 크기 제한({self.max_pdf_bytes // (1024 * 1024)} MB) 초과, 중단: {e}")
+            return False
+        if received is None:
+            return False
+        self._count('bytes_downloaded', received)
+        return True
+    
+    def extract_pages(self, pdf_path: Path, want_text: bool = True,
+                      want_tables: bool = True) -> List[PageContent]:
+        """PDF 페이지 순회 (페이지당 한 번 파싱으로 텍스트 + 표 동시 추출)"""
+        pages = walk_pages(pdf_path, want_text=want_text, want_tables=want_tables,
+                           cache=self.parse_cache, workers=self.page_workers,
+                           parallel_min_pages=self.parallel_min_pages,
+                           table_gate=self.table_page_gate, low_memory=self.low_memory,
+                           text_backend=self.text_backend, page_filter=self.page_filter)
+        self._observe_pages(pdf_path, pages)
+        return pages
+    
+    def _observe_pages(self, pdf_path: Path, pages: List[PageContent]):
+        """
+        새로 파싱한 페이지 지문을 상투 페이지 학습에 반영 (캐시에서 읽은 페이지는 지문 없음)
+        
+        문서는 본문의 DOI(없으면 제목 줄)로 세므로 같은 논문의 다른 사본/SI 파일은 한 번만 셉니다.
+        """
+        if self.page_filter is None or not any(page.fingerprint for page in pages):
+            return
+        doc_id = document_key((page.text for page in pages), PDFParseCache.file_digest(pdf_path))
+        self.page_filter.observe(doc_id, [page.fingerprint for page in pages])
+    
+    def extract_pages_streaming(self, pdf_path: Path) -> Tuple[List[PageContent], Optional[tuple]]:
+        """
+        페이지를 앞에서부터 파싱하면서 필드를 점진적으로 추출하고, 다음 중 하나면 나머지
+        페이지는 파싱하지 않음
+        - 대상 필드(stream_targets)가 모두 채워짐
+        - Experimental 섹션을 읽은 뒤 References 제목이 나옴 (이후 페이지의 필드는 부재로 확정)
+        
+        텍스트 필드는 누적 텍스트 길이가 직전 스캔의 2배가 될 때마다 다시 스캔하므로
+        (섹션 색인이 문서 전체 기준) 전체 스캔 비용은 페이지 수에 선형입니다.
+        마지막 스캔 결과(읽은 전체 텍스트 기준)를 그대로 반환하여 다시 추출하지 않습니다.
+        
+        캐시에 전체 결과가 있으면 캐시를 사용합니다. 읽은 페이지는 캐시에 저장하고(중간에
+        멈췄으면 일부 페이지 항목), 재실행 시 저장된 앞쪽 페이지를 다시 파싱하지 않고 이어서
+        판정합니다 (그 뒤 페이지가 더 필요할 때만 파싱).
+        
+        Returns:
+            (페이지 목록, (텍스트 합성 조건, 텍스트 QD 특성, 정규식 예산) 또는 None(캐시 사용 - 추출 안 함))
+        """
+        digest = None
+        cached = []     # 이전 스트리밍이 저장한 앞쪽 페이지
+        if self.parse_cache is not None:
+            digest = self.parse_cache.file_digest(pdf_path)
+            options = dict(table_gate=self.table_page_gate, text_backend=self.text_backend,
+                           page_filter=self.page_filter is not None)
+            complete = self.parse_cache.get(digest, **options)
+            if complete is not None:
+                return complete, None
+            cached = self.parse_cache.get(digest, allow_partial=True, **options) or []
+        
+        pages = []
+        filled = set()
+        seen_sections = set()
+        text_length = 0     # 누적 정규화 텍스트 길이
+        scanned_length = 0  # 마지막 텍스트 스캔 시점의 길이
+        text_fields = ({}, {}, self.new_regex_budget())
+        stopped = False     # 마지막 페이지 전에 멈춤 (캐시 저장 안 함)
+        stream = iter_pages(pdf_path, table_gate=self.table_page_gate,
+                            low_memory=self.low_memory, text_backend=self.text_backend,
+                            start=len(cached), page_filter=self.page_filter)
+        try:
+            for page in itertools.chain(cached, stream):
+                pages.append(page)
+                
+                # 표는 새 페이지 것만
+                if page.tables:
+                    tables = normalize_tables(page.tables)
+                    filled.update(self.parse_synthesis_from_table(tables))
+                    filled.update(self.parse_properties_from_table(tables))
+                
+                references_reached = False
+                if page.text:
+                    normalized = (page.normalized if page.normalized is not None
+                                  else normalize_text(page.text))
+                    text_length += len(normalized) + 1
+                    # 부재 판정: 새 페이지의 섹션 제목만 확인
+                    for section in SectionIndex(normalized).sections:
+                        if section.name == 'references' and 'experimental' in seen_sections:
+                            references_reached = True
+                        seen_sections.add(section.name)
+                    
+                    # 텍스트는 누적 전체로, 길이가 2배가 될 때마다 스캔
+                    if text_length >= 2 * scanned_length:
+                        text_fields = self._scan_text_fields(join_normalized_text(pages))
+                        scanned_length = text_length
+                        filled.update(text_fields[0])
+                        filled.update(text_fields[1])
+                
+                if self.stream_targets <= filled:
+                    logger.info(f"⚡ 대상 필드 모두 추출 - {page.page_num}페이지에서 파싱 중단")
+                    stopped = True
+                    break
+                if references_reached:
+                    logger.info(f"⚡ 본문 끝(참고문헌) 도달 - {page.page_num}페이지에서 파싱 중단")
+                    stopped = True
+                    break
+        finally:
+            stream.close()
+        
+        # 마지막 스캔 이후 읽은 페이지까지 포함하여 한 번 더 (읽은 전체 텍스트 기준 결과)
+        if text_length != scanned_length:
+            text_fields = self._scan_text_fields(join_normalized_text(pages))
+        
+        # 새로 파싱한 페이지가 있으면 저장 (중간에 멈췄으면 일부 페이지 항목)
+        if digest is not None and (len(pages) > len(cached) or not stopped):
+            try:
+                self.parse_cache.put(digest, pages, table_gate=self.table_page_gate,
+                                     text_backend=self.text_backend,
+                                     page_filter=self.page_filter is not None,
+                                     complete=not stopped)
+            except OSError as e:
+                logger.debug(f"파싱 캐시 저장 실패: {e}")
+        
+        self._observe_pages(pdf_path, pages)
+        return pages, text_fields
+    
+    def _scan_text_fields(self, text: str) -> Tuple[Dict, Dict, RegexBudget]:
+        """텍스트 필드 추출 (합성 조건, QD 특성, 사용한 정규식 예산)"""
+        budget = self.new_regex_budget()
+        return (self.extract_synthesis_conditions(text, budget),
+                self.extract_qd_properties(text, budget), budget)
     
     def extract_text_from_pdf(self, pdf_path: Path) -> str:
         """PDF에서 텍스트 추출"""
         try:
-            text = ""
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
+            pages = self.extract_pages(pdf_path, want_tables=False)
+            return join_page_text(pages)
         except Exception as e:
             logger.error(f"❌ PDF 텍스트 추출 실패: {e}")
             return ""
     
     def extract_tables_from_pdf(self, pdf_path: Path) -> list:
-        """PDF에서 표 추출 (새로운 기능!)"""
+        """PDF에서 표 추출 (새로운 기능! 표 키워드 페이지만 탐지 - self.table_page_gate)"""
         try:
-            tables = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        logger.info(f"   페이지 {page_num}: {len(page_tables)}개 표 발견")
-                        tables.extend(page_tables)
+            pages = self.extract_pages(pdf_path, want_text=False)
+            tables = collect_tables(pages)
             
             if tables:
                 logger.info(f"✅ 총 {len(tables)}개 표 추출")
@@ -336,62 +672,50 @@ class PDFDataExtractor:
         """표에서 합성 조건 파싱"""
         data = {}
         
-        for table in tables:
-            if not table or len(table) < 2:
-                continue
-            
-            # 표를 문자열로 변환하여 분석
-            table_text = ' '.join([' '.join([str(cell) for cell in row if cell]) 
-                                  for row in table]).lower()
-            
+        for table in normalize_tables(tables):
             # CsPbCl3 합성 관련 표인지 확인
-            if not ('cspbcl3' in table_text or 'perovskite' in table_text or 
-                    'quantum dot' in table_text or 'pbcl2' in table_text):
+            if not table.keyword_hits(TABLE_KEYWORDS).any(*SYNTHESIS_TABLE_KEYWORDS):
                 continue
+            row_keywords = table.row_keywords(TABLE_KEYWORDS)
             
             logger.info("   ✅ CsPbCl3 합성 관련 표 발견")
             
-            # 표에서 값 추출 (행 기반)
-            for row in table[1:]:  # 첫 행은 헤더
-                if not row:
+            # 표에서 값 추출 (행 기반, 첫 행은 헤더)
+            for r in range(1, len(table)):
+                found = row_keywords[r]
+                if not found:
                     continue
                 
-                row_text = ' '.join([str(cell).lower() for cell in row if cell])
-                
                 # 온도 (100-250°C 범위)
-                if 'temp' in row_text or 'injection' in row_text:
-                    for cell in row:
-                        if cell and str(cell).replace('.', '').isdigit():
-                            temp = float(cell)
-                            if 100 <= temp <= 250:
-                                data['injection_temp_C'] = temp
-                                break
+                if 'temp' in found or 'injection' in found:
+                    values = table.row_values(r, 100, 250)
+                    if len(values):
+                        data['injection_temp_C'] = float(values[0])
                 
-                # 전구체 양
-                if 'pbcl2' in row_text or 'lead' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 0.01 <= cell <= 10:  # mmol 범위
-                                data['Pb_amount_mmol'] = cell
+                # 전구체 양 (mmol 범위)
+                if 'pbcl2' in found or 'lead' in found:
+                    values = table.row_values(r, 0.01, 10)
+                    if len(values):
+                        data['Pb_amount_mmol'] = float(values[-1])
                 
-                # 리간드
-                if 'oa' in row_text and 'oleic' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 0.1 <= cell <= 20:  # mL 범위
-                                data['OA_volume_ml'] = cell
+                # 리간드 (mL 범위)
+                if 'oa' in found and 'oleic' in found:
+                    values = table.row_values(r, 0.1, 20)
+                    if len(values):
+                        data['OA_volume_ml'] = float(values[-1])
                 
-                if 'ola' in row_text or 'oleylamine' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 0.1 <= cell <= 20:
-                                data['OLA_volume_ml'] = cell
+                if 'ola' in found or 'oleylamine' in found:
+                    values = table.row_values(r, 0.1, 20)
+                    if len(values):
+                        data['OLA_volume_ml'] = float(values[-1])
                 
-                if 'ode' in row_text or 'octadecene' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 1 <= cell <= 50:
-                                data['ODE_volume_ml'] = cell
+                if 'ode' in found or 'octadecene' in found:
+                    values = table.row_values(r, 1, 50)
+                    if len(values):
+                        data['ODE_volume_ml'] = float(values[-1])
+            
+            # 열 기반 (헤더에 항목명이 있는 표) - 행에서 못 찾은 값만 보완
+            self._fill_from_columns(table, data, SYNTHESIS_TABLE_COLUMNS)
         
         return data
     
@@ -399,355 +723,198 @@ class PDFDataExtractor:
         """표에서 QD 특성 파싱"""
         data = {}
         
-        for table in tables:
-            if not table or len(table) < 2:
-                continue
-            
-            table_text = ' '.join([' '.join([str(cell) for cell in row if cell]) 
-                                  for row in table]).lower()
-            
+        for table in normalize_tables(tables):
             # 특성 관련 표인지 확인
-            if not ('pl' in table_text or 'plqy' in table_text or 
-                    'size' in table_text or 'emission' in table_text):
+            if not table.keyword_hits(TABLE_KEYWORDS).any(*PROPERTY_TABLE_KEYWORDS):
                 continue
+            row_keywords = table.row_keywords(TABLE_KEYWORDS)
             
             logger.info("   ✅ QD 특성 관련 표 발견")
             
-            for row in table[1:]:
-                if not row:
+            for r in range(1, len(table)):
+                found = row_keywords[r]
+                if not found:
                     continue
                 
-                row_text = ' '.join([str(cell).lower() for cell in row if cell])
-                
                 # 크기
-                if 'size' in row_text or 'diameter' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 2 <= cell <= 50:
-                                data['size_nm'] = cell
+                if 'size' in found or 'diameter' in found:
+                    values = table.row_values(r, 2, 50)
+                    if len(values):
+                        data['size_nm'] = float(values[-1])
                 
                 # PL peak
-                if 'pl' in row_text or 'emission' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 350 <= cell <= 500:
-                                data['PL_peak_nm'] = int(cell)
+                if 'pl' in found or 'emission' in found:
+                    values = table.row_values(r, 350, 500)
+                    if len(values):
+                        data['PL_peak_nm'] = int(values[-1])
                 
                 # PLQY
-                if 'plqy' in row_text or 'quantum yield' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 0 <= cell <= 100:
-                                data['PLQY_percent'] = cell
+                if 'plqy' in found or 'quantum yield' in found:
+                    values = table.row_values(r, 0, 100)
+                    if len(values):
+                        data['PLQY_percent'] = float(values[-1])
                 
                 # FWHM
-                if 'fwhm' in row_text or 'width' in row_text:
-                    for cell in row:
-                        if cell and isinstance(cell, (int, float)):
-                            if 5 <= cell <= 100:
-                                data['FWHM_nm'] = cell
+                if 'fwhm' in found or 'width' in found:
+                    values = table.row_values(r, 5, 100)
+                    if len(values):
+                        data['FWHM_nm'] = float(values[-1])
+            
+            # 열 기반 (헤더에 항목명이 있는 표) - 행에서 못 찾은 값만 보완
+            self._fill_from_columns(table, data, PROPERTY_TABLE_COLUMNS)
         
         return data
     
-    def extract_synthesis_conditions(self, text: str) -> Dict:
-        """합성 조건 추출 (개선: 문맥 인식)"""
-        data = {}
-        
-        # CsPbCl3 합성 섹션만 추출 시도 (확장: 5000자)
-        synthesis_section = ""
-        
-        # "CsPbCl3 synthesis" 또는 "QD synthesis" 섹션 찾기
-        synthesis_keywords = [
-            r'synthesis\s+and\s+characterization',  # 가장 구체적
-            r'cspbcl3.*?synthesis',
-            r'quantum dot.*?synthesis',
-            r'perovskite.*?synthesis',
-            r'qd.*?preparation',
-            r'experimental.*?section',
-            r'methods.*?section',
-        ]
-        
-        for keyword in synthesis_keywords:
-            match = re.search(keyword, text, re.IGNORECASE | re.DOTALL)
-            if match:
-                # 매치된 위치부터 5000자 추출 (늘림)
-                start = match.start()
-                synthesis_section = text[start:start+5000]
-                logger.debug(f"✅ 합성 섹션 발견: '{match.group()}'")
-                break
-        
-        # 섹션을 찾지 못하면 전체 텍스트 사용
-        if not synthesis_section:
-            synthesis_section = text
-            logger.debug("⚠️ 합성 섹션 특정 불가 - 전체 텍스트 사용")
-        
-        # 온도 추출 (개선: hot injection 근처만 + 패턴 3배 확장)
-        temp_patterns = [
-            # Hot injection 명시
-            r'hot[- ]injection.*?(?:at|temperature|heated|to)\s*(\d{2,3})\s*[°º]?\s*C',
-            r'hot[- ]inject(?:ed|ion).*?(\d{2,3})\s*[°º]?\s*C',
-            r'(\d{2,3})\s*[°º]?\s*C.*?hot[- ]injection',
-            
-            # Temperature raised/increased
-            r'temperature.*?(?:raised|increased|heated).*?(?:to|at)\s*(\d{2,3})\s*[°º]?\s*C',
-            r'(?:raised|increased|heated).*?(?:to|at)\s*(\d{2,3})\s*[°º]?\s*C',
-            r'(\d{2,3})\s*[°º]?\s*C.*?(?:raised|heated)',
-            
-            # Injection 일반
-            r'inject(?:ed|ion).*?(?:at|temperature)\s*(\d{2,3})\s*[°º]?\s*C',
-            r'temperature.*?(\d{2,3})\s*[°º]?\s*C.*?inject',
-            r'(\d{2,3})\s*[°º]?\s*C.*?inject(?:ed|ion)',
-            r'at\s*(\d{2,3})\s*[°º]?\s*C.*?(?:was|were)\s+inject',
-            
-            # Swift injection (변형)
-            r'swift(?:ly)?.*?inject.*?(\d{2,3})\s*[°º]?\s*C',
-            r'rapid(?:ly)?.*?inject.*?(\d{2,3})\s*[°º]?\s*C',
-            
-            # Cs precursor injection
-            r'Cs[- ](?:oleate|precursor).*?inject.*?(\d{2,3})\s*[°º]?\s*C',
-            r'inject.*?Cs[- ](?:oleate|precursor).*?(\d{2,3})\s*[°º]?\s*C',
-            r'(\d{2,3})\s*[°º]?\s*C.*?Cs[- ](?:oleate|precursor).*?inject',
-            
-            # Synthesis temperature (문맥 필수)
-            r'CsPbCl3.*?synthesized.*?(\d{2,3})\s*[°º]?\s*C',
-            r'synthesized.*?CsPbCl3.*?(\d{2,3})\s*[°º]?\s*C',
-            r'QDs.*?(?:formed|prepared|synthesized).*?(\d{2,3})\s*[°º]?\s*C',
-            
-            # Reaction temperature
-            r'reaction temperature.*?(\d{2,3})\s*[°º]?\s*C',
-            r'at\s*(\d{2,3})\s*[°º]?\s*C.*?(?:for|during).*?synthesis'
-        ]
-        
-        for pattern in temp_patterns:
-            match = re.search(pattern, synthesis_section, re.IGNORECASE)
-            if match:
-                temp = float(match.group(1))
-                # 합리적인 범위 검증
-                if 100 <= temp <= 250:
-                    data['injection_temp_C'] = temp
-                    logger.debug(f"✅ 온도 추출: {temp}°C (패턴: hot-injection)")
+    def _fill_from_columns(self, table: NormalizedTable, data: Dict, columns) -> None:
+        """헤더 키워드가 맞는 열에서 범위 안의 첫 값으로 빈 필드 채우기"""
+        for field, keywords, low, high, cast in columns:
+            if field in data:
+                continue
+            for col in table.columns_matching(*keywords):
+                values = table.column_values(col, low, high)
+                if len(values):
+                    data[field] = cast(values[0])
                     break
+    
+    def new_regex_budget(self) -> RegexBudget:
+        """문서 하나의 정규식 시간 예산 생성"""
+        return RegexBudget(self.regex_timeout, self.regex_document_timeout)
+    
+    def extract_synthesis_conditions(self, text: str, budget: RegexBudget = None) -> Dict:
+        """합성 조건 추출 (개선: 문맥 인식, 정규화되지 않은 텍스트는 먼저 정규화)"""
+        data = {}
+        if budget is None:
+            budget = self.new_regex_budget()
+        text = normalize_text(text)
         
-        # Cs 전구체 (확장: 화학식 + 이름 + 약어)
-        cs_patterns = [
-            (r'Cs2CO3', 'Cs2CO3'),
-            (r'cesium\s+carbonate', 'Cs2CO3'),
-            (r'CsOAc', 'CsOAc'),
-            (r'Cs-OAc', 'CsOAc'),
-            (r'cesium\s+acetate', 'CsOAc'),
-            (r'Cs[- ]oleate', 'Cs-oleate'),
-            (r'cesium\s+oleate', 'Cs-oleate'),
-            (r'CsOA', 'Cs-oleate'),
-            (r'Cs\s+precursor', 'Cs-precursor'),
-        ]
-        
-        for pattern, source_name in cs_patterns:
-            if re.search(pattern, synthesis_section, re.IGNORECASE):
-                data['Cs_source'] = source_name
-                logger.debug(f"✅ Cs source: {source_name}")
-                break
-        
-        # Pb 전구체 (확장: 화학식 + 이름 + 변형)
-        pb_patterns = [
-            (r'PbCl2', 'PbCl2'),
-            (r'PbCl₂', 'PbCl2'),  # 아래첨자
-            (r'lead\s+chloride', 'PbCl2'),
-            (r'lead\(II\)\s+chloride', 'PbCl2'),
-            (r'lead\s*\(2\+\)\s+chloride', 'PbCl2'),
-            (r'Pb[- ]chloride', 'PbCl2'),
-        ]
-        
-        for pattern, source_name in pb_patterns:
-            if re.search(pattern, synthesis_section, re.IGNORECASE):
-                data['Pb_source'] = source_name
-                logger.debug(f"✅ Pb source: {source_name}")
-                break
-        
-        # Cl 전구체
-        data['Cl_source'] = data.get('Pb_source', 'PbCl2')
+        # 섹션 색인 (제목 오프셋 한 번 계산, 참고문헌 목록 제외)
+        index = SectionIndex(text, budget=budget)
+        body = index.body_text()
         
-        # 양 추출 (mmol) - CsPbCl3 합성 섹션에서만
-        amount_patterns = [
-            r'(\d+\.?\d*)\s*mmol.*?(?:PbCl2|lead chloride)',
-            r'PbCl2.*?(\d+\.?\d*)\s*mmol',
-        ]
-        
-        for pattern in amount_patterns:
-            match = re.search(pattern, synthesis_section, re.IGNORECASE)
-            if match:
-                amount = float(match.group(1))
-                if 0.01 <= amount <= 10:  # 합리적인 범위
-                    data['Pb_amount_mmol'] = amount
-                    break
+        # CsPbCl3 합성 섹션 (Experimental/Methods 제목 또는 합성 키워드 위치부터 5000자)
+        synthesis_section = index.synthesis_section()
         
-        # 리간드 추출 (OA, OLA, ODE)
-        ligand_patterns = {
-            'OA_volume_ml': [r'oleic acid.*?(\d+\.?\d*)\s*(?:ml|mL|μL)', 
-                            r'OA.*?(\d+\.?\d*)\s*(?:ml|mL|μL)'],
-            'OLA_volume_ml': [r'oleylamine.*?(\d+\.?\d*)\s*(?:ml|mL|μL)',
-                             r'OLA.*?(\d+\.?\d*)\s*(?:ml|mL|μL)'],
-            'ODE_volume_ml': [r'octadecene.*?(\d+\.?\d*)\s*(?:ml|mL|μL)',
-                             r'ODE.*?(\d+\.?\d*)\s*(?:ml|mL|μL)']
-        }
+        # 섹션을 찾지 못하면 본문 전체 사용
+        if not synthesis_section:
+            synthesis_section = body
+            logger.debug("⚠️ 합성 섹션 특정 불가 - 본문 전체 사용")
         
-        for key, patterns in ligand_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    volume = float(match.group(1))
-                    # μL -> mL 변환
-                    if 'μL' in match.group(0) or 'uL' in match.group(0):
-                        volume = volume / 1000
-                    data[key] = volume
-                    break
+        # 필드 레지스트리로 한 번에 스캔 (온도/전구체/양은 합성 섹션, 나머지는 본문)
+        section_scan = DocumentScanner(synthesis_section, budget=budget)
+        text_scan = (section_scan if synthesis_section is body
+                     else DocumentScanner(body, budget=budget))
         
-        # 반응 시간 (min)
-        time_patterns = [
-            r'(\d+\.?\d*)\s*min',
-            r'(\d+\.?\d*)\s*minutes',
-            r'(\d+\.?\d*)\s*h(?:our)?'  # 시간도 추출
-        ]
-        
-        for pattern in time_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                time_val = float(match.group(1))
-                if 'h' in pattern:
-                    time_val *= 60  # 시간 -> 분
-                data['reaction_time_min'] = time_val
-                break
-        
-        # 합성 방법 추출
-        method_keywords = {
-            'hot-injection': ['hot injection', 'hot-injection', 'injection method'],
-            'room-temperature': ['room temperature', 'RT synthesis', 'ambient'],
-            'microwave': ['microwave', 'MW synthesis'],
-            'sonication': ['sonication', 'ultrasonic', 'sonochemical']
-        }
+        candidates = scan_fields(SYNTHESIS_FIELDS, {'section': section_scan, 'text': text_scan})
+        data.update(select_fields(candidates))
         
-        for method, keywords in method_keywords.items():
-            for keyword in keywords:
-                if re.search(keyword, text, re.IGNORECASE):
-                    data['synthesis_method'] = method
-                    break
-            if 'synthesis_method' in data:
-                break
+        # Cl 전구체
+        data['Cl_source'] = data.get('Pb_source', 'PbCl2')
         
         return data
     
-    def extract_qd_properties(self, text: str) -> Dict:
-        """QD 특성 추출"""
-        data = {}
-        
-        # 크기 (nm)
-        size_patterns = [
-            r'size.*?(\d+\.?\d*)\s*nm',
-            r'diameter.*?(\d+\.?\d*)\s*nm',
-            r'(\d+\.?\d*)\s*nm.*?(?:size|diameter|particle)'
-        ]
-        
-        for pattern in size_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                data['size_nm'] = float(match.group(1))
-                break
-        
-        # PL peak (nm)
-        pl_patterns = [
-            r'PL.*?(\d{3})\s*nm',
-            r'emission.*?(\d{3})\s*nm',
-            r'photoluminescence.*?(\d{3})\s*nm'
-        ]
-        
-        for pattern in pl_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                wavelength = int(match.group(1))
-                if 350 <= wavelength <= 500:  # CsPbCl3 범위
-                    data['PL_peak_nm'] = wavelength
-                    break
+    def extract_qd_properties(self, text: str, budget: RegexBudget = None) -> Dict:
+        """QD 특성 추출 (참고문헌 목록 제외, 정규화되지 않은 텍스트는 먼저 정규화)"""
+        if budget is None:
+            budget = self.new_regex_budget()
+        text = normalize_text(text)
         
-        # PLQY (%)
-        plqy_patterns = [
-            r'PLQY.*?(\d+\.?\d*)\s*%',
-            r'quantum yield.*?(\d+\.?\d*)\s*%',
-            r'QY.*?(\d+\.?\d*)\s*%'
-        ]
-        
-        for pattern in plqy_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                qy = float(match.group(1))
-                if 0 <= qy <= 100:
-                    data['PLQY_percent'] = qy
-                    break
-        
-        # FWHM (nm)
-        fwhm_patterns = [
-            r'FWHM.*?(\d+\.?\d*)\s*nm',
-            r'full width.*?(\d+\.?\d*)\s*nm'
-        ]
-        
-        for pattern in fwhm_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                data['FWHM_nm'] = float(match.group(1))
-                break
-        
-        # Absorption peak (nm)
-        abs_patterns = [
-            r'absorption.*?(\d{3})\s*nm',
-            r'absorbance.*?(\d{3})\s*nm',
-            r'1S.*?(\d{3})\s*nm'
-        ]
-        
-        for pattern in abs_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                wavelength = int(match.group(1))
-                if 300 <= wavelength <= 450:
-                    data['abs_1S_peak_nm'] = wavelength
-                    break
-        
-        return data
+        body = SectionIndex(text, budget=budget).body_text()
+        candidates = scan_fields(PROPERTY_FIELDS, {'text': DocumentScanner(body, budget=budget)})
+        return select_fields(candidates)
     
     def extract_metadata(self, doi: str, text: str) -> Dict:
-        """메타데이터 추출 (CrossRef API 사용)"""
+        """
+        메타데이터 추출 (CrossRef API 사용, 결과는 캐시)
+        
+        Returns:
+            Dict: year/authors/journal (CrossRef에 없거나 조회 실패 시 빈 dict)
+        """
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get(doi)
+            if cached is not None:
+                return cached
+        
         try:
             url = f"https://api.crossref.org/works/{doi}"
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()['message']
-                
-                authors = data.get('author', [])
-                author_names = [f"{a.get('given', '')} {a.get('family', '')}" 
-                               for a in authors[:3]]  # 처음 3명만
-                
-                return {
-                    'year': data.get('published', {}).get('date-parts', [[0]])[0][0],
-                    'authors': ', '.join(author_names),
-                    'journal': data.get('container-title', ['Unknown'])[0][:50]
-                }
+                metadata = parse_work(response.json()['message'])
+            elif response.status_code == 404:
+                logger.warning(f"⚠️  CrossRef에 없는 DOI: {doi}")
+                metadata = {}
+            else:
+                # 일시적 오류는 캐시하지 않음 (다음 실행에서 다시 조회)
+                logger.error(f"❌ 메타데이터 추출 실패: HTTP {response.status_code}")
+                return {}
         except Exception as e:
             logger.error(f"❌ 메타데이터 추출 실패: {e}")
+            return {}
         
-        return {
-            'year': 2024,
-            'authors': 'Unknown',
-            'journal': 'Unknown'
-        }
+        if self.metadata_cache is not None:
+            self.metadata_cache.put(doi, metadata)
+        return metadata
+    
+    def extract_all_data(self, doi: str, paper_id: str, metadata: Optional[Dict] = None) -> Dict:
+        """
+        논문에서 모든 데이터 추출 (전체 파이프라인 - 개선: 표 우선)
+        
+        metadata가 주어지면(큐 적재 시 일괄 선조회한 결과) CrossRef 조회를 생략합니다.
+        
+        단계별 벽시계/CPU 시간, 다운로드 바이트, 파싱 페이지 수는 실행 후
+        self.last_timings에 구조화된 기록으로 남습니다 (결과 행과 함께 전달용).
+        - download: PDF 확보 전체 (selenium 단계 포함)
+        - pdf_parse: 페이지 순회 전체 / pdf_text, pdf_tables: 그중 pdfplumber 텍스트/표 (벽시계만)
+        - table_parse, metadata, regex: 표 파싱, CrossRef 조회, 텍스트 필드 추출
+        - peak_rss_mb: 문서 처리 중 최대 RSS (Linux 외에는 프로세스 전체 최대값)
+        """
+        return self._timed(self._extract_all_data, doi, paper_id, metadata)
+    
+    def extract_local_pdf(self, pdf_path: Path, doi: str, paper_id: str,
+                          fetch_metadata: bool = False) -> Optional[Dict]:
+        """
+        이미 디스크에 있는 PDF에서 데이터 추출 (다운로드/Selenium 없음)
+        
+        Args:
+            pdf_path: PDF 경로
+            doi: 결과 행에 기록할 DOI
+            paper_id: 논문 ID
+            fetch_metadata: True면 CrossRef 메타데이터 조회 (False면 네트워크 사용 안 함)
+        
+        Returns:
+            Dict 또는 None (텍스트 추출 실패), 계측 기록은 self.last_timings
+        """
+        return self._timed(self._extract_from_pdf, pdf_path, doi, paper_id, fetch_metadata)
     
-    def extract_all_data(self, doi: str, paper_id: str) -> Dict:
-        """논문에서 모든 데이터 추출 (전체 파이프라인 - 개선: 표 우선)"""
+    def _timed(self, func, *args):
+        """문서 하나 처리를 계측하고 기록을 self.last_timings에 남김"""
+        self.timer = StageTimer()
+        reset_peak_rss()
+        try:
+            return func(*args)
+        finally:
+            self.timer.peak('peak_rss_mb', peak_rss_mb())
+            self.last_timings = self.timer.record()
+            self.timer = None
+    
+    def _extract_all_data(self, doi: str, paper_id: str, metadata: Optional[Dict] = None) -> Dict:
         logger.info(f"🔬 데이터 추출 시작: {doi}")
         
+        # CrossRef 메타데이터는 PDF와 무관하므로 다운로드/파싱 동안 백그라운드로 조회
+        if metadata is None:
+            metadata_future = self.http.background(self.extract_metadata, doi, "")
+        else:
+            metadata_future = Future()
+            metadata_future.set_result(metadata)
+        
         # 1. PDF 다운로드 시도
-        pdf_path = self.download_pdf(doi)
+        with self._stage('download'):
+            pdf_path = self.download_pdf(doi)
         
         if not pdf_path:
             logger.warning(f"⚠️  PDF 없음, 메타데이터만 저장: {doi}")
-            metadata = self.extract_metadata(doi, "")
+            with self._stage('metadata'):
+                metadata = metadata_future.result()
             return {
                 'paper_id': paper_id,
                 'doi': doi,
@@ -755,8 +922,38 @@ class PDFDataExtractor:
                 'notes': 'PDF not available - metadata only'
             }
         
-        # 2. 텍스트 추출
-        text = self.extract_text_from_pdf(pdf_path)
+        return self._extract_from_pdf(pdf_path, doi, paper_id, metadata_future=metadata_future)
+    
+    def _extract_from_pdf(self, pdf_path: Path, doi: str, paper_id: str,
+                          fetch_metadata: bool = True,
+                          metadata_future: Optional[Future] = None) -> Optional[Dict]:
+        """
+        PDF 파싱 이후 파이프라인 (페이지 순회 - 표 - 텍스트 - 통합)
+        
+        metadata_future가 있으면 미리 시작한 메타데이터 조회 결과를 기다려 사용
+        (metadata 단계 시간 = 파싱 후 남은 대기 시간)
+        """
+        # 2. 페이지 순회 (텍스트 + 표를 한 번에 파싱)
+        # 스트리밍 모드는 파싱하면서 텍스트 필드까지 추출 (pdf_parse 단계에 포함, 4단계에서 재사용)
+        text_fields = None
+        try:
+            with self._stage('pdf_parse'):
+                if self.streaming:
+                    pages, text_fields = self.extract_pages_streaming(pdf_path)
+                else:
+                    pages = self.extract_pages(pdf_path)
+        except Exception as e:
+            logger.error(f"❌ PDF 파싱 실패: {e}")
+            pages = []
+        
+        self.timer.add('pdf_text', sum(page.text_time for page in pages))
+        self.timer.add('pdf_tables', sum(page.table_time for page in pages))
+        self._count('pages', len(pages))
+        self._count('pages_parsed', sum(1 for page in pages if page.text_time or page.table_time))
+        logger.info(f"💾 최대 메모리: {peak_rss_mb():.0f} MB ({len(pages)}페이지)")
+        
+        # 필드 추출용 정규화 텍스트 (페이지 파싱 때 한 번 정규화, 캐시에 함께 저장)
+        text = join_normalized_text(pages)
         
         if not text:
             logger.warning(f"⚠️  텍스트 추출 실패: {doi}")
@@ -764,14 +961,19 @@ class PDFDataExtractor:
         
         # 3. 표 추출 (새로운 기능 - 우선순위 1)
         logger.info("📊 표 추출 시도...")
-        tables = self.extract_tables_from_pdf(pdf_path)
+        tables = collect_tables(pages)
+        if tables:
+            logger.info(f"✅ 총 {len(tables)}개 표 추출")
         
         table_synthesis = {}
         table_properties = {}
         
         if tables:
-            table_synthesis = self.parse_synthesis_from_table(tables)
-            table_properties = self.parse_properties_from_table(tables)
+            # 표 정규화는 한 번만 (두 파서가 공유)
+            with self._stage('table_parse'):
+                tables = normalize_tables(tables)
+                table_synthesis = self.parse_synthesis_from_table(tables)
+                table_properties = self.parse_properties_from_table(tables)
             
             if table_synthesis:
                 logger.info(f"   ✅ 표에서 합성 조건 {len(table_synthesis)}개 추출")
@@ -780,9 +982,17 @@ class PDFDataExtractor:
         
         # 4. 텍스트에서 추출 (표에서 못 찾은 것만)
         logger.info("📝 텍스트에서 추출...")
-        metadata = self.extract_metadata(doi, text)
-        text_synthesis = self.extract_synthesis_conditions(text)
-        text_properties = self.extract_qd_properties(text)
+        metadata = {}
+        if metadata_future is not None:
+            with self._stage('metadata'):
+                metadata = metadata_future.result()
+        elif fetch_metadata:
+            with self._stage('metadata'):
+                metadata = self.extract_metadata(doi, text)
+        if text_fields is None:
+            with self._stage('regex'):
+                text_fields = self._scan_text_fields(text)
+        text_synthesis, text_properties, budget = text_fields
         
         # 5. 통합 (표 데이터 우선, 텍스트로 보완)
         synthesis = {**text_synthesis, **table_synthesis}  # 표가 텍스트를 덮어씀
@@ -796,6 +1006,11 @@ class PDFDataExtractor:
             **properties
         }
         
+        # 정규식 시간 초과 기록 (해당 패턴은 매치 없음으로 처리됨)
+        if budget.timeouts:
+            logger.warning(f"⏱️ 시간 초과 패턴 {len(budget.timeouts)}개: {budget.timeouts}")
+            result['notes'] = f"regex timeout: {'; '.join(budget.timeouts)}"
+        
         # 6. 추출된 필드 로깅
         extracted_fields = [k for k, v in result.items() 
                            if v is not None and k not in ['paper_id', 'doi', 'year', 'authors', 'journal']]
@@ -4,19 +4,38 @@ DOI 검증 및 CrossRef 검색 스크립트
 실제 존재하는 CsPbCl3 관련 논문 DOI를 찾습니다.
 """
 
-import requests
+import sys
 import time
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Iterable
 import json
 
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.http_client import get_client
+
+def _is_valid_response(response) -> bool:
+    return not isinstance(response, Exception) and response.status_code in [200, 302]
+
 def validate_doi(doi: str) -> bool:
     """DOI가 실제로 존재하는지 확인"""
     try:
-        response = requests.head(f"https://doi.org/{doi}", timeout=5, allow_redirects=True)
-        return response.status_code in [200, 302]
-    except:
+        response = get_client().head(f"https://doi.org/{doi}", timeout=5, allow_redirects=True)
+        return _is_valid_response(response)
+    except Exception:
         return False
 
+def validate_dois(dois: Iterable[str]) -> Dict[str, bool]:
+    """DOI 여러 개를 동시에 확인 (doi.org 동시 요청 수와 요청 간격(0.5초)은 공유 클라이언트가 제한)"""
+    dois = list(dois)
+    responses = get_client().fetch_all(
+        ('HEAD', f"https://doi.org/{doi}", {'timeout': 5, 'allow_redirects': True})
+        for doi in dois
+    )
+    return {doi: _is_valid_response(response) for doi, response in zip(dois, responses)}
+
 def search_crossref(query: str, rows: int = 20) -> List[Dict]:
     """CrossRef API로 논문 검색"""
     url = "https://api.crossref.org/works"
@@ -28,7 +47,7 @@ def search_crossref(query: str, rows: int = 20) -> List[Dict]:
     }
     
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = get_client().get(url, params=params, timeout=10)
         if response.status_code == 200:
             data = response.json()
             return data.get('message', {}).get('items', [])
@@ -45,22 +64,17 @@ def validate_existing_dois(csv_file: str) -> Dict[str, bool]:
     df = pd.read_csv(csv_file)
     unique_dois = df['doi'].unique()
     
-    results = {}
+    results = validate_dois(unique_dois)
     valid_count = 0
     invalid_count = 0
     
     for i, doi in enumerate(unique_dois, 1):
-        is_valid = validate_doi(doi)
-        results[doi] = is_valid
-        
-        if is_valid:
+        if results[doi]:
             print(f"  ✅ [{i}/{len(unique_dois)}] {doi}")
             valid_count += 1
         else:
             print(f"  ❌ [{i}/{len(unique_dois)}] {doi}")
             invalid_count += 1
-        
-        time.sleep(0.5)  # Rate limiting
     
     print(f"\n📊 검증 결과:")
     print(f"  - 유효: {valid_count}개 ({valid_count/len(unique_dois)*100:.1f}%)")
@@ -106,10 +120,11 @@ def save_validated_dois(papers: List[Dict], output_file: str):
     print("💾 검증된 DOI 저장 중...")
     
     validated_papers = []
+    validity = validate_dois(paper.get('DOI', '') for paper in papers)
     
     for i, paper in enumerate(papers, 1):
         doi = paper.get('DOI', '')
-        if validate_doi(doi):
+        if validity[doi]:
             title = paper.get('title', ['Unknown'])[0]
             year = paper.get('published', {}).get('date-parts', [[0]])[0][0]
             journal = paper.get('container-title', ['Unknown'])[0]
@@ -125,8 +140,6 @@ def save_validated_dois(papers: List[Dict], output_file: str):
             print(f"      {title[:80]}")
         else:
             print(f"  ❌ [{i}/{len(papers)}] {doi} (무효)")
-        
-        time.sleep(0.5)
     
     # JSON으로 저장
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+감시 폴더 증분 수집 서비스
+pdf/supplementary/, pdf/downloaded/에 새로 들어오거나 바뀐 PDF만 찾아 추출하고
+결과를 CSV에 계속 추가 (전체 재처리 없음)
+
+파일 상태(mtime, 크기, SHA-256)를 상태 파일에 저장하여
+- mtime/크기가 그대로인 파일은 해시도 계산하지 않고 건너뜀
+- mtime만 바뀌고 내용(해시)이 같은 파일은 다시 추출하지 않음
+- 다른 위치에 같은 내용이 이미 처리되었으면 다시 추출하지 않음
+
+사용 예:
+    python scripts/watch_ingest.py                 # 10초 간격으로 계속 감시
+    python scripts/watch_ingest.py --once          # 한 번만 확인하고 종료
+"""
+
+import sys
+import json
+import argparse
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.bulk_extract import run_bulk
+from src.pdf_cache import PDFParseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_DIRS = [project_root / "pdf" / "supplementary", project_root / "pdf" / "downloaded"]
+DEFAULT_OUTPUT = project_root / "data" / "watched_extracted.csv"
+DEFAULT_STATE = project_root / "data" / "watch_state.json"
+DEFAULT_INTERVAL = 10.0   # 초, 폴더 확인 간격
+SETTLE_SECONDS = 5.0      # 마지막 수정 후 이 시간이 지나야 처리 (복사 중인 파일 제외)
+
+
+class WatchState:
+    """처리한 PDF 상태 (경로 -> mtime/크기/해시) + 처리한 내용 해시 집합"""
+
+    def __init__(self, path: Path = DEFAULT_STATE):
+        self.path = Path(path)
+        self.files: Dict[str, Dict] = {}
+        self.digests = set()
+        # 추출 대기 중인 PDF 상태 (추출이 끝나야 files/digests에 반영 - 중단되면 다음에 다시 처리)
+        self.pending: Dict[str, Dict] = {}
+        # 마지막 전체 확인에서 본 경로 (None이면 정리하지 않음 - 확인 전이거나 일부 루트 접근 실패)
+        self.scanned: Optional[Set[str]] = None
+
+        if self.path.exists():
+            try:
+                saved = json.loads(self.path.read_text(encoding='utf-8'))
+                self.files = saved.get('files', {})
+                self.digests = set(saved.get('digests', []))
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ 상태 파일 손상, 새로 시작: {self.path} ({e})")
+
+    def commit_pending(self):
+        """추출을 마친 PDF 상태 반영 (실패한 파일도 같은 내용이면 다시 시도하지 않음)"""
+        self.files.update(self.pending)
+        self.digests.update(entry['sha256'] for entry in self.pending.values())
+        self.pending.clear()
+
+    def prune(self):
+        """마지막 확인에서 보이지 않은 경로(삭제/이동된 PDF)와 어느 파일에도 없는 해시 제거"""
+        if self.scanned is None:
+            return
+        removed = [key for key in self.files if key not in self.scanned]
+        for key in removed:
+            del self.files[key]
+        self.digests &= {entry['sha256'] for entry in self.files.values()}
+        if removed:
+            logger.debug(f"🗑️ 사라진 PDF {len(removed)}개 상태 제거")
+
+    def save(self):
+        """상태 파일 저장 (사라진 PDF 항목 정리 후 임시 파일에 쓴 뒤 교체, 추출 대기 항목은 제외)"""
+        self.prune()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps({'files': self.files, 'digests': sorted(self.digests)},
+                                       ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+
+def _iter_pdfs(root: Path):
+    """root 아래 PDF의 (경로, stat) - os.scandir로 디렉토리 항목의 stat 재사용"""
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_pdfs(Path(entry.path))
+        elif entry.name.lower().endswith('.pdf') and entry.is_file():
+            yield Path(entry.path), entry.stat()
+
+
+def find_changes(state: WatchState, roots: List[Path],
+                 settle_seconds: float = SETTLE_SECONDS) -> List[Path]:
+    """
+    새로 생기거나 내용이 바뀐 PDF 찾기 (state를 갱신하지만 저장은 하지 않음)
+
+    추출이 필요한 PDF의 상태는 state.pending에 두고, 추출을 마친 뒤 commit_pending()으로
+    반영합니다.
+
+    Returns:
+        List[Path]: 추출이 필요한 PDF (경로 순)
+    """
+    now = time.time()
+    changed = []
+    scanned = set()
+    complete = True
+
+    for root in roots:
+        if not Path(root).is_dir():
+            # 잠시 접근할 수 없는 루트 아래 항목을 지우지 않도록 이번에는 정리 생략
+            logger.warning(f"⚠️ 감시 폴더 없음: {root}")
+            complete = False
+            continue
+        for path, stat in _iter_pdfs(Path(root)):
+            key = str(path.resolve())
+            scanned.add(key)
+            known = state.files.get(key)
+            if known and known['mtime'] == stat.st_mtime and known['size'] == stat.st_size:
+                continue
+            if now - stat.st_mtime < settle_seconds:
+                continue  # 아직 쓰는 중일 수 있음 - 다음 확인 때 처리
+
+            try:
+                digest = PDFParseCache.file_digest(path)
+            except OSError as e:
+                logger.debug(f"해시 계산 실패: {path} ({e})")
+                continue
+
+            entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': digest}
+            if digest in state.digests:
+                logger.debug(f"내용 변화 없음 또는 이미 처리한 내용: {path.name}")
+                state.files[key] = entry
+                continue
+            state.pending[key] = entry
+            changed.append(path)
+
+    state.scanned = scanned if complete else None
+    return sorted(changed)
+
+
+def ingest_once(state: WatchState, roots: List[Path], output_path: Path,
+                workers: int, settle_seconds: float = SETTLE_SECONDS) -> int:
+    """
+    한 번 확인하고 바뀐 PDF만 추출하여 output_path에 추가
+
+    Returns:
+        int: 추출한 PDF 수
+    """
+    changed = find_changes(state, roots, settle_seconds)
+    if changed:
+        logger.info(f"📥 새/변경 PDF {len(changed)}개 추출")
+        counts = run_bulk(changed, output_path, min(workers, len(changed)))
+        logger.info(f"✅ 성공 {counts['success']}, 데이터 없음 {counts['no_data']}, "
+                    f"실패 {counts['error']}")
+        # 추출이 끝난 뒤에만 처리 기록에 반영 (도중에 중단되면 다음 실행에서 다시 추출)
+        state.commit_pending()
+
+    # 바뀐 것이 없어도 mtime만 바뀐 파일의 상태는 저장
+    state.save()
+    return len(changed)
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(description="감시 폴더 증분 PDF 수집")
+    parser.add_argument('dirs', nargs='*', type=Path, default=DEFAULT_WATCH_DIRS)
+    parser.add_argument('-o', '--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--state', type=Path, default=DEFAULT_STATE)
+    parser.add_argument('-i', '--interval', type=float, default=DEFAULT_INTERVAL)
+    parser.add_argument('--settle', type=float, default=SETTLE_SECONDS,
+                        help="마지막 수정 후 처리까지 대기 시간 (초)")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--once', action='store_true', help="한 번만 확인하고 종료")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    state = WatchState(args.state)
+
+    print("=" * 80)
+    print("👀 감시 폴더 증분 수집")
+    print("=" * 80)
+    for directory in args.dirs:
+        print(f"   📁 {directory}")
+    print(f"💾 출력: {args.output}")
+    print(f"📋 처리 기록: {len(state.files)}개 파일")
+    if not args.once:
+        print(f"⏱️  확인 간격: {args.interval:.0f}초 (Ctrl+C로 중단)")
+    print("=" * 80)
+
+    try:
+        while True:
+            ingest_once(state, args.dirs, args.output, args.workers, args.settle)
+            if args.once:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        state.pending.clear()   # 추출 중이던 PDF는 처리 기록에 남기지 않음
+        state.save()
+        print("\n⚠️ 사용자가 중단했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""CrossRef 메타데이터 캐시 모듈
+
+DOI별 CrossRef 메타데이터(연도, 저자, 저널)를 SQLite에 저장하여 재실행이나 이미 수집한
+DOI를 처리할 때 api.crossref.org를 다시 호출하지 않습니다.
+
+- TTL: 항목마다 만료 시각 저장 (찾은 DOI는 길게, CrossRef에 없는 DOI(404)는 짧게)
+- 네거티브 캐시: 404 DOI는 빈 메타데이터 {}로 기록 (일시적 오류는 기록하지 않음)
+- 용량 제한: 최대 항목 수를 넘으면 만료 항목, 오래 저장된 항목 순으로 삭제
+- 프로세스 메모리 캐시를 앞에 두어 같은 프로세스의 반복 조회는 SQLite도 읽지 않음
+- 일괄 선조회: 캐시에 없는 DOI만 works 필터 쿼리 몇 번으로 한꺼번에 조회 (prefetch)
+  (필터 쿼리가 찾지 못한 DOI는 대소문자/인코딩 차이일 수 있어 네거티브 캐시하지 않고 개별 조회로 남김)
+
+여러 워커 프로세스가 같은 파일을 공유합니다 (연결 관리는 src.sqlite_cache).
+"""
+import csv
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_NAME = "crossref_metadata.sqlite"
+DEFAULT_TTL = 90 * 24 * 3600            # 찾은 DOI (초)
+DEFAULT_NEGATIVE_TTL = 24 * 3600        # CrossRef에 없는 DOI (초)
+DEFAULT_MAX_ENTRIES = 100_000
+EVICT_EVERY = 200                       # 저장 N번마다 용량 확인
+
+CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+BULK_BATCH_SIZE = 40                    # 일괄 조회 요청당 DOI 수
+BULK_SELECT = "DOI,author,published,container-title"
+
+
+def normalize_doi(doi: str) -> str:
+    """캐시 키 (DOI는 대소문자 구분 없음)"""
+    return doi.strip().lower()
+
+
+def parse_work(message: Dict) -> Dict:
+    """CrossRef works 응답의 message -> 메타데이터 (없는 항목은 None)"""
+    date_parts = (message.get('published') or {}).get('date-parts') or [[None]]
+    authors = message.get('author') or []
+    titles = message.get('container-title') or [None]
+    return {
+        'year': date_parts[0][0] if date_parts[0] else None,
+        'authors': ', '.join(f"{a.get('given', '')} {a.get('family', '')}"
+                             for a in authors[:3]) or None,  # 처음 3명만
+        'journal': titles[0][:50] if titles[0] else None,
+    }
+
+
+class CrossRefCache(SQLiteCache):
+    """DOI -> CrossRef 메타데이터 SQLite 캐시 (TTL + 네거티브 캐시 + 용량 제한)"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS metadata (
+        doi TEXT PRIMARY KEY,
+        data TEXT NOT NULL,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS metadata_stored_at ON metadata (stored_at);
+    """
+
+    def __init__(self, db_path: Path, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            ttl: 찾은 DOI 유효 기간 (초)
+            negative_ttl: CrossRef에 없는 DOI 유효 기간 (초)
+            max_entries: 최대 항목 수 (초과 시 오래 저장된 항목부터 삭제)
+        """
+        super().__init__(db_path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+
+        # 프로세스 메모리 캐시: doi -> (만료 시각, 메타데이터)
+        self._memory: Dict[str, tuple] = {}
+        self._puts = 0
+
+    def get(self, doi: str) -> Optional[Dict]:
+        """
+        캐시된 메타데이터 조회
+
+        Returns:
+            Dict: 메타데이터 ({}는 CrossRef에 없는 DOI로 기록된 항목), 없거나 만료되었으면 None
+        """
+        key = normalize_doi(doi)
+        now = time.time()
+        cached = self._memory.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT data, expires_at FROM metadata WHERE doi = ? AND expires_at > ?",
+                    (key, now)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"메타데이터 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+
+        metadata = json.loads(row[0])
+        self._memory[key] = (row[1], metadata)
+        return metadata
+
+    def put(self, doi: str, metadata: Dict):
+        """메타데이터 저장 (빈 dict는 CrossRef에 없는 DOI로 짧게 저장)"""
+        self.put_many({doi: metadata})
+
+    def put_many(self, entries: Dict[str, Dict], replace: bool = True):
+        """
+        여러 DOI 메타데이터를 한 트랜잭션으로 저장
+
+        Args:
+            entries: DOI -> 메타데이터 ({}는 네거티브 항목)
+            replace: False면 이미 있는 DOI는 건너뜀
+        """
+        now = time.time()
+        rows = [(normalize_doi(doi), json.dumps(metadata, ensure_ascii=False), now,
+                 now + (self.ttl if metadata else self.negative_ttl))
+                for doi, metadata in entries.items()]
+        if not rows:
+            return
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.executemany(
+                        f"{verb} INTO metadata (doi, data, stored_at, expires_at) VALUES (?, ?, ?, ?)",
+                        rows)
+                self._puts += len(rows)
+                if self._puts >= EVICT_EVERY:
+                    self._puts = 0
+                    self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.debug(f"메타데이터 캐시 저장 실패: {e}")
+            return
+
+        if replace:
+            for key, data, _, expires_at in rows:
+                self._memory[key] = (expires_at, json.loads(data))
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """만료 항목 삭제 후에도 최대 항목 수를 넘으면 오래 저장된 항목부터 삭제"""
+        with conn:
+            conn.execute("DELETE FROM metadata WHERE expires_at <= ?", (now,))
+            excess = conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute("DELETE FROM metadata WHERE doi IN "
+                             "(SELECT doi FROM metadata ORDER BY stored_at LIMIT ?)", (excess,))
+                logger.debug(f"🗑️ 메타데이터 캐시 {excess}개 제거")
+
+    def prefetch(self, dois: Iterable[str], client) -> Dict[str, Dict]:
+        """
+        DOI 목록 메타데이터 확보 (캐시에 없는 DOI만 일괄 조회 후 저장)
+
+        Returns:
+            Dict: DOI -> 메타데이터 (일괄 조회에 실패했거나 결과에 없던 DOI는 제외 - 워커가 개별 조회)
+        """
+        results = {}
+        missing = []
+        for doi in dict.fromkeys(dois):
+            cached = self.get(doi)
+            if cached is not None:
+                results[doi] = cached
+            else:
+                missing.append(doi)
+
+        if missing:
+            fetched = fetch_works(missing, client)
+            self.put_many(fetched)
+            results.update(fetched)
+        return results
+
+    def seed_from_csv(self, csv_paths: Iterable[Path]) -> int:
+        """
+        이전 수집 결과 CSV(doi, year, authors, journal 열)의 메타데이터로 캐시 채우기
+
+        이미 캐시에 있는 DOI와 메타데이터가 비었거나 'Unknown'인 행은 건너뜁니다.
+
+        Returns:
+            int: 추가 후보 항목 수
+        """
+        entries = {}
+        for path in csv_paths:
+            try:
+                with open(path, newline='', encoding='utf-8') as f:
+                    for row in csv.DictReader(f):
+                        doi = (row.get('doi') or '').strip()
+                        authors = (row.get('authors') or '').strip()
+                        if not doi or authors in ('', 'Unknown'):
+                            continue
+                        try:
+                            year = int(float(row.get('year') or ''))
+                        except ValueError:
+                            year = None
+                        entries[doi] = {
+                            'year': year,
+                            'authors': authors,
+                            'journal': (row.get('journal') or '').strip() or None,
+                        }
+            except (OSError, csv.Error) as e:
+                logger.debug(f"CSV 읽기 실패, 무시: {path} ({e})")
+
+        self.put_many(entries, replace=False)
+        return len(entries)
+
+
+def fetch_works(dois: List[str], client, batch_size: int = BULK_BATCH_SIZE) -> Dict[str, Dict]:
+    """
+    CrossRef works 필터 쿼리(filter=doi:A,doi:B,...)로 여러 DOI 메타데이터를 한 번에 조회
+
+    배치 요청은 공유 HTTP 클라이언트로 동시에 보냅니다.
+
+    Args:
+        dois: DOI 목록
+        client: HTTPClient (src.http_client)
+        batch_size: 요청당 DOI 수 (URL 길이 제한)
+
+    Returns:
+        Dict: DOI -> 메타데이터 (찾은 DOI만 - 배치 결과에 없거나 실패한 배치의 DOI는 제외)
+    """
+    # ','는 필터 구분자라 DOI에 있으면 일괄 조회 불가 (개별 조회로 남김)
+    dois = [doi for doi in dict.fromkeys(dois) if ',' not in doi]
+    batches = [dois[i:i + batch_size] for i in range(0, len(dois), batch_size)]
+    responses = client.fetch_all(
+        ('GET', CROSSREF_WORKS_URL, {
+            'params': {'filter': ','.join(f"doi:{doi}" for doi in batch),
+                       'rows': len(batch), 'select': BULK_SELECT},
+            'timeout': 30,
+        })
+        for batch in batches
+    )
+
+    results = {}
+    for batch, response in zip(batches, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            response.raise_for_status()
+            items = response.json()['message']['items']
+        except Exception as e:
+            logger.warning(f"⚠️  CrossRef 일괄 조회 실패 ({len(batch)}개 DOI): {e}")
+            continue
+        found = {normalize_doi(item['DOI']): parse_work(item) for item in items if item.get('DOI')}
+        for doi in batch:
+            # 결과에 없는 DOI는 CrossRef에 없다고 단정하지 않음 (개별 조회가 404를 확인)
+            if normalize_doi(doi) in found:
+                results[doi] = found[normalize_doi(doi)]
+    return results
@@ -0,0 +1,608 @@
+"""논문 텍스트 필드 스캐너 모듈
+
+합성 조건/QD 특성 추출에 쓰는 정규식 패턴을 필드 레지스트리로 모아 미리 컴파일하고,
+문서마다 한 번만 스캔하여 모든 필드의 후보 값을 만듭니다.
+
+패턴은 기존과 같은 `키워드.*?값` 형태로 적습니다. 스캐너는 패턴을 `.*?` 기준으로
+구간(segment)으로 나누고, 구간별 출현 위치를 문서당 한 번만 색인한 뒤 같은 줄 안에서
+위치를 이어 붙입니다. 여러 패턴이 같은 구간(예: `(\\d{2,3})\\s*c`)을 공유하므로
+전체 텍스트 재스캔과 `.*?` 백트래킹이 사라집니다.
+
+`값 단위` 구간(QUANTITY_SEGMENTS)은 정규식 대신 수량 토크나이저(src.quantity_tokens)의
+단위별 배열에서 위치를 가져오고, 매치에 표준 단위가 붙어 단위 변환에 쓰입니다.
+
+근접 조건(Proximity)이 있는 필드는 패턴보다 먼저 키워드-값 근접 결합(src.proximity_join)으로
+키워드 뒤 가까운 값을 후보로 만듭니다 (패턴 후보는 그 뒤의 대체 후보). backward가 있는 필드는
+같은 절에서 키워드 바로 앞에 오는 값("0.2 mmol of PbCl2, 0.1 mmol of CsOAc")이 뒤의 값보다 앞섭니다.
+
+정규식 특수 문자가 없는 리터럴 구간(키워드, 합성 방법 이름 등)은 레지스트리 전체 키워드로
+import 시 만든 키워드 오토마톤(src.keyword_automaton)으로 문서당 한 번에 색인합니다.
+
+패턴은 정규화된 텍스트(src.text_normalize) 기준의 ASCII 소문자로 적고 IGNORECASE 없이
+컴파일합니다 (μL -> ul, °C -> c, 리가처/하이픈 줄바꿈은 정규화에서 처리).
+"""
+import logging
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from src.regex_guard import RegexBudget
+from src.quantity_tokens import QuantityTokens, convert_quantity
+from src.keyword_automaton import KeywordAutomaton, KeywordHits
+from src.proximity_join import PRECEDING_WINDOW, PROXIMITY_WINDOW, preceding_join, proximity_join
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+GAP = '.*?'
+
+# 구간 정규식 컴파일 캐시 (프로세스당 한 번)
+_SEGMENT_REGEX: Dict[Tuple[str, int], re.Pattern] = {}
+
+
+def _compile_segment(segment: str, flags: int) -> re.Pattern:
+    """구간을 겹치는 위치까지 모두 찾도록 lookahead로 감싸 컴파일"""
+    key = (segment, flags)
+    regex = _SEGMENT_REGEX.get(key)
+    if regex is None:
+        regex = re.compile(f"(?=({segment}))", flags)
+        _SEGMENT_REGEX[key] = regex
+    return regex
+
+
+class QuantitySegment(NamedTuple):
+    """수량 토큰으로 색인하는 구간"""
+    units: Tuple[str, ...]
+    digits: Optional[Tuple[int, int]] = None   # 정수부 자릿수 제한 (소수 제외)
+    prefix: Optional[str] = None               # 값 바로 앞에 있어야 하는 단어 (공백만 허용)
+
+
+# 구간 정규식 -> 수량 토큰 조회 조건
+QUANTITY_SEGMENTS = {
+    r'(\d+\.?\d*)\s*nm': QuantitySegment(('nm',)),
+    r'(\d{3})\s*nm': QuantitySegment(('nm',), digits=(3, 3)),
+    r'(\d{2,3})\s*c': QuantitySegment(('C',), digits=(2, 3)),
+    r'(?:at|temperature|heated|to)\s*(\d{2,3})\s*c':
+        QuantitySegment(('C',), digits=(2, 3), prefix=r'at|temperature|heated|to'),
+    r'(?:to|at)\s*(\d{2,3})\s*c':
+        QuantitySegment(('C',), digits=(2, 3), prefix=r'to|at'),
+    r'(?:at|temperature)\s*(\d{2,3})\s*c':
+        QuantitySegment(('C',), digits=(2, 3), prefix=r'at|temperature'),
+    r'at\s*(\d{2,3})\s*c': QuantitySegment(('C',), digits=(2, 3), prefix=r'at'),
+    r'(\d+\.?\d*)\s*%': QuantitySegment(('%',)),
+    r'(\d+\.?\d*)\s*mmol': QuantitySegment(('mmol',)),
+    r'(\d+\.?\d*)\s*(?:ml|ul)': QuantitySegment(('mL', 'uL')),
+    r'(\d+\.?\d*)\s*min': QuantitySegment(('min',)),
+    r'(\d+\.?\d*)\s*minutes': QuantitySegment(('min',)),
+    r'(\d+\.?\d*)\s*h(?:our)?': QuantitySegment(('h',)),
+}
+
+class Proximity(NamedTuple):
+    """키워드-값 근접 결합 조건 (키워드 뒤 window 글자 안, 같은 문장의 수량 토큰)"""
+    keywords: Tuple[str, ...]                  # 우선순위 순서, 단어 단위로만 인정
+    units: Tuple[str, ...]
+    digits: Optional[Tuple[int, int]] = None   # 정수부 자릿수 제한 (소수 제외)
+    window: int = PROXIMITY_WINDOW
+    backward: int = 0                          # 키워드 앞 같은 절의 값 허용 거리 (0이면 뒤만)
+
+
+# 근접 결합 후보의 패턴 이름
+PROXIMITY_PATTERN = '<proximity>'
+
+# 문장 경계 (마침표/세미콜론 뒤 공백 - 소수점 제외)
+_SENTENCE_BREAK = re.compile(r'[.;](?=\s)')
+
+# 절 경계 (문장 경계 + 쉼표/콜론/괄호/and - 키워드 앞 값은 같은 절에서만 결합)
+_CLAUSE_BREAK = re.compile(r'[.;](?=\s)|[,:()]|\band\b')
+
+# 접두 단어 정규식 캐시 (값 시작 위치에서 끝나야 함)
+_PREFIX_REGEX: Dict[Tuple[str, int], re.Pattern] = {}
+_PREFIX_WINDOW = 40
+
+
+class _Occurrences(NamedTuple):
+    """한 구간의 문서 내 출현 위치 (시작 위치 오름차순)"""
+    starts: List[int]
+    ends: List[int]
+    captures: List[Optional[str]]
+    units: Optional[List[str]] = None   # 수량 구간이면 표준 단위
+
+
+class ScanMatch:
+    """스캐너 매치 결과 (re.Match의 group()/start()/end()만 지원)"""
+
+    def __init__(self, text: str, start: int, end: int, capture: Optional[str],
+                 unit: Optional[str] = None):
+        self._text = text
+        self._start = start
+        self._end = end
+        self._capture = capture
+        self.unit = unit    # 캡처 값의 표준 단위 (수량 구간일 때)
+
+    def group(self, index: int = 0) -> Optional[str]:
+        if index == 0:
+            return self._text[self._start:self._end]
+        if index == 1:
+            return self._capture
+        raise IndexError("no such group")
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+
+class DocumentScanner:
+    """한 문서에 대한 구간 색인 + `.*?` 패턴 검색기"""
+
+    def __init__(self, text: str, flags: int = 0,
+                 budget: Optional[RegexBudget] = None):
+        """
+        Args:
+            text: 검색 대상 텍스트 (normalize_text()로 정규화한 텍스트)
+            flags: 정규식 플래그 (패턴이 소문자이므로 기본 없음)
+            budget: 정규식 시간 예산 (시간 초과 구간은 매치 없음으로 처리)
+        """
+        self.text = text
+        self.flags = flags
+        self.budget = budget
+        self._occurrences: Dict[str, _Occurrences] = {}
+        self._newlines = [m.start() for m in re.finditer('\n', text)]
+        self._tokens: Optional[QuantityTokens] = None
+        self._keywords: Optional[KeywordHits] = None
+        self._breaks: Optional[np.ndarray] = None
+        self._clauses: Optional[np.ndarray] = None
+
+    @property
+    def tokens(self) -> QuantityTokens:
+        """문서 수량 토큰 (처음 필요할 때 한 번만 토큰화)"""
+        if self._tokens is None:
+            if self.budget is not None:
+                self._tokens = self.budget.run('<quantity tokens>', QuantityTokens, self.text,
+                                               default=QuantityTokens(''))
+            else:
+                self._tokens = QuantityTokens(self.text)
+        return self._tokens
+
+    @property
+    def keywords(self) -> KeywordHits:
+        """문서 리터럴 키워드 출현 위치 (처음 필요할 때 오토마톤으로 한 번만 스캔)"""
+        if self._keywords is None:
+            if self.budget is not None:
+                self._keywords = self.budget.run('<keywords>', FIELD_KEYWORDS.scan, self.text,
+                                                 default=KeywordHits({}))
+            else:
+                self._keywords = FIELD_KEYWORDS.scan(self.text)
+        return self._keywords
+
+    @property
+    def breaks(self) -> np.ndarray:
+        """문장 경계 위치 (오름차순)"""
+        if self._breaks is None:
+            self._breaks = np.array([m.start() for m in _SENTENCE_BREAK.finditer(self.text)],
+                                    dtype=np.int64)
+        return self._breaks
+
+    @property
+    def clauses(self) -> np.ndarray:
+        """절 경계 위치 (오름차순)"""
+        if self._clauses is None:
+            self._clauses = np.array([m.start() for m in _CLAUSE_BREAK.finditer(self.text)],
+                                     dtype=np.int64)
+        return self._clauses
+
+    def _is_word(self, start: int, end: int) -> bool:
+        """text[start:end]가 단어 단위인지 (복수형 s 허용 - 'pl'은 'sample', 'plqy'에 매치 안 됨)"""
+        text = self.text
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        if end < len(text) and text[end].isalpha():
+            return text[end] == 's' and not text[end + 1:end + 2].isalpha()
+        return True
+
+    def proximity_matches(self, proximity: Proximity) -> List[ScanMatch]:
+        """
+        키워드-값 근접 결합 매치 전체 (키워드 우선순위 - 키워드 위치 - 앞 값 - 가까운 뒤 값 순서)
+
+        키워드 출현 위치는 키워드 오토마톤, 값 위치는 수량 토큰 배열에서 가져와
+        proximity_join(뒤 값)과 preceding_join(같은 절의 앞 값, backward > 0일 때)으로
+        한 번에 결합합니다.
+        """
+        hits = self.keywords
+        starts, ends = [], []
+        for keyword in proximity.keywords:
+            for start in hits.offsets.get(keyword, ()):
+                end = start + len(keyword)
+                if self._is_word(start, end):
+                    starts.append(start)
+                    ends.append(end)
+        if not starts:
+            return []
+
+        tokens = self.tokens
+        selected = tokens.select(proximity.units, proximity.digits)
+        left, right = proximity_join(np.array(ends, dtype=np.int64), tokens.starts[selected],
+                                     proximity.window, self.breaks)
+        matches = [(k, 1, ScanMatch(self.text, starts[k], int(tokens.ends[i]),
+                                    tokens.number_text[i], tokens.unit(i)))
+                   for k, i in zip(left.tolist(), selected[right].tolist())]
+
+        if proximity.backward:
+            left, right = preceding_join(np.array(starts, dtype=np.int64), tokens.ends[selected],
+                                         proximity.backward, self.clauses)
+            matches += [(k, 0, ScanMatch(self.text, int(tokens.starts[i]), ends[k],
+                                         tokens.number_text[i], tokens.unit(i)))
+                        for k, i in zip(left.tolist(), selected[right].tolist())]
+            # 키워드마다 앞 값을 뒤 값보다 먼저 (정렬은 안정적이므로 뒤 값끼리는 가까운 순 유지)
+            matches.sort(key=lambda item: item[:2])
+
+        return [match for _, _, match in matches]
+
+    def _quantity_occurrences(self, quantity: QuantitySegment) -> _Occurrences:
+        """수량 토큰 배열에서 구간 위치 조회"""
+        tokens = self.tokens
+        selected = tokens.select(quantity.units, quantity.digits)
+
+        prefix = None
+        if quantity.prefix is not None:
+            key = (quantity.prefix, self.flags)
+            prefix = _PREFIX_REGEX.get(key)
+            if prefix is None:
+                prefix = re.compile(f"(?:{quantity.prefix})\\s*\\Z", self.flags)
+                _PREFIX_REGEX[key] = prefix
+
+        starts, ends, captures, units = [], [], [], []
+        for i, start, end in zip(selected.tolist(), tokens.starts[selected].tolist(),
+                                 tokens.ends[selected].tolist()):
+            if prefix is not None:
+                m = prefix.search(self.text, max(0, start - _PREFIX_WINDOW), start)
+                if m is None:
+                    continue
+                start = m.start()
+            starts.append(start)
+            ends.append(end)
+            captures.append(tokens.number_text[i])
+            units.append(tokens.unit(i))
+
+        return _Occurrences(starts, ends, captures, units)
+
+    def _scan_segment(self, segment: str) -> _Occurrences:
+        """구간 하나의 모든 출현 위치 스캔"""
+        quantity = QUANTITY_SEGMENTS.get(segment)
+        if quantity is not None:
+            return self._quantity_occurrences(quantity)
+        if segment in FIELD_KEYWORDS and not self.flags:
+            starts = self.keywords.offsets.get(segment, [])
+            return _Occurrences(starts, [start + len(segment) for start in starts],
+                                [None] * len(starts))
+
+        regex = _compile_segment(segment, self.flags)
+        has_capture = regex.groups >= 2
+        starts, ends, captures = [], [], []
+        for m in regex.finditer(self.text):
+            starts.append(m.start())
+            ends.append(m.end(1))
+            captures.append(m.group(2) if has_capture else None)
+        return _Occurrences(starts, ends, captures)
+
+    def _index(self, segment: str) -> _Occurrences:
+        """구간 출현 위치 색인 (문서당 구간마다 한 번만 스캔)"""
+        occ = self._occurrences.get(segment)
+        if occ is None:
+            if self.budget is not None:
+                occ = self.budget.run(segment, self._scan_segment, segment,
+                                      default=_Occurrences([], [], []))
+            else:
+                occ = self._scan_segment(segment)
+            self._occurrences[segment] = occ
+        return occ
+
+    def _line_end(self, pos: int) -> int:
+        """pos 이후 첫 줄바꿈 위치 (`.*?`는 줄바꿈을 넘지 못함)"""
+        k = bisect_left(self._newlines, pos)
+        return self._newlines[k] if k < len(self._newlines) else len(self.text)
+
+    def _follow(self, segments: List[str], i: int, pos: int, memo: dict) -> Optional[List[int]]:
+        """segments[i:]를 pos 이후 같은 줄에서 가장 앞선 위치로 이어 붙임"""
+        key = (i, pos)
+        if key in memo:
+            return memo[key]
+
+        occ = self._index(segments[i])
+        limit = self._line_end(pos)
+        result = None
+        k = bisect_left(occ.starts, pos)
+        while k < len(occ.starts) and occ.starts[k] <= limit:
+            if i + 1 == len(segments):
+                result = [k]
+                break
+            rest = self._follow(segments, i + 1, occ.ends[k], memo)
+            if rest is not None:
+                result = [k] + rest
+                break
+            k += 1
+
+        memo[key] = result
+        return result
+
+    def search(self, pattern: str) -> Optional[ScanMatch]:
+        """
+        re.search(pattern, text, flags)와 같은 결과를 색인으로 찾음
+
+        Args:
+            pattern: `.*?`로 구간을 잇는 정규식 (캡처 그룹은 최대 1개)
+
+        Returns:
+            ScanMatch 또는 None
+        """
+        segments = pattern.split(GAP)
+        first = self._index(segments[0])
+        memo = {}
+
+        for k in range(len(first.starts)):
+            chain = [k]
+            if len(segments) > 1:
+                rest = self._follow(segments, 1, first.ends[k], memo)
+                if rest is None:
+                    continue
+                chain += rest
+
+            capture = unit = None
+            for segment, idx in zip(segments, chain):
+                occ = self._index(segment)
+                if occ.captures[idx] is not None:
+                    capture = occ.captures[idx]
+                    unit = occ.units[idx] if occ.units is not None else None
+                    break
+            last = self._index(segments[-1])
+            return ScanMatch(self.text, first.starts[k], last.ends[chain[-1]], capture, unit)
+
+        return None
+
+
+# ---------------------------------------------------------------------------
+# 필드 레지스트리
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    추출 필드 정의
+
+    patterns는 우선순위 순서입니다. 각 패턴의 첫 매치가 후보가 되고, 유효 범위를
+    통과한 첫 후보가 필드 값으로 선택됩니다. labels가 있으면 값 대신 매치된 패턴의
+    라벨을 사용합니다 (전구체 종류, 합성 방법 등). unit이 있으면 값을 그 단위로
+    변환합니다 (μL -> mL, h -> min). proximity가 있으면 근접 결합 후보가 패턴 후보보다 앞섭니다.
+    """
+    name: str
+    patterns: Tuple[str, ...]
+    scope: str = 'text'                     # 'section' (합성 섹션) 또는 'text' (전체)
+    cast: Callable = float
+    valid_range: Optional[Tuple[float, float]] = None
+    labels: Optional[Tuple[str, ...]] = None
+    unit: Optional[str] = None              # 목표 단위 (수량 토큰 단위에서 변환)
+    proximity: Optional[Proximity] = None   # 키워드-값 근접 결합 조건
+
+
+class FieldCandidate(NamedTuple):
+    """필드 후보 값 (패턴별 첫 매치)"""
+    field: str
+    pattern: str
+    value: object
+    match: ScanMatch
+    valid: bool
+
+
+def _labelled(pairs) -> dict:
+    patterns, labels = zip(*pairs)
+    return {'patterns': tuple(patterns), 'labels': tuple(labels)}
+
+
+# 온도 추출 (hot injection 근처만)
+TEMP_PATTERNS = (
+    # Hot injection 명시
+    r'hot[- ]?injection.*?(?:at|temperature|heated|to)\s*(\d{2,3})\s*c',
+    r'hot[- ]?inject(?:ed|ion).*?(\d{2,3})\s*c',
+    r'(\d{2,3})\s*c.*?hot[- ]?injection',
+
+    # Temperature raised/increased
+    r'temperature.*?(?:raised|increased|heated).*?(?:to|at)\s*(\d{2,3})\s*c',
+    r'(?:raised|increased|heated).*?(?:to|at)\s*(\d{2,3})\s*c',
+    r'(\d{2,3})\s*c.*?(?:raised|heated)',
+
+    # Injection 일반
+    r'inject(?:ed|ion).*?(?:at|temperature)\s*(\d{2,3})\s*c',
+    r'temperature.*?(\d{2,3})\s*c.*?inject',
+    r'(\d{2,3})\s*c.*?inject(?:ed|ion)',
+    r'at\s*(\d{2,3})\s*c.*?(?:was|were)\s+inject',
+
+    # Swift injection (변형)
+    r'swift(?:ly)?.*?inject.*?(\d{2,3})\s*c',
+    r'rapid(?:ly)?.*?inject.*?(\d{2,3})\s*c',
+
+    # Cs precursor injection
+    r'cs[- ]?(?:oleate|precursor).*?inject.*?(\d{2,3})\s*c',
+    r'inject.*?cs[- ]?(?:oleate|precursor).*?(\d{2,3})\s*c',
+    r'(\d{2,3})\s*c.*?cs[- ]?(?:oleate|precursor).*?inject',
+
+    # Synthesis temperature (문맥 필수)
+    r'cspbcl3.*?synthesized.*?(\d{2,3})\s*c',
+    r'synthesized.*?cspbcl3.*?(\d{2,3})\s*c',
+    r'qds.*?(?:formed|prepared|synthesized).*?(\d{2,3})\s*c',
+
+    # Reaction temperature
+    r'reaction temperature.*?(\d{2,3})\s*c',
+    r'at\s*(\d{2,3})\s*c.*?(?:for|during).*?synthesis',
+)
+
+# Cs 전구체 (화학식 + 이름 + 약어)
+CS_SOURCE_PATTERNS = (
+    (r'cs2co3', 'Cs2CO3'),
+    (r'cesium\s+carbonate', 'Cs2CO3'),
+    (r'csoac', 'CsOAc'),
+    (r'cs-oac', 'CsOAc'),
+    (r'cesium\s+acetate', 'CsOAc'),
+    (r'cs[- ]?oleate', 'Cs-oleate'),
+    (r'cesium\s+oleate', 'Cs-oleate'),
+    (r'csoa', 'Cs-oleate'),
+    (r'cs\s+precursor', 'Cs-precursor'),
+)
+
+# Pb 전구체 (화학식 + 이름 + 변형)
+PB_SOURCE_PATTERNS = (
+    (r'pbcl2', 'PbCl2'),  # 아래첨자(PbCl₂)는 정규화에서 숫자로 바뀜
+    (r'lead\s+chloride', 'PbCl2'),
+    (r'lead\(ii\)\s+chloride', 'PbCl2'),
+    (r'lead\s*\(2\+\)\s+chloride', 'PbCl2'),
+    (r'pb[- ]chloride', 'PbCl2'),
+)
+
+# 합성 방법 (방법 순서 -> 키워드 순서)
+METHOD_PATTERNS = (
+    ('hot injection', 'hot-injection'),
+    ('hot-injection', 'hot-injection'),
+    ('injection method', 'hot-injection'),
+    ('room temperature', 'room-temperature'),
+    ('rt synthesis', 'room-temperature'),
+    ('ambient', 'room-temperature'),
+    ('microwave', 'microwave'),
+    ('mw synthesis', 'microwave'),
+    ('sonication', 'sonication'),
+    ('ultrasonic', 'sonication'),
+    ('sonochemical', 'sonication'),
+)
+
+SYNTHESIS_FIELDS = (
+    FieldSpec('injection_temp_C', TEMP_PATTERNS, scope='section', valid_range=(100, 250)),
+    FieldSpec('Cs_source', scope='section', **_labelled(CS_SOURCE_PATTERNS)),
+    FieldSpec('Pb_source', scope='section', **_labelled(PB_SOURCE_PATTERNS)),
+    FieldSpec('Pb_amount_mmol', (
+        r'(\d+\.?\d*)\s*mmol.*?(?:pbcl2|lead chloride)',
+        r'pbcl2.*?(\d+\.?\d*)\s*mmol',
+    ), scope='section', valid_range=(0.01, 10),
+        proximity=Proximity(('pbcl2', 'lead chloride'), ('mmol',), backward=PRECEDING_WINDOW)),
+    FieldSpec('OA_volume_ml', (
+        r'oleic acid.*?(\d+\.?\d*)\s*(?:ml|ul)',
+        r'oa.*?(\d+\.?\d*)\s*(?:ml|ul)',
+    ), unit='mL', proximity=Proximity(('oleic acid', 'oa'), ('mL', 'uL'),
+                                      backward=PRECEDING_WINDOW)),
+    FieldSpec('OLA_volume_ml', (
+        r'oleylamine.*?(\d+\.?\d*)\s*(?:ml|ul)',
+        r'ola.*?(\d+\.?\d*)\s*(?:ml|ul)',
+    ), unit='mL', proximity=Proximity(('oleylamine', 'ola'), ('mL', 'uL'),
+                                      backward=PRECEDING_WINDOW)),
+    FieldSpec('ODE_volume_ml', (
+        r'octadecene.*?(\d+\.?\d*)\s*(?:ml|ul)',
+        r'ode.*?(\d+\.?\d*)\s*(?:ml|ul)',
+    ), unit='mL', proximity=Proximity(('octadecene', 'ode'), ('mL', 'uL'),
+                                      backward=PRECEDING_WINDOW)),
+    FieldSpec('reaction_time_min', (
+        r'(\d+\.?\d*)\s*min',
+        r'(\d+\.?\d*)\s*minutes',
+        r'(\d+\.?\d*)\s*h(?:our)?',  # 시간도 추출
+    ), unit='min'),
+    FieldSpec('synthesis_method', **_labelled(METHOD_PATTERNS)),
+)
+
+PROPERTY_FIELDS = (
+    FieldSpec('size_nm', (
+        r'size.*?(\d+\.?\d*)\s*nm',
+        r'diameter.*?(\d+\.?\d*)\s*nm',
+        r'(\d+\.?\d*)\s*nm.*?(?:size|diameter|particle)',
+    ), proximity=Proximity(('size', 'diameter'), ('nm',))),
+    FieldSpec('PL_peak_nm', (
+        r'pl.*?(\d{3})\s*nm',
+        r'emission.*?(\d{3})\s*nm',
+        r'photoluminescence.*?(\d{3})\s*nm',
+    ), cast=int, valid_range=(350, 500),  # CsPbCl3 범위
+        proximity=Proximity(('pl', 'emission', 'photoluminescence'), ('nm',), digits=(3, 3))),
+    FieldSpec('PLQY_percent', (
+        r'plqy.*?(\d+\.?\d*)\s*%',
+        r'quantum yield.*?(\d+\.?\d*)\s*%',
+        r'qy.*?(\d+\.?\d*)\s*%',
+    ), valid_range=(0, 100), proximity=Proximity(('plqy', 'quantum yield', 'qy'), ('%',))),
+    FieldSpec('FWHM_nm', (
+        r'fwhm.*?(\d+\.?\d*)\s*nm',
+        r'full width.*?(\d+\.?\d*)\s*nm',
+    ), proximity=Proximity(('fwhm', 'full width'), ('nm',))),
+    FieldSpec('abs_1S_peak_nm', (
+        r'absorption.*?(\d{3})\s*nm',
+        r'absorbance.*?(\d{3})\s*nm',
+        r'1s.*?(\d{3})\s*nm',
+    ), cast=int, valid_range=(300, 450),
+        proximity=Proximity(('absorption', 'absorbance', '1s'), ('nm',), digits=(3, 3))),
+)
+
+
+# 정규식 특수 문자가 없는 구간 (키워드 오토마톤으로 색인)
+_LITERAL_SEGMENT = re.compile(r'[a-z0-9 \-]+')
+
+
+def _literal_segments(specs) -> List[str]:
+    """필드 패턴의 리터럴 구간 + 근접 결합 키워드 목록"""
+    segments = [segment for spec in specs for pattern in spec.patterns
+                for segment in pattern.split(GAP) if _LITERAL_SEGMENT.fullmatch(segment)]
+    segments += [keyword for spec in specs if spec.proximity is not None
+                 for keyword in spec.proximity.keywords]
+    return segments
+
+
+# 레지스트리 전체 리터럴 구간 오토마톤 (import 시 한 번 생성)
+FIELD_KEYWORDS = KeywordAutomaton(_literal_segments(SYNTHESIS_FIELDS + PROPERTY_FIELDS))
+
+
+def scan_fields(specs, scanners: Dict[str, DocumentScanner]) -> Dict[str, List[FieldCandidate]]:
+    """
+    모든 필드의 후보 값을 한 번에 수집
+
+    Args:
+        specs: FieldSpec 목록
+        scanners: scope 이름 -> DocumentScanner
+
+    Returns:
+        Dict[str, List[FieldCandidate]]: 필드별 후보 (패턴 우선순위 순서)
+    """
+    candidates = {}
+    for spec in specs:
+        scanner = scanners[spec.scope]
+        found = []
+        if spec.proximity is not None:
+            found.extend(_candidate(spec, PROXIMITY_PATTERN, match)
+                         for match in scanner.proximity_matches(spec.proximity))
+        for i, pattern in enumerate(spec.patterns):
+            match = scanner.search(pattern)
+            if match is None:
+                continue
+            found.append(_candidate(spec, pattern, match,
+                                    spec.labels[i] if spec.labels is not None else None))
+        candidates[spec.name] = found
+    return candidates
+
+
+def _candidate(spec: FieldSpec, pattern: str, match: ScanMatch,
+               label: Optional[str] = None) -> FieldCandidate:
+    """매치 하나를 필드 후보로 변환 (라벨 또는 단위 변환 + 유효 범위 검사)"""
+    if label is not None:
+        return FieldCandidate(spec.name, pattern, label, match, True)
+
+    value = spec.cast(match.group(1))
+    if spec.unit is not None and match.unit is not None:
+        value = convert_quantity(value, match.unit, spec.unit)
+    valid = (spec.valid_range is None or
+             spec.valid_range[0] <= value <= spec.valid_range[1])
+    return FieldCandidate(spec.name, pattern, value, match, valid)
+
+
+def select_fields(candidates: Dict[str, List[FieldCandidate]]) -> Dict:
+    """필드별로 유효 범위를 통과한 첫 후보 선택"""
+    data = {}
+    for name, found in candidates.items():
+        for candidate in found:
+            if candidate.valid:
+                data[name] = candidate.value
+                logger.debug(f"✅ {name}: {candidate.value}")
+                break
+    return data
@@ -0,0 +1,354 @@
+"""공유 HTTP 클라이언트 모듈
+
+프로세스마다 requests.Session 하나를 공유하여 호스트별 연결 풀(keep-alive)을 재사용합니다.
+같은 호스트(api.crossref.org, api.unpaywall.org, doi.org 등)로 가는 요청은 TCP/TLS 연결을
+다시 맺지 않고, 연결 오류와 429/5xx 응답은 짧게 물러났다가 재시도합니다.
+
+동시 요청:
+- submit(): 요청을 스레드 풀에서 먼저 보내고 결과(Future)는 나중에 받음 (동기 코드용)
+- background(): 네트워크를 쓰는 함수 전체를 스레드 풀에서 실행
+- aget()/ahead()/afetch_all(): asyncio 코루틴 API (한 워커가 여러 조회를 동시에 진행)
+- fetch_all(): 요청 여러 개를 한 번에 보내고 순서대로 결과 반환 (동기 - 이벤트 루프 안에서도 사용 가능)
+
+호스트별 동시 요청 수는 per_host로 제한하고, 같은 호스트로 가는 요청 시작 간격은 최소 간격
+(HOST_MIN_INTERVALS, 그 외 호스트는 DEFAULT_MIN_INTERVAL)을 지킵니다 (API 서버 부하/차단 방지).
+
+파일 다운로드(download())는 응답을 메모리에 모으지 않고 조각 단위로 임시 파일(.part)에
+쓴 뒤 완료 시 원자적으로 이름을 바꿉니다. 연결이 끊기면 남은 임시 파일 뒤부터
+Range 요청으로 이어받습니다. 임시 파일 옆 메타 파일(.part.meta)에 원본 URL과 검증자
+(ETag 또는 Last-Modified)를 적어 두고 이어받을 때 If-Range로 보내므로, 서버 파일이 바뀌었거나
+다른 URL의 임시 파일이면 이어 붙이지 않고 처음부터 받습니다. 바이트 위치가 디코딩된 파일과
+맞도록 다운로드 요청은 Accept-Encoding: identity로 보냅니다.
+"""
+import asyncio
+import functools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PER_HOST = 8        # 호스트별 동시 요청 수 (= 호스트별 유지 연결 수)
+DEFAULT_HOST_POOLS = 16     # 연결 풀을 유지할 호스트 수
+DEFAULT_RETRIES = 2         # 연결 오류/429/5xx 재시도 횟수
+DEFAULT_TIMEOUT = 10        # 초 (timeout을 지정하지 않은 요청)
+DEFAULT_MIN_INTERVAL = 0.1  # 초, 같은 호스트로 가는 요청 시작 최소 간격
+HOST_MIN_INTERVALS = {      # 호스트별 최소 간격 (초)
+    'doi.org': 0.5,
+}
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_RESUME_ATTEMPTS = 2    # 다운로드 중 연결이 끊겼을 때 이어받기 시도 횟수
+PARTIAL_SUFFIX = ".part"
+META_SUFFIX = ".meta"           # 임시 파일 메타 (원본 URL + 검증자)
+
+_CONTENT_RANGE = re.compile(r'bytes\s+(\d+)-\d+/(\d+|\*)')
+_UNSATISFIED_RANGE = re.compile(r'bytes\s+\*/(\d+)')
+
+
+class DownloadTooLarge(Exception):
+    """다운로드 크기가 max_bytes를 넘음"""
+
+
+def _validator(response: requests.Response) -> Optional[str]:
+    """If-Range에 쓸 수 있는 검증자 (강한 ETag, 없으면 Last-Modified)"""
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        return None  # 인코딩된 응답은 바이트 위치가 임시 파일과 달라 이어받을 수 없음
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('Last-Modified')
+
+
+def _read_meta(meta: Path) -> Dict:
+    """임시 파일 메타 읽기 (없거나 깨졌으면 빈 dict)"""
+    try:
+        data = json.loads(meta.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _discard_partial(partial: Path, meta: Path):
+    partial.unlink(missing_ok=True)
+    meta.unlink(missing_ok=True)
+
+
+class HTTPClient:
+    """호스트별 연결 풀 + 스레드 풀 기반 동시 요청 클라이언트"""
+
+    def __init__(self, per_host: int = DEFAULT_PER_HOST, host_pools: int = DEFAULT_HOST_POOLS,
+                 retries: int = DEFAULT_RETRIES, max_in_flight: Optional[int] = None,
+                 min_interval: float = DEFAULT_MIN_INTERVAL,
+                 host_intervals: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            per_host: 호스트별 동시 요청 수 (연결 풀 크기)
+            host_pools: 연결 풀을 유지할 호스트 수
+            retries: 연결 오류/429/5xx 재시도 횟수 (GET/HEAD만)
+            max_in_flight: 전체 동시 요청 수 (None이면 per_host * 4)
+            min_interval: 같은 호스트 요청 시작 최소 간격 (초, host_intervals에 없는 호스트)
+            host_intervals: 호스트별 최소 간격 (None이면 HOST_MIN_INTERVALS)
+        """
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.host_intervals = dict(HOST_MIN_INTERVALS if host_intervals is None else host_intervals)
+        self.session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=('GET', 'HEAD'), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=host_pools, pool_maxsize=per_host,
+                              max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.executor = ThreadPoolExecutor(max_workers=max_in_flight or per_host * 4,
+                                           thread_name_prefix='http')
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}  # 호스트 -> 다음 요청을 시작할 수 있는 시각
+        self._lock = threading.Lock()
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+        return limit
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        """호스트 동시 요청 자리 확보 + 최소 간격 대기 (요청/응답 본문을 받는 동안 유지)"""
+        with self._host_limit(url):
+            self._pace(url)
+            yield
+
+    def _pace(self, url: str):
+        """같은 호스트의 직전 요청 시작 후 최소 간격이 지날 때까지 대기"""
+        host = urlsplit(url).hostname or ''
+        interval = self.host_intervals.get(host, self.min_interval)
+        if interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start + interval
+        if start > now:
+            time.sleep(start - now)
+
+    # ------------------------------------------------------------------
+    # 동기 API
+    # ------------------------------------------------------------------
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """요청 하나 (호스트별 동시 요청 수 제한, 연결 재사용)"""
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        with self._host_slot(url):
+            return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request('HEAD', url, **kwargs)
+
+    def submit(self, method: str, url: str, **kwargs) -> Future:
+        """요청을 스레드 풀에서 보내고 Future 반환 (result()는 Response 또는 예외)"""
+        return self.executor.submit(self.request, method, url, **kwargs)
+
+    def background(self, func, *args, **kwargs) -> Future:
+        """네트워크를 쓰는 함수를 스레드 풀에서 실행 (다운로드/파싱과 겹쳐 진행)"""
+        return self.executor.submit(func, *args, **kwargs)
+
+    def download(self, url: str, dest: Path, headers: Optional[Dict] = None,
+                 timeout: float = 30, max_bytes: Optional[int] = None,
+                 content_type: Optional[str] = None,
+                 progress: Optional[Callable[[int, Optional[int]], None]] = None) -> Optional[int]:
+        """
+        파일 스트리밍 다운로드 (임시 파일 -> 원자적 이름 변경, 끊긴 다운로드는 Range로 이어받기)
+
+        dest 옆의 임시 파일(dest.part)이 이전 실행에서 남아 있으면 그 뒤부터 받습니다.
+        메타 파일(dest.part.meta)의 URL이 다르거나 검증자가 없으면 임시 파일을 버리고,
+        검증자는 If-Range로 보내 서버 파일이 바뀌었으면 처음부터 받습니다.
+
+        Args:
+            url: 다운로드 URL
+            dest: 저장 경로
+            headers: 추가 요청 헤더
+            timeout: 연결/읽기 타임아웃 (초)
+            max_bytes: 최대 파일 크기 (초과 시 중단하고 임시 파일 삭제, DownloadTooLarge)
+            content_type: 지정 시 응답 Content-Type에 이 문자열이 없으면 본문을 받지 않음
+            progress: 조각마다 호출 (받은 바이트 합계, 전체 크기 또는 None)
+
+        Returns:
+            int: 이번 호출에서 받은 바이트 수, 실패(상태 코드/Content-Type 불일치)면 None
+            (연결 오류가 이어받기 시도 후에도 계속되면 예외, 받은 부분은 임시 파일에 남음)
+        """
+        dest = Path(dest)
+        partial = dest.with_name(dest.name + PARTIAL_SUFFIX)
+        meta = partial.with_name(partial.name + META_SUFFIX)
+        received = [0]  # 이번 호출에서 받은 바이트 (시도 간 누적)
+
+        for attempt in range(DOWNLOAD_RESUME_ATTEMPTS + 1):
+            try:
+                if not self._download_once(url, dest, partial, meta, headers or {}, timeout,
+                                           max_bytes, content_type, progress, received):
+                    return None
+                return received[0]
+            except DownloadTooLarge:
+                _discard_partial(partial, meta)
+                raise
+            except (requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout) as e:
+                # 받은 만큼은 임시 파일에 남아 있으므로 다음 시도는 그 뒤부터
+                if attempt == DOWNLOAD_RESUME_ATTEMPTS:
+                    raise
+                logger.debug(f"다운로드 끊김, 이어받기 ({attempt + 1}): {url} ({e})")
+        return None
+
+    def _download_once(self, url: str, dest: Path, partial: Path, meta: Path, headers: Dict,
+                       timeout: float, max_bytes: Optional[int], content_type: Optional[str],
+                       progress: Optional[Callable], received: List[int]) -> bool:
+        """download() 한 번 시도 (완료하면 True, 상태 코드/Content-Type 불일치면 False)"""
+        offset = partial.stat().st_size if partial.exists() else 0
+        # 압축 전송이면 Range 위치가 인코딩된 스트림 기준이 되므로 항상 원본 그대로 요청
+        request_headers = dict(headers, **{'Accept-Encoding': 'identity'})
+        if offset:
+            # 같은 URL에서 검증자와 함께 받은 임시 파일만 이어받음
+            saved = _read_meta(meta)
+            if saved.get('url') == url and saved.get('validator'):
+                request_headers.update({'Range': f"bytes={offset}-",
+                                        'If-Range': saved['validator']})
+            else:
+                logger.debug(f"임시 파일 출처를 확인할 수 없음, 처음부터: {partial.name}")
+                _discard_partial(partial, meta)
+                offset = 0
+
+        with self._host_slot(url), \
+                self.session.get(url, headers=request_headers, timeout=timeout,
+                                 stream=True) as response:
+            if response.status_code == 416 and offset:
+                # 임시 파일이 이미 끝까지 받아졌으면 완료 처리, 아니면 버리고 처음부터
+                match = _UNSATISFIED_RANGE.match(response.headers.get('Content-Range', ''))
+                if match and int(match.group(1)) == offset:
+                    os.replace(partial, dest)
+                    meta.unlink(missing_ok=True)
+                    return True
+                _discard_partial(partial, meta)
+                raise requests.exceptions.ConnectionError(f"invalid partial file: {partial.name}")
+            if response.status_code not in (200, 206):
+                return False
+            if content_type and content_type not in response.headers.get('Content-Type', ''):
+                return False
+
+            # 요청한 위치부터 온 206이면 이어쓰기, 서버가 Range를 무시하거나
+            # If-Range 검증자가 맞지 않으면(200) 처음부터
+            if response.status_code == 206:
+                match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                if not (offset and match and int(match.group(1)) == offset):
+                    # 요청하지 않은 구간 - 이어 붙이거나 처음부터로 쓸 수 없으므로 버리고 재시도
+                    _discard_partial(partial, meta)
+                    raise requests.exceptions.ConnectionError(
+                        f"unexpected range: {response.headers.get('Content-Range')}")
+                total = None if match.group(2) == '*' else int(match.group(2))
+                mode = 'ab'
+            else:
+                length = response.headers.get('Content-Length', '')
+                total = int(length) if length.isdigit() else None
+                offset, mode = 0, 'wb'
+                meta.write_text(json.dumps({'url': url, 'validator': _validator(response)}),
+                                encoding='utf-8')
+
+            if max_bytes is not None and total is not None and total > max_bytes:
+                raise DownloadTooLarge(f"{total} bytes > {max_bytes} bytes: {url}")
+
+            size = offset
+            with open(partial, mode) as f:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+                    received[0] += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise DownloadTooLarge(f"> {max_bytes} bytes: {url}")
+                    if progress is not None:
+                        progress(size, total)
+
+        if total is not None and size < total:
+            raise requests.exceptions.ChunkedEncodingError(f"incomplete: {size}/{total} bytes")
+        os.replace(partial, dest)
+        meta.unlink(missing_ok=True)
+        return True
+
+    # ------------------------------------------------------------------
+    # 비동기 API
+    # ------------------------------------------------------------------
+
+    async def arequest(self, method: str, url: str, **kwargs) -> requests.Response:
+        """요청 하나 (코루틴 - 스레드 풀에서 실행되어 이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(self.request, method, url, **kwargs))
+
+    async def aget(self, url: str, **kwargs) -> requests.Response:
+        return await self.arequest('GET', url, **kwargs)
+
+    async def ahead(self, url: str, **kwargs) -> requests.Response:
+        return await self.arequest('HEAD', url, **kwargs)
+
+    async def afetch_all(self, calls: Iterable[Tuple[str, str, Dict]]) -> List:
+        """fetch_all()의 코루틴 버전 (이미 이벤트 루프 안에서 실행 중인 코드용)"""
+        return await asyncio.gather(
+            *(self.arequest(method, url, **kwargs) for method, url, kwargs in calls),
+            return_exceptions=True)
+
+    def fetch_all(self, calls: Iterable[Tuple[str, str, Dict]]) -> List:
+        """
+        요청 여러 개를 동시에 보내고 순서대로 결과 반환
+
+        스레드 풀 Future로 기다리므로 asyncio 이벤트 루프가 실행 중인 코드에서 불러도
+        동작합니다 (다만 기다리는 동안 루프가 멈추므로 코루틴에서는 afetch_all()을 사용).
+
+        Args:
+            calls: (method, url, kwargs) 목록
+
+        Returns:
+            List: 요청별 Response 또는 예외 객체
+        """
+        futures = [self.submit(method, url, **kwargs) for method, url, kwargs in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def close(self):
+        """스레드 풀과 연결 풀 정리"""
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+
+_client: Optional[HTTPClient] = None
+_client_pid: Optional[int] = None
+
+
+def get_client() -> HTTPClient:
+    """프로세스 공유 클라이언트 (fork된 워커 프로세스는 부모 연결을 쓰지 않고 새로 생성)"""
+    global _client, _client_pid
+    if _client is None or _client_pid != os.getpid():
+        _client = HTTPClient()
+        _client_pid = os.getpid()
+    return _client
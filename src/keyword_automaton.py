@@ -0,0 +1,98 @@
+"""다중 키워드 오토마톤 모듈
+
+키워드 집합을 모듈 import 시 한 번만 트라이로 만들고, 트라이를 하나의 정규식으로
+컴파일합니다. 텍스트를 한 번만 훑어 모든 키워드의 출현 위치(겹치는 위치 포함)를 찾으므로
+키워드마다 re.search나 `in` 검사를 반복하지 않습니다.
+
+정규식 엔진은 위치마다 트라이를 따라 한 글자씩 분기하므로 키워드 수와 무관하게
+(가장 긴 키워드 길이만큼만) 비교합니다. 한 위치에서 가장 긴 키워드를 찾으면, 같은 위치에서
+시작하는 더 짧은 키워드(그 키워드의 접두어)는 미리 계산한 목록으로 함께 기록합니다.
+"""
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _node_pattern(node: dict) -> str:
+    """트라이 노드 -> 정규식 (키워드가 끝나는 노드는 더 긴 키워드를 먼저 시도)"""
+    branches = [re.escape(char) + _node_pattern(child)
+                for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if '' in node:
+        pattern = f"(?:{pattern})?"
+    return pattern
+
+
+class KeywordHits:
+    """텍스트 하나의 키워드 출현 위치 (키워드 -> 시작 위치 오름차순)"""
+
+    def __init__(self, offsets: Dict[str, List[int]]):
+        self.offsets = offsets
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.offsets
+
+    def count(self, keyword: str) -> int:
+        """키워드 출현 횟수"""
+        return len(self.offsets.get(keyword, ()))
+
+    def counts(self) -> Dict[str, int]:
+        """키워드별 출현 횟수 (나온 키워드만)"""
+        return {keyword: len(starts) for keyword, starts in self.offsets.items()}
+
+    def any(self, *keywords: str) -> bool:
+        """키워드 중 하나라도 나오는지"""
+        return any(keyword in self.offsets for keyword in keywords)
+
+    def first(self, keyword: str, pos: int = 0) -> Optional[int]:
+        """pos 이후 키워드의 첫 시작 위치 (없으면 None)"""
+        starts = self.offsets.get(keyword)
+        if not starts:
+            return None
+        k = bisect_left(starts, pos)
+        return starts[k] if k < len(starts) else None
+
+
+class KeywordAutomaton:
+    """키워드 집합을 한 번에 찾는 검색기 (키워드는 소문자 리터럴)"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keywords))
+
+        trie = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+        # 겹치는 출현 위치까지 모두 찾도록 lookahead로 감쌈
+        self._regex = re.compile(f"(?=({_node_pattern(trie) or '(?!)'}))")
+
+        # 가장 긴 매치 -> 같은 위치에서 시작하는 키워드 전체 (긴 순)
+        keyword_set = set(self.keywords)
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(keyword[:n] for n in range(len(keyword), 0, -1)
+                           if keyword[:n] in keyword_set)
+            for keyword in self.keywords
+        }
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._prefixes
+
+    def scan(self, text: str, start: int = 0, end: Optional[int] = None) -> KeywordHits:
+        """
+        text[start:end]에서 모든 키워드 출현 위치 찾기 (한 번만 훑음)
+
+        Returns:
+            KeywordHits: 위치는 text 기준 오프셋
+        """
+        offsets: Dict[str, List[int]] = {}
+        matches = (self._regex.finditer(text, start) if end is None
+                   else self._regex.finditer(text, start, end))
+        for m in matches:
+            pos = m.start()
+            for keyword in self._prefixes[m.group(1)]:
+                offsets.setdefault(keyword, []).append(pos)
+        return KeywordHits(offsets)
@@ -0,0 +1,50 @@
+"""프로세스 메모리 사용량 측정 모듈
+
+문서 하나를 처리하는 동안의 최대 RSS를 재기 위해 Linux에서는 최대값(VmHWM)을
+문서 시작 시 초기화하고(/proc/self/clear_refs), 그 외 환경에서는 프로세스 전체
+최대값(getrusage)을 사용합니다.
+"""
+import platform
+import resource
+
+_STATUS = "/proc/self/status"
+_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def _read_status_kb(key: str):
+    """/proc/self/status 항목 값 (kB, 없으면 None)"""
+    try:
+        with open(_STATUS) as f:
+            for line in f:
+                if line.startswith(key + ':'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def reset_peak_rss() -> bool:
+    """
+    최대 RSS 초기화 (Linux 4.0 이상)
+
+    Returns:
+        bool: 초기화 성공 여부 (실패 시 peak_rss_mb는 프로세스 전체 최대값)
+    """
+    try:
+        with open(_CLEAR_REFS, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """마지막 초기화 이후(또는 프로세스 시작 이후) 최대 RSS (MB)"""
+    peak_kb = _read_status_kb('VmHWM')
+    if peak_kb is not None:
+        return peak_kb / 1024
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if platform.system() == 'Darwin' else peak / 1024
+
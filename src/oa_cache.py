@@ -0,0 +1,105 @@
+"""Unpaywall 오픈액세스 상태 캐시 모듈
+
+DOI별 Unpaywall 조회 결과(is_oa, 최적 PDF URL, 확인 시각)를 SQLite에 저장합니다.
+- OA PDF URL을 아는 DOI는 Unpaywall을 다시 묻지 않고 바로 PDF를 받음
+- OA PDF가 없는 것으로 확인된 DOI(비공개, Unpaywall에 없음)는 조회를 건너뛰고 다음 경로로 감
+- 캐시된 OA PDF URL로 다운로드가 실패하면 항목을 지우고 Unpaywall을 다시 조회 (invalidate)
+- 재확인 주기: 확인 시각 기준으로 판단하므로 주기를 바꾸면 기존 항목에도 바로 적용
+  (엠바고 해제 등으로 비공개 -> 공개가 될 수 있어 비공개 DOI는 더 자주 재확인)
+"""
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from src.crossref_cache import normalize_doi
+from src.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_NAME = "unpaywall_oa.sqlite"
+DEFAULT_OPEN_RECHECK_DAYS = 90      # OA PDF URL을 아는 DOI
+DEFAULT_CLOSED_RECHECK_DAYS = 30    # OA PDF가 없는 DOI
+
+
+class OAStatus(NamedTuple):
+    """DOI 하나의 오픈액세스 상태"""
+    is_oa: bool
+    pdf_url: Optional[str]  # best_oa_location의 PDF URL (없으면 None)
+    checked_at: float
+
+
+def parse_unpaywall(data: dict) -> OAStatus:
+    """Unpaywall v2 응답 -> OAStatus"""
+    best = data.get('best_oa_location') or {}
+    pdf_url = best.get('url_for_pdf') if data.get('is_oa') else None
+    return OAStatus(bool(data.get('is_oa')), pdf_url, time.time())
+
+
+class OACache(SQLiteCache):
+    """DOI -> Unpaywall OA 상태 SQLite 캐시 (OA PDF 유무별 재확인 주기)"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS oa_status (
+        doi TEXT PRIMARY KEY,
+        is_oa INTEGER NOT NULL,
+        pdf_url TEXT,
+        checked_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, db_path: Path,
+                 open_recheck_days: float = DEFAULT_OPEN_RECHECK_DAYS,
+                 closed_recheck_days: float = DEFAULT_CLOSED_RECHECK_DAYS):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            open_recheck_days: OA PDF URL을 아는 DOI 재확인 주기 (일)
+            closed_recheck_days: OA PDF가 없는 DOI 재확인 주기 (일, 0이면 매번 확인)
+        """
+        super().__init__(db_path)
+        self.open_recheck = open_recheck_days * 24 * 3600
+        self.closed_recheck = closed_recheck_days * 24 * 3600
+
+    def get(self, doi: str) -> Optional[OAStatus]:
+        """캐시된 OA 상태 (없거나 재확인 주기가 지났으면 None)"""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT is_oa, pdf_url, checked_at FROM oa_status WHERE doi = ?",
+                    (normalize_doi(doi),)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"OA 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+
+        status = OAStatus(bool(row[0]), row[1], row[2])
+        recheck = self.open_recheck if status.pdf_url else self.closed_recheck
+        if time.time() - status.checked_at >= recheck:
+            return None
+        return status
+
+    def put(self, doi: str, status: OAStatus):
+        """OA 상태 저장"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO oa_status (doi, is_oa, pdf_url, checked_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (normalize_doi(doi), int(status.is_oa), status.pdf_url, status.checked_at))
+        except sqlite3.Error as e:
+            logger.debug(f"OA 캐시 저장 실패: {e}")
+
+    def invalidate(self, doi: str):
+        """OA 상태 삭제 (캐시된 PDF URL이 더 이상 동작하지 않을 때 - 다음 조회는 Unpaywall로)"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute("DELETE FROM oa_status WHERE doi = ?", (normalize_doi(doi),))
+        except sqlite3.Error as e:
+            logger.debug(f"OA 캐시 삭제 실패: {e}")
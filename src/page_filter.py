@@ -0,0 +1,215 @@
+"""이미지 전용/상투 페이지 판별 모듈
+
+레이아웃 분석(extract_text/extract_tables) 전에 페이지 문자 수, 이미지 면적 비율,
+페이지 텍스트 지문(해시)만으로 건너뛸 페이지를 판별합니다.
+- image: 스캔 페이지, 그림만 있는 페이지, 빈 페이지 (추출할 텍스트가 거의 없음)
+- boilerplate: 여러 논문에 똑같이 반복되는 저널 표지/라이선스 페이지
+
+상투 페이지 지문은 처리한 문서들에서 학습하여(BOILERPLATE_MIN_DOCS개 이상의 서로 다른
+문서에 나온 페이지) 파일에 저장하고, 다른 워커/다음 실행과 공유합니다.
+- 문자가 BOILERPLATE_MAX_CHARS 이하인 짧은 페이지만 학습/판정 (본문 페이지는 상투 페이지가 될 수 없음)
+- 문서는 파일 해시가 아니라 DOI(없으면 제목 줄)로 셈 (같은 논문의 다른 사본/SI 파일은 한 문서)
+- 학습한 지문은 BOILERPLATE_EXPIRE_DAYS가 지나면 버리고 다시 학습 (reset()으로 전체 초기화)
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BOILERPLATE_PATH = Path(__file__).parent.parent / "pdf" / "cache" / "boilerplate_pages.json"
+
+MIN_PAGE_CHARS = 40          # 이보다 문자가 적으면 빈 페이지/스캔 페이지
+IMAGE_PAGE_MAX_CHARS = 200   # 이보다 문자가 적고
+IMAGE_COVERAGE = 0.7         # 이미지가 페이지의 이 비율 이상을 덮으면 그림/스캔 페이지
+BOILERPLATE_MIN_DOCS = 3     # 이 수 이상의 서로 다른 문서에 나온 페이지는 상투 페이지
+BOILERPLATE_MAX_CHARS = 2500  # 이보다 문자가 많은 페이지는 본문으로 보고 학습/판정하지 않음
+BOILERPLATE_EXPIRE_DAYS = 180  # 학습한 상투 페이지 지문 유효 기간 (일)
+MAX_TRACKED_PAGES = 20000    # 학습용으로 세는 지문 최대 개수 (초과 시 적게 나온 것부터 제거)
+MAX_TRACKED_DOCS = 50000     # 이미 센 문서 ID 최대 개수 (같은 문서를 다시 처리해도 한 번만 셈)
+SAVE_EVERY = 10              # 문서 이 수마다 학습 결과 저장
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+_DOI = re.compile(r'\b(10\.\d{4,9}/[^\s"<>]+)', re.IGNORECASE)
+DOCUMENT_KEY_PAGES = 3       # DOI/제목을 찾을 앞쪽 페이지 수
+MIN_TITLE_CHARS = 20         # 제목 줄로 인정할 최소 영숫자 수
+
+
+def page_fingerprint(text: str) -> str:
+    """페이지 텍스트 지문 (소문자 영숫자만 남긴 SHA-1 - 공백/구두점/추출 순서 차이 무시)"""
+    return hashlib.sha1(_NON_ALNUM.sub('', text.lower()).encode('utf-8')).hexdigest()
+
+
+def document_key(texts: Iterable[Optional[str]], fallback: str) -> str:
+    """
+    상투 페이지 학습용 문서 ID (같은 논문의 바이트가 다른 사본/SI 파일을 한 문서로 셈)
+
+    앞쪽 페이지의 첫 DOI, 없으면 첫 페이지 제목 줄(첫 번째 긴 줄), 둘 다 없으면 fallback
+
+    Args:
+        texts: 페이지 순서의 페이지 텍스트 (건너뛴 페이지는 None)
+        fallback: DOI/제목을 찾지 못했을 때 쓸 ID (파일 해시 등)
+    """
+    texts = [text for text in texts if text][:DOCUMENT_KEY_PAGES]
+    for text in texts:
+        match = _DOI.search(text)
+        if match:
+            return f"doi:{match.group(1).rstrip('.,;)').lower()}"
+    for line in (texts[0].splitlines() if texts else []):
+        title = _NON_ALNUM.sub('', line.lower())
+        if len(title) >= MIN_TITLE_CHARS:
+            return f"title:{title}"
+    return fallback
+
+
+def image_coverage(page) -> float:
+    """페이지 면적 중 이미지가 덮는 비율 (겹침은 중복 계산, 최대 1)"""
+    page_area = float(page.width * page.height) or 1.0
+    covered = sum(max(0.0, image['x1'] - image['x0']) * max(0.0, image['bottom'] - image['top'])
+                  for image in page.images)
+    return min(1.0, covered / page_area)
+
+
+class PageFilter:
+    """레이아웃 분석 전 건너뛸 페이지 판별기 (상투 페이지 지문 학습 포함)"""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_BOILERPLATE_PATH,
+                 min_docs: int = BOILERPLATE_MIN_DOCS,
+                 expire_days: float = BOILERPLATE_EXPIRE_DAYS):
+        """
+        Args:
+            path: 상투 페이지 지문 파일 (None이면 저장하지 않음)
+            min_docs: 상투 페이지로 판정할 최소 문서 수
+            expire_days: 학습한 지문 유효 기간 (일, 지나면 버리고 다시 학습)
+        """
+        self.path = Path(path) if path is not None else None
+        self.min_docs = min_docs
+        self.expire = expire_days * 24 * 3600
+        self.known: Dict[str, float] = {}   # 상투 페이지 지문 -> 등록 시각
+        self.seen: Dict[str, int] = {}      # 지문 -> 나온 문서 수 (학습 중)
+        self.docs: List[str] = []           # 이미 센 문서 ID (오래된 순)
+        self._unsaved = 0
+
+        if self.path is not None:
+            self.known, self.seen, self.docs = self._load()
+        self._doc_set = set(self.docs)
+
+    def _load(self) -> Tuple[Dict[str, float], Dict[str, int], List[str]]:
+        try:
+            saved = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}, {}, []
+        except (OSError, ValueError) as e:
+            logger.debug(f"상투 페이지 파일 손상, 무시: {self.path} ({e})")
+            return {}, {}, []
+
+        known = saved.get('known', {})
+        if isinstance(known, list):
+            # 등록 시각이 없던 이전 형식은 지금부터 유효 기간을 셈
+            known = dict.fromkeys(known, time.time())
+        cutoff = time.time() - self.expire
+        known = {fingerprint: learned_at for fingerprint, learned_at in known.items()
+                 if learned_at > cutoff}
+        return known, dict(saved.get('seen', {})), list(saved.get('docs', []))
+
+    def reset(self):
+        """학습한 상투 페이지 지문과 학습 기록을 모두 지우고 파일도 비움"""
+        self.known, self.seen, self.docs = {}, {}, []
+        self._doc_set = set()
+        if self.path is not None:
+            self._write()
+        logger.info("📑 상투 페이지 학습 초기화")
+
+    def classify(self, page) -> Tuple[Optional[str], str]:
+        """
+        pdfplumber 페이지 판별 (문자/이미지 객체만 사용, 레이아웃 분석 없음)
+
+        Returns:
+            (건너뛸 이유 또는 None, 페이지 지문 - 본문 분량 페이지는 None)
+        """
+        chars = page.chars
+        if len(chars) < MIN_PAGE_CHARS:
+            return 'image', None
+        if len(chars) < IMAGE_PAGE_MAX_CHARS and image_coverage(page) >= IMAGE_COVERAGE:
+            return 'image', None
+        if len(chars) > BOILERPLATE_MAX_CHARS:
+            return None, None
+
+        fingerprint = page_fingerprint("".join(char.get('text', '') for char in chars))
+        if fingerprint in self.known:
+            return 'boilerplate', fingerprint
+        return None, fingerprint
+
+    def observe(self, doc_id: str, fingerprints: Iterable[Optional[str]]):
+        """
+        문서 하나의 페이지 지문 기록 (여러 문서에 반복되면 상투 페이지로 등록)
+
+        Args:
+            doc_id: 문서 ID (document_key() - 이미 센 문서는 다시 세지 않음)
+            fingerprints: 한 문서의 페이지 지문 (None은 무시)
+        """
+        if doc_id in self._doc_set:
+            return
+        self._doc_set.add(doc_id)
+        self.docs.append(doc_id)
+
+        promoted = 0
+        now = time.time()
+        for fingerprint in set(fingerprints) - {None}:
+            if fingerprint in self.known:
+                continue
+            count = self.seen.get(fingerprint, 0) + 1
+            if count >= self.min_docs:
+                self.known[fingerprint] = now
+                self.seen.pop(fingerprint, None)
+                promoted += 1
+            else:
+                self.seen[fingerprint] = count
+
+        if promoted:
+            logger.info(f"📑 상투 페이지 {promoted}개 등록 (총 {len(self.known)}개)")
+
+        if len(self.seen) > MAX_TRACKED_PAGES:
+            kept = sorted(self.seen.items(), key=lambda item: -item[1])[:MAX_TRACKED_PAGES // 2]
+            self.seen = dict(kept)
+        if len(self.docs) > MAX_TRACKED_DOCS:
+            self.docs = self.docs[-(MAX_TRACKED_DOCS // 2):]
+            self._doc_set = set(self.docs)
+
+        self._unsaved += 1
+        if promoted or self._unsaved >= SAVE_EVERY:
+            self.save()
+
+    def save(self):
+        """지문 파일 저장 (다른 워커가 저장한 내용과 병합, 임시 파일에 쓴 뒤 교체)"""
+        if self.path is None:
+            return
+        known, seen, docs = self._load()
+        for fingerprint, learned_at in known.items():
+            self.known[fingerprint] = max(learned_at, self.known.get(fingerprint, 0.0))
+        for fingerprint in self.known:
+            self.seen.pop(fingerprint, None)
+        for fingerprint, count in seen.items():
+            if fingerprint not in self.known:
+                self.seen[fingerprint] = max(count, self.seen.get(fingerprint, 0))
+        new_docs = [doc_id for doc_id in docs if doc_id not in self._doc_set]
+        self.docs = new_docs + self.docs
+        self._doc_set.update(new_docs)
+        self._write()
+
+    def _write(self):
+        """지문 파일 쓰기 (임시 파일에 쓴 뒤 교체)"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({'known': self.known, 'seen': self.seen,
+                                            'docs': self.docs}), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+            self._unsaved = 0
+        except OSError as e:
+            logger.debug(f"상투 페이지 파일 저장 실패: {e}")
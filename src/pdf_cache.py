@@ -0,0 +1,192 @@
+"""PDF 파싱 결과 디스크 캐시 모듈
+
+PDF 파일 내용의 SHA-256을 키로 페이지 텍스트(원문 + 정규화 텍스트)와 표를 압축 JSON으로 저장합니다.
+같은 PDF를 다시 처리할 때 pdfplumber 파싱을 건너뛸 수 있습니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import List, Optional
+
+from src.pdf_pages import PageContent
+from src.text_backends import PDFPLUMBER
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "pdf" / "cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+
+class PDFParseCache:
+    """SHA-256 키 기반 PDF 파싱 결과 캐시 (용량 제한 + LRU 제거)"""
+
+    # 저장 형식이 바뀌면 올려서 기존 항목을 무효화
+    FORMAT_VERSION = 2
+    SUFFIX = ".json.z"
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 파일 저장 디렉토리
+            max_bytes: 캐시 전체 최대 크기 (초과 시 오래 사용되지 않은 항목부터 삭제)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def file_digest(pdf_path: Path) -> str:
+        """PDF 파일 내용의 SHA-256 해시"""
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}{self.SUFFIX}"
+
+    def _read_entry(self, digest: str) -> Optional[dict]:
+        """캐시 항목 읽기 (없거나 손상되었으면 None)"""
+        path = self._entry_path(digest)
+        try:
+            entry = json.loads(zlib.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"캐시 항목 손상, 무시: {path.name} ({e})")
+            return None
+
+        if entry.get('version') != self.FORMAT_VERSION:
+            return None
+        return entry
+
+    def get(self, digest: str, want_text: bool = True, want_tables: bool = True,
+            table_gate: bool = False, text_backend: str = PDFPLUMBER,
+            page_filter: bool = False, allow_partial: bool = False) -> Optional[List[PageContent]]:
+        """
+        캐시된 페이지 조회
+
+        Args:
+            digest: PDF SHA-256
+            want_text: 텍스트가 필요한지 여부
+            want_tables: 표가 필요한지 여부
+            table_gate: 표 키워드 페이지만 탐지한 결과도 허용하는지 여부
+            text_backend: 텍스트 추출 엔진 (다른 엔진으로 추출한 텍스트는 사용하지 않음)
+            page_filter: 이미지/상투 페이지를 건너뛴 결과도 허용하는지 여부
+            allow_partial: 앞쪽 페이지만 저장된 항목(스트리밍 중단)도 허용하는지 여부
+
+        Returns:
+            List[PageContent]: 필요한 항목이 모두 캐시되어 있으면 페이지 목록, 아니면 None
+        """
+        entry = self._read_entry(digest)
+        if entry is None:
+            return None
+        if (want_text and not entry['has_text']) or (want_tables and not entry['has_tables']):
+            return None
+        # 일부 페이지만 표 탐지한 항목은 전체 페이지 표 요청을 만족하지 못함
+        if want_tables and entry.get('tables_gated') and not table_gate:
+            return None
+        if want_text and entry.get('text_backend', PDFPLUMBER) != text_backend:
+            return None
+        if entry.get('pages_filtered') and not page_filter:
+            return None
+        if not entry.get('complete', True) and not allow_partial:
+            return None
+
+        # LRU: 사용 시각 갱신
+        try:
+            os.utime(self._entry_path(digest))
+        except OSError:
+            pass
+
+        return [PageContent(page_num=page_num, text=text, tables=tables, normalized=normalized)
+                for page_num, text, tables, normalized in entry['pages']]
+
+    def put(self, digest: str, pages: List[PageContent],
+            has_text: bool = True, has_tables: bool = True, table_gate: bool = False,
+            text_backend: str = PDFPLUMBER, page_filter: bool = False, complete: bool = True):
+        """
+        페이지 파싱 결과 저장 (기존 항목이 있으면 텍스트/표를 병합)
+
+        Args:
+            digest: PDF SHA-256
+            pages: 페이지 파싱 결과
+            has_text: pages에 텍스트가 포함되어 있는지 여부
+            has_tables: pages에 표가 포함되어 있는지 여부
+            table_gate: 표 키워드 페이지만 표를 탐지했는지 여부
+            text_backend: 텍스트 추출 엔진
+            page_filter: 이미지/상투 페이지를 건너뛰었는지 여부
+            complete: 모든 페이지인지 여부 (False면 스트리밍이 중단된 앞쪽 페이지만)
+        """
+        rows = [[page.page_num, page.text, page.tables, page.normalized] for page in pages]
+        tables_gated = has_tables and table_gate
+        pages_filtered = page_filter
+
+        existing = self._read_entry(digest)
+        if not complete and existing and existing.get('complete', True):
+            return  # 전체 페이지 항목을 일부 페이지로 덮어쓰지 않음
+        if existing and len(existing['pages']) == len(rows) and existing.get('complete', True):
+            for row, old in zip(rows, existing['pages']):
+                if not has_text:
+                    row[1], row[3] = old[1], old[3]
+                if not has_tables:
+                    row[2] = old[2]
+            if not has_tables:
+                tables_gated = existing.get('tables_gated', False)
+            if not has_text:
+                text_backend = existing.get('text_backend', PDFPLUMBER)
+            pages_filtered = pages_filtered or existing.get('pages_filtered', False)
+            has_text = has_text or existing['has_text']
+            has_tables = has_tables or existing['has_tables']
+
+        entry = {
+            'version': self.FORMAT_VERSION,
+            'has_text': has_text,
+            'has_tables': has_tables,
+            'tables_gated': tables_gated,
+            'text_backend': text_backend,
+            'pages_filtered': pages_filtered,
+            'complete': complete,
+            'pages': rows,
+        }
+        payload = zlib.compress(
+            json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 6
+        )
+
+        # 임시 파일에 쓴 뒤 교체 (여러 워커가 동시에 써도 안전)
+        path = self._entry_path(digest)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+
+        self._evict()
+
+    def _evict(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목부터 삭제"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            logger.debug(f"🗑️ 캐시 제거: {path.name}")
+            if total <= self.max_bytes:
+                break
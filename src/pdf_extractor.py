@@ -1,14 +1,26 @@
 """PDF를 텍스트로 추출하는 스크립트"""
-import pdfplumber
+import sys
 from pathlib import Path
 
-def extract_pdf_to_text(pdf_path, output_path=None):
+# 프로젝트 루트 추가 (python src/pdf_extractor.py 직접 실행 지원)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.pdf_pages import walk_pages
+from src.pdf_cache import PDFParseCache
+
+def extract_pdf_to_text(pdf_path, output_path=None, use_cache=True, workers=None,
+                        text_backend=None):
     """
     PDF 파일에서 텍스트를 추출합니다.
     
     Args:
         pdf_path: PDF 파일 경로
         output_path: 출력 텍스트 파일 경로 (None이면 자동 생성)
+        use_cache: 파싱 결과 캐시 사용 여부 (pdf/cache)
+        workers: 페이지 병렬 파싱 프로세스 수 (None이면 CPU 코어 수, 1이면 순차)
+        text_backend: 텍스트 추출 엔진 ('pdfplumber', 'pdfium', 'pymupdf', 'auto',
+                      None이면 환경 변수 PDF_TEXT_BACKEND)
     """
     pdf_path = Path(pdf_path)
     
@@ -17,34 +29,41 @@ def extract_pdf_to_text(pdf_path, output_path=None):
     
     print(f"📄 PDF 파일 읽는 중: {pdf_path.name}")
     
+    shown_total = False
+    
+    def show_progress(done_pages, total_pages):
+        nonlocal shown_total
+        if not shown_total:
+            print(f"📊 총 페이지 수: {total_pages}")
+            shown_total = True
+        print(f"  처리 중: {done_pages}/{total_pages} 페이지...", end='\r')
+    
+    cache = PDFParseCache() if use_cache else None
+    pages = walk_pages(pdf_path, progress=show_progress, cache=cache, workers=workers,
+                       text_backend=text_backend)
+    
     all_text = []
     
-    with pdfplumber.open(pdf_path) as pdf:
-        total_pages = len(pdf.pages)
-        print(f"📊 총 페이지 수: {total_pages}")
+    for page in pages:
+        i = page.page_num
+        
+        # 텍스트
+        if page.text:
+            all_text.append(f"\n{'='*80}\n")
+            all_text.append(f"PAGE {i}\n")
+            all_text.append(f"{'='*80}\n\n")
+            all_text.append(page.text)
+            all_text.append("\n\n")
         
-        for i, page in enumerate(pdf.pages, 1):
-            print(f"  처리 중: {i}/{total_pages} 페이지...", end='\r')
-            
-            # 텍스트 추출
-            text = page.extract_text()
-            if text:
-                all_text.append(f"\n{'='*80}\n")
-                all_text.append(f"PAGE {i}\n")
-                all_text.append(f"{'='*80}\n\n")
-                all_text.append(text)
-                all_text.append("\n\n")
-            
-            # 표 추출
-            tables = page.extract_tables()
-            if tables:
-                all_text.append(f"\n--- Tables on Page {i} ---\n")
-                for j, table in enumerate(tables, 1):
-                    all_text.append(f"\nTable {j}:\n")
-                    for row in table:
-                        all_text.append(" | ".join(str(cell) if cell else "" for cell in row))
-                        all_text.append("\n")
+        # 표
+        if page.tables:
+            all_text.append(f"\n--- Tables on Page {i} ---\n")
+            for j, table in enumerate(page.tables, 1):
+                all_text.append(f"\nTable {j}:\n")
+                for row in table:
+                    all_text.append(" | ".join(str(cell) if cell else "" for cell in row))
                     all_text.append("\n")
+                all_text.append("\n")
     
     print(f"\n✅ 텍스트 추출 완료!")
     
@@ -0,0 +1,349 @@
+"""PDF 페이지 순회 모듈
+
+pdfplumber로 문서를 한 번만 열고, 페이지마다 레이아웃 분석을 한 번만 수행하여
+텍스트와 표를 함께 추출합니다.
+"""
+import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+import pdfplumber
+
+from src.table_model import PROPERTY_TABLE_KEYWORDS, SYNTHESIS_TABLE_KEYWORDS
+from src.text_backends import PDFPLUMBER, open_text_document, resolve_backend
+from src.text_normalize import NormalizedText, normalize_text
+
+logger = logging.getLogger(__name__)
+
+# 이 페이지 수 이상이면 페이지를 여러 프로세스로 나누어 파싱
+PARALLEL_MIN_PAGES = 40
+
+_WHITESPACE = re.compile(r'\s+')
+
+# 표 탐지 전 페이지 선별 키워드 (표 파서의 관련 표 판정 키워드에서 생성, 공백 제거 소문자)
+# 표 파서가 받아들이는 표는 페이지 선별에서도 항상 통과하도록 같은 목록을 씀
+TABLE_PAGE_KEYWORDS = tuple(dict.fromkeys(
+    _WHITESPACE.sub('', keyword) for keyword in SYNTHESIS_TABLE_KEYWORDS + PROPERTY_TABLE_KEYWORDS))
+# 이 개수 이상의 서로 다른 키워드가 있는 페이지만 extract_tables() 실행
+TABLE_PAGE_MIN_SCORE = 1
+
+
+@dataclass
+class PageContent:
+    """한 페이지의 파싱 결과"""
+    page_num: int
+    text: Optional[str] = None
+    tables: list = field(default_factory=list)
+    table_skipped: bool = False  # 표 키워드가 없어 표 탐지를 생략한 페이지
+    text_time: float = 0.0       # 텍스트 추출 실행 시간 (초, 캐시에서 읽으면 0)
+    table_time: float = 0.0      # extract_tables() 실행 시간 (초, 캐시에서 읽으면 0)
+    skip_reason: Optional[str] = None  # 'image' / 'boilerplate'면 파싱하지 않은 페이지
+    fingerprint: Optional[str] = None  # 페이지 텍스트 지문 (상투 페이지 학습용)
+    normalized: Optional[str] = None   # 필드 추출용 정규화 텍스트 (텍스트와 함께 캐시)
+
+
+def walk_pages(
+    pdf_path: Path,
+    want_text: bool = True,
+    want_tables: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+    cache=None,
+    workers: int = 1,
+    parallel_min_pages: int = PARALLEL_MIN_PAGES,
+    table_gate: bool = False,
+    low_memory: bool = False,
+    text_backend: Optional[str] = None,
+    page_filter=None
+) -> List[PageContent]:
+    """
+    PDF의 각 페이지를 한 번씩 파싱하여 텍스트와 표를 함께 반환합니다.
+
+    같은 page 객체에서 extract_text()와 extract_tables()를 호출하므로
+    pdfminer 레이아웃 분석 결과가 페이지당 한 번만 계산됩니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+        want_text: 페이지 텍스트 추출 여부
+        want_tables: 페이지 표 추출 여부
+        progress: 페이지 처리 후 호출되는 콜백 (page_num, total_pages)
+        cache: PDFParseCache (지정 시 파싱 전에 캐시 확인, 파싱 후 저장)
+        workers: 페이지 병렬 파싱 프로세스 수 (1이면 항상 순차, None이면 CPU 코어 수,
+            2 이상이면 페이지 수를 센 문서를 작은 PDF의 순차 파싱에 그대로 사용)
+        parallel_min_pages: 병렬 파싱으로 전환하는 최소 페이지 수
+        table_gate: True면 표 키워드가 있는 페이지만 표 탐지 (그림/참고문헌 페이지 생략)
+        low_memory: True면 페이지마다 pdfminer 문서 객체 캐시까지 비워 페이지 수와
+            무관하게 메모리 사용량을 일정하게 유지 (같은 객체를 다시 읽는 비용 발생)
+        text_backend: 텍스트 추출 엔진 ('pdfplumber', 'pdfium', 'pymupdf', 'auto',
+            None이면 환경 변수 PDF_TEXT_BACKEND) - 표는 항상 pdfplumber
+        page_filter: PageFilter (지정 시 이미지 전용/상투 페이지는 레이아웃 분석 없이 건너뜀)
+
+    Returns:
+        List[PageContent]: 페이지 순서대로 정렬된 파싱 결과
+    """
+    text_backend = resolve_backend(text_backend) if want_text else PDFPLUMBER
+
+    digest = None
+    if cache is not None:
+        digest = cache.file_digest(pdf_path)
+        cached = cache.get(digest, want_text=want_text, want_tables=want_tables,
+                           table_gate=table_gate, text_backend=text_backend,
+                           page_filter=page_filter is not None)
+        if cached is not None:
+            logger.debug(f"⚡ 파싱 캐시 사용: {Path(pdf_path).name}")
+            return cached
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1:
+        with pdfplumber.open(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
+            if total_pages < parallel_min_pages:
+                # 페이지 수를 센 문서로 바로 순차 파싱 (다시 열지 않음)
+                pages = list(iter_pages(pdf_path, want_text, want_tables, progress, table_gate,
+                                        low_memory, text_backend, page_filter=page_filter,
+                                        pdf=pdf))
+        if total_pages >= parallel_min_pages:
+            pages = _parse_pages_parallel(pdf_path, want_text, want_tables,
+                                          progress, total_pages, workers, table_gate,
+                                          low_memory, text_backend, page_filter)
+    else:
+        pages = _parse_pages(pdf_path, want_text, want_tables, progress, table_gate,
+                             low_memory, text_backend, page_filter)
+
+    skipped = [page for page in pages if page.skip_reason]
+    if skipped:
+        logger.debug(f"이미지/상투 페이지 {len(skipped)}/{len(pages)}개 건너뜀")
+
+    if want_tables and table_gate:
+        skipped = sum(1 for page in pages if page.table_skipped)
+        if skipped:
+            logger.debug(f"표 키워드 없는 페이지 {skipped}/{len(pages)}개 표 탐지 생략")
+
+    if cache is not None:
+        try:
+            cache.put(digest, pages, has_text=want_text, has_tables=want_tables,
+                      table_gate=table_gate, text_backend=text_backend,
+                      page_filter=page_filter is not None)
+        except OSError as e:
+            logger.debug(f"파싱 캐시 저장 실패: {e}")
+
+    return pages
+
+
+def table_page_score(text: str) -> int:
+    """페이지 텍스트에 나오는 서로 다른 표 키워드 수"""
+    compact = _WHITESPACE.sub('', text).lower()
+    return sum(1 for keyword in TABLE_PAGE_KEYWORDS if keyword in compact)
+
+
+def _page_chars_text(page) -> str:
+    """레이아웃 분석 없이 페이지 문자만 이어 붙인 텍스트 (표 선별용)"""
+    return "".join(char.get('text', '') for char in page.chars)
+
+
+def _release_page(pdf, page, low_memory: bool):
+    """
+    파싱이 끝난 페이지의 캐시 해제
+
+    pdfplumber는 한 번 접근한 페이지의 레이아웃/문자 객체를 문서가 닫힐 때까지 보관하므로
+    페이지마다 바로 닫습니다. low_memory면 pdfminer 문서 객체 캐시(해독된 스트림 등)도
+    비웁니다 - 다음 페이지에서 필요하면 다시 읽습니다.
+    """
+    page.close()
+    if low_memory:
+        for name in ('_cached_objs', '_parsed_objs'):
+            cache = getattr(pdf.doc, name, None)
+            if cache is not None:
+                cache.clear()
+
+
+def _parse_page(page, page_num: int, want_text: bool, want_tables: bool,
+                table_gate: bool = False, text_doc=None, page_filter=None) -> PageContent:
+    """
+    페이지 하나를 파싱
+
+    Args:
+        page: pdfplumber 페이지 (표가 필요 없고 text_doc이 있으면 None 가능)
+        text_doc: 텍스트 엔진 문서 (None이면 pdfplumber로 텍스트 추출)
+        page_filter: PageFilter (이미지 전용/상투 페이지면 텍스트/표 추출 생략)
+    """
+    content = PageContent(page_num=page_num)
+
+    if page is not None and page_filter is not None:
+        content.skip_reason, content.fingerprint = page_filter.classify(page)
+        if content.skip_reason:
+            return content
+
+    if want_text:
+        start = time.perf_counter()
+        if text_doc is not None:
+            content.text = text_doc.page_text(page_num - 1)
+        else:
+            content.text = page.extract_text()
+        if content.text:
+            content.normalized = normalize_text(content.text)
+        content.text_time = time.perf_counter() - start
+
+    if want_tables and table_gate:
+        # 표 탐지가 가장 비싸므로 키워드 점수가 낮은 페이지는 생략
+        # (텍스트를 이미 추출했으면 재사용, 아니면 문자만 이어 붙여 판정)
+        gate_text = content.text if content.text is not None else _page_chars_text(page)
+        if table_page_score(gate_text) < TABLE_PAGE_MIN_SCORE:
+            content.table_skipped = True
+            return content
+
+    if want_tables:
+        # 표 인식 실패가 텍스트 결과까지 버리지 않도록 페이지 단위로 처리
+        start = time.perf_counter()
+        try:
+            content.tables = page.extract_tables() or []
+        except Exception as e:
+            logger.debug(f"페이지 {page_num} 표 추출 실패: {e}")
+        content.table_time = time.perf_counter() - start
+
+    return content
+
+
+def iter_pages(
+    pdf_path: Path,
+    want_text: bool = True,
+    want_tables: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+    table_gate: bool = False,
+    low_memory: bool = False,
+    text_backend: str = PDFPLUMBER,
+    start: int = 0,
+    stop: Optional[int] = None,
+    page_filter=None,
+    pdf=None
+) -> Iterator[PageContent]:
+    """
+    PDF 페이지를 앞에서부터 하나씩 파싱하여 반환하는 제너레이터
+
+    필요한 만큼만 읽고 중단하면(close 또는 break) 나머지 페이지는 파싱하지 않고
+    문서도 바로 닫힙니다. 캐시와 병렬 파싱은 적용되지 않습니다.
+    텍스트 엔진이 pdfplumber가 아니고 표가 필요 없으면 pdfplumber로 문서를 열지 않습니다
+    (이 경우 page_filter는 적용되지 않음 - 네이티브 엔진은 페이지 판별보다 빠름).
+
+    Args:
+        text_backend: 텍스트 추출 엔진 이름 (src.text_backends)
+        start, stop: 파싱할 페이지 구간 [start, stop) (0부터, stop이 None이면 끝까지)
+        page_filter: PageFilter (이미지 전용/상투 페이지 건너뛰기)
+        pdf: 이미 연 pdfplumber 문서 (지정 시 다시 열지 않고 닫지도 않음)
+    """
+    text_doc = open_text_document(text_backend, pdf_path) if want_text else None
+    try:
+        if text_doc is not None and not want_tables:
+            total_pages = len(text_doc)
+            for index in range(start, total_pages if stop is None else stop):
+                yield _parse_page(None, index + 1, want_text, False, text_doc=text_doc)
+                if progress:
+                    progress(index + 1, total_pages)
+            return
+
+        with nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
+
+            for index in range(start, total_pages if stop is None else stop):
+                page = pdf.pages[index]
+                content = _parse_page(page, index + 1, want_text, want_tables, table_gate,
+                                      text_doc, page_filter)
+                _release_page(pdf, page, low_memory)
+                yield content
+
+                if progress:
+                    progress(index + 1, total_pages)
+    finally:
+        if text_doc is not None:
+            text_doc.close()
+
+
+def _parse_pages(pdf_path: Path, want_text: bool, want_tables: bool,
+                 progress: Optional[Callable[[int, int], None]],
+                 table_gate: bool = False, low_memory: bool = False,
+                 text_backend: str = PDFPLUMBER, page_filter=None) -> List[PageContent]:
+    """전체 페이지를 순서대로 파싱"""
+    return list(iter_pages(pdf_path, want_text, want_tables, progress, table_gate, low_memory,
+                           text_backend, page_filter=page_filter))
+
+
+def _parse_page_range(pdf_path: Path, start: int, stop: int,
+                      want_text: bool, want_tables: bool,
+                      table_gate: bool = False, low_memory: bool = False,
+                      text_backend: str = PDFPLUMBER, page_filter=None) -> List[PageContent]:
+    """
+    페이지 구간 [start, stop) 파싱 (프로세스 풀 작업 단위)
+
+    각 프로세스가 문서를 따로 열어 자신이 맡은 페이지만 파싱합니다.
+    """
+    return list(iter_pages(pdf_path, want_text, want_tables, None, table_gate, low_memory,
+                           text_backend, start, stop, page_filter))
+
+
+def _parse_pages_parallel(pdf_path: Path, want_text: bool, want_tables: bool,
+                          progress: Optional[Callable[[int, int], None]],
+                          total_pages: int, workers: int,
+                          table_gate: bool = False,
+                          low_memory: bool = False,
+                          text_backend: str = PDFPLUMBER,
+                          page_filter=None) -> List[PageContent]:
+    """
+    페이지를 구간으로 나누어 프로세스 풀에서 파싱하고 페이지 순서대로 병합
+
+    풀은 spawn으로 시작합니다 (호출한 프로세스의 스레드 - HTTP 클라이언트 스레드 풀 등 - 가
+    잡고 있던 잠금/연결 상태를 fork로 물려받지 않도록).
+    """
+    # 페이지마다 파싱 비용이 달라서 워커 수보다 잘게 나눔 (부하 분산)
+    shard_size = max(1, -(-total_pages // (workers * 4)))
+    shards = [(start, min(start + shard_size, total_pages))
+              for start in range(0, total_pages, shard_size)]
+
+    logger.info(f"⚡ 페이지 병렬 파싱: {total_pages}페이지, "
+                f"{workers}개 프로세스, {len(shards)}개 구간")
+
+    pages = []
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [executor.submit(_parse_page_range, pdf_path, start, stop,
+                                   want_text, want_tables, table_gate, low_memory,
+                                   text_backend, page_filter)
+                   for start, stop in shards]
+
+        for future in as_completed(futures):
+            pages.extend(future.result())
+            if progress:
+                progress(len(pages), total_pages)
+
+    pages.sort(key=lambda page: page.page_num)
+    return pages
+
+
+def join_page_text(pages: List[PageContent]) -> str:
+    """페이지 텍스트를 하나의 문자열로 결합 (빈 페이지 제외)"""
+    return "".join(f"{page.text}\n" for page in pages if page.text)
+
+
+def join_normalized_text(pages: List[PageContent]) -> NormalizedText:
+    """페이지 정규화 텍스트를 하나의 문자열로 결합 (join_page_text와 같은 페이지 구성)"""
+    return NormalizedText("".join(
+        f"{page.normalized if page.normalized is not None else normalize_text(page.text)}\n"
+        for page in pages if page.text
+    ))
+
+
+def collect_tables(pages: List[PageContent]) -> list:
+    """모든 페이지의 표를 페이지 순서대로 모음"""
+    tables = []
+    for page in pages:
+        if page.tables:
+            logger.info(f"   페이지 {page.page_num}: {len(page.tables)}개 표 발견")
+            tables.extend(page.tables)
+    return tables
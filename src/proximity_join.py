@@ -0,0 +1,79 @@
+"""키워드-값 근접 결합 모듈
+
+키워드 출현 위치와 수량(숫자 + 단위) 토큰 위치를 정렬된 NumPy 배열로 두고,
+키워드 끝에서 window 글자 안에 시작하는 값을 np.searchsorted로 한 번에 결합합니다.
+`키워드.*?값` 정규식처럼 임의 거리를 지연 탐색하지 않으므로 멀리 떨어진 엉뚱한 숫자를
+잡지 않고, 줄바꿈을 넘는 가까운 값("... FWHM of\\n13 nm")은 찾습니다.
+
+값이 키워드 앞에 오는 표현("0.188 mmol PbCl2")은 preceding_join으로 키워드 바로 앞
+window 글자 안에서, 같은 절(쉼표/괄호/and로 나뉘지 않음)에서 끝나는 가장 가까운 값 하나를 결합합니다.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+# 키워드 끝에서 값 시작까지 최대 거리 (글자)
+PROXIMITY_WINDOW = 60
+# 값 끝에서 키워드 시작까지 최대 거리 (글자, 값이 앞에 오는 표현)
+PRECEDING_WINDOW = 30
+
+
+def proximity_join(left_ends: np.ndarray, right_starts: np.ndarray,
+                   window: int = PROXIMITY_WINDOW,
+                   breaks: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    left(키워드) 끝 위치 뒤 window 글자 안에서 시작하는 right(값)와의 모든 쌍
+
+    Args:
+        left_ends: 키워드 끝 위치 (임의 순서)
+        right_starts: 값 시작 위치 (오름차순)
+        window: 최대 거리 (글자)
+        breaks: 문장 경계 위치 (오름차순, 지정 시 경계를 사이에 둔 쌍 제외)
+
+    Returns:
+        (left 번호, right 번호) 배열 - left 순서, 같은 left 안에서는 가까운 순
+    """
+    lo = np.searchsorted(right_starts, left_ends, side='left')
+    hi = np.searchsorted(right_starts, left_ends + window, side='right')
+    counts = hi - lo
+
+    left_idx = np.repeat(np.arange(len(left_ends)), counts)
+    # left마다 lo, lo+1, ..., hi-1
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    right_idx = np.repeat(lo, counts) + (np.arange(len(left_idx)) - first)
+
+    if breaks is not None and len(breaks) and len(left_idx):
+        same_sentence = (np.searchsorted(breaks, left_ends[left_idx])
+                         == np.searchsorted(breaks, right_starts[right_idx]))
+        left_idx, right_idx = left_idx[same_sentence], right_idx[same_sentence]
+
+    return left_idx, right_idx
+
+
+def preceding_join(left_starts: np.ndarray, right_ends: np.ndarray,
+                   window: int = PRECEDING_WINDOW,
+                   breaks: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    left(키워드) 시작 위치 앞 window 글자 안에서 끝나는 가장 가까운 right(값)와의 쌍
+
+    Args:
+        left_starts: 키워드 시작 위치 (임의 순서)
+        right_ends: 값 끝 위치 (오름차순)
+        window: 최대 거리 (글자)
+        breaks: 경계 위치 (오름차순, 지정 시 경계를 사이에 둔 쌍 제외)
+
+    Returns:
+        (left 번호, right 번호) 배열 - left마다 최대 한 쌍
+    """
+    right_idx = np.searchsorted(right_ends, left_starts, side='right') - 1
+    found = right_idx >= 0
+    found[found] = right_ends[right_idx[found]] >= left_starts[found] - window
+    left_idx = np.flatnonzero(found)
+    right_idx = right_idx[found]
+
+    if breaks is not None and len(breaks) and len(left_idx):
+        same_clause = (np.searchsorted(breaks, right_ends[right_idx])
+                       == np.searchsorted(breaks, left_starts[left_idx]))
+        left_idx, right_idx = left_idx[same_clause], right_idx[same_clause]
+
+    return left_idx, right_idx
@@ -0,0 +1,92 @@
+"""논문 텍스트 수량(숫자 + 단위) 토크나이저 모듈
+
+텍스트를 한 번만 훑어 모든 `값 단위` 수량을 (값, 단위, 위치) NumPy 배열로 만듭니다.
+필드 추출기는 단위별로 배열을 조회하므로 필드마다 숫자/단위 정규식을 다시 돌리지 않고,
+μL→mL, h→min 같은 단위 변환도 여기서 한 곳에서 처리합니다.
+단위 패턴은 정규화된 텍스트(src.text_normalize: 소문자, μ -> u, °C -> c) 기준입니다.
+"""
+import re
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 표준 단위 -> 정규식 (순서 = 정규식 대안 순서)
+UNIT_PATTERNS = {
+    'C': r'c',
+    'nm': r'nm',
+    '%': r'%',
+    'mmol': r'mmol',
+    'mL': r'ml',
+    'uL': r'ul',
+    'min': r'min(?:ute)?s?',
+    'h': r'h(?:ours?|rs?)?',
+    's': r'sec(?:ond)?s?|s',
+}
+UNITS = tuple(UNIT_PATTERNS)
+_UNIT_CODE = {unit: code for code, unit in enumerate(UNITS)}
+
+# 단위 변환 계수: (원래 단위, 목표 단위) -> 곱할 값
+UNIT_CONVERSIONS: Dict[Tuple[str, str], float] = {
+    ('uL', 'mL'): 1 / 1000,
+    ('h', 'min'): 60,
+    ('s', 'min'): 1 / 60,
+}
+
+# 앞뒤가 다른 숫자/문자에 붙어 있지 않은 숫자 + 단위 ("CsPbCl3", "5 nmol", "5 hexane" 제외)
+_QUANTITY_REGEX = re.compile(
+    r'(?<![\w.])(\d+)(\.\d+)?\s*(?:'
+    + '|'.join(f'(?P<u{code}>{pattern})' for code, pattern in enumerate(UNIT_PATTERNS.values()))
+    + r')(?![a-z])'
+)
+
+
+def convert_quantity(value: float, unit: str, target: str) -> float:
+    """value를 unit에서 target 단위로 변환 (변환 불가 시 그대로 반환)"""
+    if unit == target:
+        return value
+    return value * UNIT_CONVERSIONS.get((unit, target), 1)
+
+
+class QuantityTokens:
+    """문서의 모든 수량 토큰 (시작 위치 오름차순 NumPy 배열)"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+        starts, ends, units, int_digits, fractional = [], [], [], [], []
+        self.number_text = []
+        for m in _QUANTITY_REGEX.finditer(text):
+            starts.append(m.start())
+            ends.append(m.end())
+            self.number_text.append(m.group(1) + (m.group(2) or ''))
+            units.append(int(m.lastgroup[1:]))
+            int_digits.append(len(m.group(1)))
+            fractional.append(m.group(2) is not None)
+
+        self.starts = np.array(starts, dtype=np.int64)
+        self.ends = np.array(ends, dtype=np.int64)
+        self.values = np.array([float(number) for number in self.number_text], dtype=np.float64)
+        self.units = np.array(units, dtype=np.int8)
+        self.int_digits = np.array(int_digits, dtype=np.int16)
+        self.fractional = np.array(fractional, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def select(self, units: Sequence[str], digits: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """
+        조건에 맞는 토큰 번호 (위치 순서)
+
+        Args:
+            units: 허용 단위 목록
+            digits: (최소, 최대) 정수부 자릿수 - 지정 시 소수 값은 제외
+        """
+        mask = np.isin(self.units, [_UNIT_CODE[unit] for unit in units])
+        if digits is not None:
+            mask &= ((self.int_digits >= digits[0]) & (self.int_digits <= digits[1])
+                     & ~self.fractional)
+        return np.flatnonzero(mask)
+
+    def unit(self, i: int) -> str:
+        """토큰 i의 표준 단위"""
+        return UNITS[self.units[i]]
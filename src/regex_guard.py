@@ -0,0 +1,116 @@
+"""정규식 실행 시간 제한 모듈
+
+이상한 텍스트에서 백트래킹이 폭주하는 패턴이 워커를 몇 분씩 붙잡지 않도록
+패턴별/문서별 시간 예산을 둡니다. 메인 스레드에서는 SIGALRM 타이머로 실행 중인
+정규식을 강제로 중단하고(sre 엔진이 매칭 중에도 시그널을 확인함), 그 외 환경에서는
+실행 시간을 누적하여 문서 예산을 넘으면 이후 패턴을 건너뜁니다.
+
+run() 안에서 다시 run()을 부르면(구간 스캔 중 수량 토큰/키워드 색인 등) 안쪽 호출은
+바깥 타이머와 시간 집계 안에서 그대로 실행합니다 (타이머를 덮어쓰거나 시간을 두 번 세지 않음).
+"""
+import logging
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATTERN_TIMEOUT = 2.0    # 초, 패턴 하나
+DEFAULT_DOCUMENT_TIMEOUT = 20.0  # 초, 문서 하나의 정규식 전체
+
+
+class RegexTimeout(Exception):
+    """정규식 실행 시간 초과"""
+
+    def __init__(self, label: str, elapsed: float):
+        super().__init__(f"정규식 시간 초과 ({elapsed:.2f}초): {label}")
+        self.label = label
+        self.elapsed = elapsed
+
+
+def _can_interrupt() -> bool:
+    """SIGALRM으로 실행 중인 정규식을 중단할 수 있는 환경인지"""
+    return (hasattr(signal, 'setitimer') and
+            threading.current_thread() is threading.main_thread())
+
+
+@contextmanager
+def _deadline(seconds: float, label: str):
+    """seconds 후 RegexTimeout을 발생시키는 타이머 (메인 스레드 전용)"""
+    start = time.perf_counter()
+
+    def on_alarm(signum, frame):
+        raise RegexTimeout(label, time.perf_counter() - start)
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class RegexBudget:
+    """문서 하나의 정규식 실행 시간 예산"""
+
+    def __init__(self, pattern_timeout: float = DEFAULT_PATTERN_TIMEOUT,
+                 document_timeout: float = DEFAULT_DOCUMENT_TIMEOUT):
+        """
+        Args:
+            pattern_timeout: 패턴 하나의 최대 실행 시간 (초)
+            document_timeout: 문서 전체 정규식 실행 시간 합계 상한 (초)
+        """
+        self.pattern_timeout = pattern_timeout
+        self.document_timeout = document_timeout
+        self.spent = 0.0
+        self.timeouts: List[str] = []
+        self.exhausted = False
+        self._active = False    # run() 실행 중 (중첩 호출 감지)
+
+    def run(self, label: str, func: Callable, *args, default=None):
+        """
+        시간 예산 안에서 func(*args) 실행
+
+        시간을 넘기면 label을 timeouts에 기록하고 default를 반환합니다.
+        문서 예산이 바닥나면 이후 호출은 실행하지 않고 바로 default를 반환합니다.
+        다른 run() 안에서 불리면 바깥 호출의 시간 제한 안에서 func를 바로 실행합니다
+        (시간 초과는 바깥 호출이 처리).
+
+        Args:
+            label: 기록용 패턴 이름
+            func: 정규식을 실행하는 함수
+            default: 시간 초과 시 반환값
+        """
+        if self._active:
+            return func(*args)
+        if self.exhausted:
+            return default
+
+        remaining = self.document_timeout - self.spent
+        if remaining <= 0:
+            self._exhaust()
+            return default
+
+        limit = min(self.pattern_timeout, remaining)
+        start = time.perf_counter()
+        self._active = True
+        try:
+            if _can_interrupt():
+                with _deadline(limit, label):
+                    return func(*args)
+            return func(*args)
+        except RegexTimeout as e:
+            logger.warning(f"⏱️ {e}")
+            self.timeouts.append(label)
+            return default
+        finally:
+            self._active = False
+            self.spent += time.perf_counter() - start
+
+    def _exhaust(self):
+        self.exhausted = True
+        logger.warning(f"⏱️ 문서 정규식 예산 소진 ({self.document_timeout:.0f}초) - 나머지 패턴 생략")
+        self.timeouts.append('<document budget exhausted>')
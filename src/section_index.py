@@ -0,0 +1,153 @@
+"""논문 섹션 색인 모듈
+
+문서마다 한 번만 제목 줄(Experimental, Methods, Results, References 등)을 찾아
+섹션별 오프셋 범위를 만듭니다. 필드 추출은 필요한 섹션 범위만 검색하고,
+참고문헌 목록은 검색 대상에서 제외합니다.
+텍스트는 normalize_text()로 정규화(소문자)된 것으로 보고 IGNORECASE 없이 검색합니다.
+"""
+import logging
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.regex_guard import RegexBudget
+from src.keyword_automaton import KeywordAutomaton
+
+logger = logging.getLogger(__name__)
+
+# 섹션 종류 -> 제목 패턴
+SECTION_HEADINGS = {
+    'abstract': r'abstract',
+    'introduction': r'introduction',
+    'experimental': (r'experimental(?:\s+(?:section|details|methods|procedures?))?'
+                     r'|(?:materials\s+and\s+)?methods?(?:\s+section)?'
+                     r'|synthesis\s+and\s+characterization'),
+    'results': r'results(?:\s+and\s+discussion)?|discussion',
+    'conclusions': r'conclusions?',
+    'acknowledgements': r'acknowledge?ments?',
+    'supporting': r'supporting\s+information|associated\s+content',
+    'references': (r'references(?:\s+and\s+notes)?|notes\s+and\s+references'
+                   r'|bibliography|literature\s+cited'),
+}
+
+# 제목 줄: 단독 줄, 앞에 글머리표/번호(1. / 2 / IV.) 허용, 끝에 . 또는 : 허용
+_HEADING_REGEX = re.compile(
+    r'^[ \t]*(?:[■•▪][ \t]*)?(?:(?:\d+|[ivx]+)\.?[ \t]+)?(?:'
+    + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_HEADINGS.items())
+    + r')[ \t]*[.:]?[ \t]*$',
+    re.MULTILINE
+)
+
+# 제목을 찾지 못했을 때 합성 섹션 시작 키워드 (앞 키워드 뒤 어딘가에 뒤 키워드가 있어야 함)
+SYNTHESIS_KEYWORDS = (
+    (r'synthesis\s+and\s+characterization', None),  # 가장 구체적
+    (r'cspbcl3', r'synthesis'),
+    (r'quantum dot', r'synthesis'),
+    (r'perovskite', r'synthesis'),
+    (r'qd', r'preparation'),
+    (r'experimental', r'section'),
+    (r'methods', r'section'),
+)
+# 리터럴 키워드는 오토마톤으로 본문을 한 번만 스캔, 나머지(공백 변형 허용)는 정규식
+_LITERAL_KEYWORD = re.compile(r'[a-z0-9 ]+')
+SECTION_KEYWORDS = KeywordAutomaton(
+    keyword for pair in SYNTHESIS_KEYWORDS for keyword in pair
+    if keyword and _LITERAL_KEYWORD.fullmatch(keyword)
+)
+_SYNTHESIS_KEYWORD_REGEX = {
+    keyword: re.compile(keyword) for pair in SYNTHESIS_KEYWORDS for keyword in pair
+    if keyword and keyword not in SECTION_KEYWORDS
+}
+
+# 키워드로 찾은 합성 섹션 길이
+SYNTHESIS_WINDOW = 5000
+
+
+class Section(NamedTuple):
+    """섹션 범위 [start, end) (start는 제목 줄 시작)"""
+    name: str
+    start: int
+    end: int
+
+
+class SectionIndex:
+    """문서의 섹션 제목 오프셋 색인"""
+
+    def __init__(self, text: str, budget: Optional[RegexBudget] = None):
+        """
+        Args:
+            text: 논문 텍스트
+            budget: 정규식 시간 예산 (시간 초과 시 제목 없음으로 처리)
+        """
+        self.text = text
+        self.sections: List[Section] = []
+
+        if budget is not None:
+            headings = budget.run('<section headings>', self._find_headings, default=[])
+        else:
+            headings = self._find_headings()
+        for i, (name, start) in enumerate(headings):
+            end = headings[i + 1][1] if i + 1 < len(headings) else len(text)
+            self.sections.append(Section(name, start, end))
+
+    def _find_headings(self) -> List[Tuple[str, int]]:
+        return [(m.lastgroup, m.start()) for m in _HEADING_REGEX.finditer(self.text)]
+
+    def ranges(self, name: str) -> List[Tuple[int, int]]:
+        """섹션 종류별 오프셋 범위 목록"""
+        return [(s.start, s.end) for s in self.sections if s.name == name]
+
+    def section_text(self, name: str) -> str:
+        """해당 종류 섹션들의 텍스트 (없으면 빈 문자열)"""
+        return "\n".join(self.text[start:end] for start, end in self.ranges(name))
+
+    def body_text(self) -> str:
+        """참고문헌 목록을 제외한 본문 텍스트"""
+        references = self.ranges('references')
+        if not references:
+            return self.text
+
+        parts = []
+        pos = 0
+        for start, end in references:
+            parts.append(self.text[pos:start])
+            pos = end
+        parts.append(self.text[pos:])
+        return "\n".join(parts)
+
+    def synthesis_section(self) -> Optional[str]:
+        """
+        합성 조건을 찾을 섹션
+
+        Experimental/Methods 제목이 있으면 해당 섹션을 사용하고, 없으면 본문에서
+        합성 키워드 위치부터 SYNTHESIS_WINDOW자를 사용합니다.
+
+        Returns:
+            str 또는 None (섹션 특정 불가)
+        """
+        section = self.section_text('experimental')
+        if section:
+            logger.debug(f"✅ 합성 섹션 발견 (제목): {len(section)}자")
+            return section
+
+        body = self.body_text()
+        hits = SECTION_KEYWORDS.scan(body)
+
+        def find(keyword: str, pos: int = 0) -> Optional[Tuple[int, int]]:
+            if keyword in SECTION_KEYWORDS:
+                start = hits.first(keyword, pos)
+                return None if start is None else (start, start + len(keyword))
+            match = _SYNTHESIS_KEYWORD_REGEX[keyword].search(body, pos)
+            return None if match is None else match.span()
+
+        for first, then in SYNTHESIS_KEYWORDS:
+            span = find(first)
+            if span is None:
+                continue
+            # 가장 앞선 first 뒤에 then이 없으면 이후 first 뒤에도 없음
+            if then is not None and find(then, span[1]) is None:
+                continue
+            start = span[0]
+            logger.debug(f"✅ 합성 섹션 발견 (키워드): '{body[start:span[1]]}'")
+            return body[start:start + SYNTHESIS_WINDOW]
+
+        return None
@@ -0,0 +1,49 @@
+"""SQLite 캐시 공통 모듈
+
+여러 워커 프로세스가 같은 캐시 파일을 공유하는 SQLite 캐시의 연결 관리:
+- WAL 모드 (읽기와 쓰기가 서로 막지 않음)
+- 연결은 프로세스마다 새로 엶 (fork된 워커는 부모 연결을 쓰지 않음)
+- 같은 프로세스의 스레드(백그라운드 조회)와 연결을 공유하므로 잠금으로 직렬화
+- 피클 시 연결/잠금 제외 (spawn 방식 워커로 전달 가능)
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+class SQLiteCache:
+    """프로세스별 SQLite 연결을 관리하는 캐시 기반 클래스 (SCHEMA는 하위 클래스가 정의)"""
+
+    SCHEMA = ""
+
+    def __init__(self, db_path: Path):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(_conn=None, _conn_pid=None, _lock=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 프로세스의 연결 (호출자가 self._lock을 잡은 상태에서 사용)"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+            self._conn, self._conn_pid = conn, os.getpid()
+        return self._conn
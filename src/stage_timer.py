@@ -0,0 +1,93 @@
+"""단계별 실행 시간 계측 모듈
+
+논문 하나를 처리하는 동안 단계(다운로드, Selenium, PDF 파싱, 메타데이터, 정규식 등)별
+벽시계 시간과 CPU 시간, 다운로드 바이트/파싱 페이지 같은 카운터를 모아
+결과 행 옆에 붙일 수 있는 구조화된 기록으로 만듭니다.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+
+
+class StageTimer:
+    """문서 하나의 단계별 시간/카운터 기록"""
+
+    def __init__(self):
+        self.wall: Dict[str, float] = defaultdict(float)
+        self.cpu: Dict[str, float] = defaultdict(float)
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.peaks: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록 실행 시간을 name 단계에 누적 (같은 단계는 합산)"""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.wall[name] += time.perf_counter() - wall_start
+            self.cpu[name] += time.process_time() - cpu_start
+
+    def add(self, name: str, wall: float, cpu: Optional[float] = None):
+        """다른 곳에서 잰 시간을 name 단계에 누적 (CPU 시간을 모르면 None)"""
+        self.wall[name] += wall
+        if cpu is not None:
+            self.cpu[name] += cpu
+
+    def count(self, name: str, amount: int = 1):
+        """카운터 증가 (bytes_downloaded, pages_parsed 등)"""
+        self.counters[name] += amount
+
+    def peak(self, name: str, value: float):
+        """최대값 기록 (peak_rss_mb 등 - 합산하지 않고 최대값 유지)"""
+        self.peaks[name] = max(value, self.peaks.get(name, value))
+
+    def record(self) -> Dict:
+        """
+        구조화된 기록
+
+        Returns:
+            Dict: {'total_wall_s', 'stages': {단계: {'wall_s', 'cpu_s'}}, 카운터..., 최대값...}
+        """
+        record = {
+            'total_wall_s': round(time.perf_counter() - self._start, 4),
+            'stages': {
+                name: {'wall_s': round(wall, 4),
+                       'cpu_s': round(self.cpu[name], 4) if name in self.cpu else None}
+                for name, wall in self.wall.items()
+            },
+        }
+        record.update(self.counters)
+        record.update({name: round(value, 1) for name, value in self.peaks.items()})
+        return record
+
+
+def aggregate_timings(records: Iterable[Dict]) -> Dict:
+    """
+    여러 문서의 기록을 단계별로 합산 (peak_로 시작하는 항목은 최대값)
+
+    Returns:
+        Dict: {'documents', 'total_wall_s', 'stages': {단계: {'wall_s', 'cpu_s', 'max_wall_s'}}, 카운터...}
+    """
+    summary = {'documents': 0, 'total_wall_s': 0.0, 'stages': {}}
+    for record in records:
+        if not record:
+            continue
+        summary['documents'] += 1
+        summary['total_wall_s'] += record.get('total_wall_s', 0.0)
+        for name, stage in record.get('stages', {}).items():
+            total = summary['stages'].setdefault(name, {'wall_s': 0.0, 'cpu_s': 0.0, 'max_wall_s': 0.0})
+            total['wall_s'] += stage['wall_s']
+            total['cpu_s'] += stage['cpu_s'] or 0.0
+            total['max_wall_s'] = max(total['max_wall_s'], stage['wall_s'])
+        for key, value in record.items():
+            if key in ('total_wall_s', 'stages') or not isinstance(value, (int, float)):
+                continue
+            if key.startswith('peak_'):
+                summary[key] = max(summary.get(key, value), value)
+            else:
+                summary[key] = summary.get(key, 0) + value
+    return summary
@@ -0,0 +1,131 @@
+"""PDF 표 정규화 모듈
+
+pdfplumber가 반환하는 표(문자열 셀의 2차원 리스트)를 한 번만 정규화하여
+헤더 맵, 소문자 행 텍스트, 숫자 행렬(NumPy)을 미리 계산해 둡니다.
+표 파서들은 행/표 텍스트를 다시 만들거나 셀을 다시 파싱하지 않고 이 객체를 사용합니다.
+표/행 키워드 판정은 키워드 오토마톤으로 표 텍스트를 한 번만 스캔한 결과를 씁니다.
+"""
+import re
+from bisect import bisect_right
+from typing import Dict, List, Set
+
+import numpy as np
+
+from src.keyword_automaton import KeywordAutomaton, KeywordHits
+
+# 관련 표 판정 키워드 (표 파서와 표 탐지 전 페이지 선별(src.pdf_pages)이 같은 목록을 사용)
+SYNTHESIS_TABLE_KEYWORDS = ('cspbcl3', 'perovskite', 'quantum dot', 'pbcl2')
+PROPERTY_TABLE_KEYWORDS = ('pl', 'plqy', 'size', 'emission')
+
+# 셀이 숫자로 시작할 때만 값으로 인정 ("160 °C", "0.188 mmol", "9.5 ± 0.3", "~85%")
+# "PbCl2", "CsPbCl3"처럼 화학식 안의 숫자는 값이 아님
+_CELL_NUMBER = re.compile(r'^\s*[~≈<>]?\s*([-+]?\d+(?:\.\d+)?)')
+
+
+def parse_cell_number(cell) -> float:
+    """셀 값을 숫자로 변환 (숫자가 아니면 NaN)"""
+    if cell is None:
+        return np.nan
+    if isinstance(cell, (int, float)):
+        return float(cell)
+    match = _CELL_NUMBER.match(str(cell))
+    return float(match.group(1)) if match else np.nan
+
+
+class NormalizedTable:
+    """정규화된 표 (첫 행은 헤더)"""
+
+    def __init__(self, rows: list):
+        """
+        Args:
+            rows: pdfplumber 표 (행 리스트, 셀은 문자열 또는 None)
+        """
+        n_cols = max((len(row) for row in rows if row), default=0)
+        self.rows: List[List[str]] = [
+            [str(cell) if cell else '' for cell in (row or [])] + [''] * (n_cols - len(row or []))
+            for row in rows
+        ]
+
+        # 소문자 행 텍스트 (빈 셀 제외) / 표 전체 텍스트
+        self.row_text: List[str] = [
+            ' '.join(cell.lower() for cell in row if cell) for row in self.rows
+        ]
+        self.text = ' '.join(self.row_text)
+        self._keyword_cache: Dict[KeywordAutomaton, tuple] = {}
+
+        # 헤더 맵: 소문자 헤더 텍스트 -> 열 번호
+        self.header: List[str] = [cell.lower().strip() for cell in self.rows[0]] if self.rows else []
+        self.header_map: Dict[str, int] = {name: col for col, name in enumerate(self.header) if name}
+
+        # 숫자 행렬 (행 x 열, 숫자가 아닌 셀은 NaN)
+        cells = [cell for row in self.rows for cell in row]
+        self.numbers = np.fromiter(
+            (parse_cell_number(cell) for cell in cells), dtype=float, count=len(cells)
+        ).reshape(len(self.rows), n_cols)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def contains(self, *keywords: str) -> bool:
+        """표 텍스트에 키워드 중 하나라도 있는지"""
+        return any(keyword in self.text for keyword in keywords)
+
+    def _scan_keywords(self, automaton: KeywordAutomaton) -> tuple:
+        """표 텍스트를 오토마톤으로 한 번 스캔하여 (전체 출현 위치, 행별 키워드 집합) 캐시"""
+        cached = self._keyword_cache.get(automaton)
+        if cached is not None:
+            return cached
+
+        hits = automaton.scan(self.text)
+        row_starts = []
+        pos = 0
+        for text in self.row_text:
+            row_starts.append(pos)
+            pos += len(text) + 1
+
+        rows: List[Set[str]] = [set() for _ in self.row_text]
+        for keyword, starts in hits.offsets.items():
+            for start in starts:
+                r = bisect_right(row_starts, start) - 1
+                # 행 경계(공백)를 넘는 출현은 행 키워드가 아님
+                if start + len(keyword) <= row_starts[r] + len(self.row_text[r]):
+                    rows[r].add(keyword)
+
+        cached = self._keyword_cache[automaton] = (hits, rows)
+        return cached
+
+    def keyword_hits(self, automaton: KeywordAutomaton) -> KeywordHits:
+        """표 전체 텍스트의 키워드 출현 위치"""
+        return self._scan_keywords(automaton)[0]
+
+    def row_keywords(self, automaton: KeywordAutomaton) -> List[Set[str]]:
+        """행별로 나오는 키워드 집합 (행 순서)"""
+        return self._scan_keywords(automaton)[1]
+
+    def columns_matching(self, *keywords: str) -> List[int]:
+        """헤더에 키워드로 시작하는 단어가 있는 열 번호 ('oa'는 'loading'에 매치되지 않음)"""
+        patterns = [re.compile(r'\b' + re.escape(keyword)) for keyword in keywords]
+        return [col for name, col in self.header_map.items()
+                if any(pattern.search(name) for pattern in patterns)]
+
+    def row_values(self, row: int, low: float, high: float) -> np.ndarray:
+        """행의 숫자 중 [low, high] 범위 값 (열 순서)"""
+        values = self.numbers[row]
+        return values[(values >= low) & (values <= high)]
+
+    def column_values(self, col: int, low: float, high: float) -> np.ndarray:
+        """열의 숫자 중 [low, high] 범위 값 (헤더 제외, 행 순서)"""
+        values = self.numbers[1:, col]
+        return values[(values >= low) & (values <= high)]
+
+
+def normalize_tables(tables: list) -> List[NormalizedTable]:
+    """표 목록 정규화 (2행 미만 표 제외, 이미 정규화된 표는 그대로 사용)"""
+    normalized = []
+    for table in tables:
+        if not isinstance(table, NormalizedTable):
+            if not table or len(table) < 2:
+                continue
+            table = NormalizedTable(table)
+        normalized.append(table)
+    return normalized
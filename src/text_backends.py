@@ -0,0 +1,125 @@
+"""PDF 텍스트 추출 엔진 모듈
+
+페이지 텍스트 추출 엔진을 배포 환경별로 고를 수 있게 합니다.
+- pdfplumber: 순수 Python 레이아웃 분석 (기본값, 다른 엔진을 쓸 수 없을 때의 대체 엔진)
+- pdfium: pypdfium2 (PDFium 네이티브 라이브러리, 선택 의존성)
+- pymupdf: PyMuPDF (MuPDF 네이티브 라이브러리, 선택 의존성)
+
+표 추출은 엔진과 관계없이 항상 pdfplumber를 사용합니다.
+엔진은 인자로 지정하거나 환경 변수 PDF_TEXT_BACKEND로 정합니다 ('auto'면 설치된 것 중 가장 빠른 엔진).
+"""
+import logging
+import os
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+PDFPLUMBER = 'pdfplumber'
+ENV_VAR = 'PDF_TEXT_BACKEND'
+
+# 'auto' 선택 순서 (빠른 순)
+AUTO_ORDER = ('pdfium', 'pymupdf', PDFPLUMBER)
+
+
+class PdfiumText:
+    """pypdfium2 문서 (페이지 번호로 텍스트 조회)"""
+
+    def __init__(self, pdf_path):
+        import pypdfium2
+        self.doc = pypdfium2.PdfDocument(str(pdf_path))
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    def page_text(self, index: int) -> str:
+        page = self.doc[index]
+        try:
+            text_page = page.get_textpage()
+            try:
+                text = text_page.get_text_range()
+            finally:
+                text_page.close()
+        finally:
+            page.close()
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    def close(self):
+        self.doc.close()
+
+
+class PyMuPDFText:
+    """PyMuPDF 문서 (페이지 번호로 텍스트 조회)"""
+
+    def __init__(self, pdf_path):
+        import fitz
+        self.doc = fitz.open(str(pdf_path))
+
+    def __len__(self) -> int:
+        return len(self.doc)
+
+    def page_text(self, index: int) -> str:
+        return self.doc[index].get_text("text")
+
+    def close(self):
+        self.doc.close()
+
+
+# 엔진 이름 -> (문서 클래스, 필요한 모듈) / pdfplumber는 페이지 객체에서 직접 추출
+TEXT_BACKENDS = {
+    'pdfium': (PdfiumText, 'pypdfium2'),
+    'pymupdf': (PyMuPDFText, 'fitz'),
+}
+
+
+def backend_available(name: str) -> bool:
+    """엔진 사용 가능 여부 (선택 의존성 설치 확인)"""
+    if name == PDFPLUMBER:
+        return True
+    if name not in TEXT_BACKENDS:
+        return False
+    try:
+        __import__(TEXT_BACKENDS[name][1])
+        return True
+    except ImportError:
+        return False
+
+
+def available_backends() -> List[str]:
+    """사용 가능한 엔진 목록 (빠른 순)"""
+    return [name for name in AUTO_ORDER if backend_available(name)]
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """
+    사용할 엔진 이름 결정
+
+    Args:
+        name: 엔진 이름, 'auto', 또는 None (None이면 환경 변수 PDF_TEXT_BACKEND, 없으면 pdfplumber)
+
+    Returns:
+        str: 실제 사용할 엔진 (요청한 엔진을 쓸 수 없으면 pdfplumber)
+    """
+    if name is None:
+        name = os.environ.get(ENV_VAR, PDFPLUMBER)
+    name = name.strip().lower()
+
+    if name == 'auto':
+        return available_backends()[0]
+    if backend_available(name):
+        return name
+
+    logger.warning(f"⚠️ 텍스트 엔진 '{name}' 사용 불가 - {PDFPLUMBER}로 대체")
+    return PDFPLUMBER
+
+
+def open_text_document(name: str, pdf_path):
+    """
+    엔진 문서 열기
+
+    Returns:
+        페이지 텍스트 조회 객체 (len, page_text(index), close) 또는 None (pdfplumber)
+    """
+    if name == PDFPLUMBER:
+        return None
+    document_class, _ = TEXT_BACKENDS[name]
+    return document_class(pdf_path)
@@ -0,0 +1,71 @@
+"""논문 텍스트 정규화 모듈
+
+PDF에서 추출한 텍스트의 유니코드 변형을 문서(페이지)마다 한 번만 ASCII 형태로 바꿉니다.
+- 공백 변형(NBSP, thin space 등) -> 공백, 폭 없는 문자/soft hyphen 제거
+- 대시/마이너스 변형 -> '-', 아래첨자 숫자 -> 숫자, 리가처(ﬁ, ﬂ 등) -> 글자
+- μ/µ -> u, ℃/°C/º C -> c (온도 단위 앞 도 기호 제거)
+- 줄 끝 하이픈으로 나뉜 단어 결합 (photo-\\nluminescence -> photoluminescence)
+- 소문자 변환
+
+필드 추출 정규식(src.field_scanner, src.section_index, src.quantity_tokens)은 정규화된
+텍스트를 기준으로 ASCII 소문자 패턴만 사용하고 IGNORECASE 없이 컴파일합니다.
+정규화 결과는 페이지 텍스트와 함께 파싱 캐시에 저장됩니다.
+"""
+import re
+
+# 문자 단위 치환 (None이면 제거)
+_TRANSLATION = str.maketrans({
+    # 공백 변형 (NBSP, en/em/thin/hair space, narrow NBSP, 전각 공백 등)
+    **{chr(code): ' ' for code in (0x00a0, *range(0x2000, 0x200b), 0x202f, 0x205f, 0x3000)},
+    # 폭 없는 문자, soft hyphen
+    **{chr(code): None for code in (0x00ad, 0x200b, 0x200c, 0x200d, 0x2060, 0xfeff)},
+    # 대시/마이너스
+    **{chr(code): '-' for code in (*range(0x2010, 0x2016), 0x2212, 0xfe63, 0xff0d)},
+    # 따옴표
+    '‘': "'", '’': "'", '“': '"', '”': '"',
+    # 마이크로 (그리스 문자 mu, micro sign)
+    'μ': 'u', 'µ': 'u',
+    # 온도 (도 기호 변형 통일)
+    '℃': '°C', '˚': '°', 'º': '°',
+    # 아래첨자 숫자
+    '₀': '0', '₁': '1', '₂': '2', '₃': '3', '₄': '4',
+    '₅': '5', '₆': '6', '₇': '7', '₈': '8', '₉': '9',
+    # 리가처
+    'ﬀ': 'ff', 'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬃ': 'ffi', 'ﬄ': 'ffl',
+    'ﬅ': 'st', 'ﬆ': 'st',
+})
+
+# 치환 대상 문자 (대부분 ASCII인 텍스트에서 해당 문자만 찾아 바꿈 - 전체 translate보다 빠름)
+_SPECIAL = re.compile('[' + re.escape(''.join(chr(code) for code in _TRANSLATION)) + ']')
+
+# 온도 단위 앞 도 기호 ("180 °C" -> "180 C")
+_DEGREE = re.compile(r'°\s*(?=[CFK](?![A-Za-z]))')
+# 소문자 사이 줄 끝 하이픈 - 한 단어로 결합 ('-'로 시작해야 정규식 엔진이 빠르게 건너뜀)
+_WORD_BREAK = re.compile(r'-(?<=[a-z]-)[ \t]*\n[ \t]*(?=[a-z])')
+# 그 밖의 줄 끝 하이픈 (Cs-\noleate) - 하이픈은 두고 줄바꿈만 제거
+_HYPHEN_BREAK = re.compile(r'-(?<=\w-)[ \t]*\n[ \t]*(?=\w)')
+
+
+class NormalizedText(str):
+    """normalize_text()를 거친 텍스트 (다시 정규화하지 않도록 표시)"""
+    __slots__ = ()
+
+
+def normalize_text(text: str) -> NormalizedText:
+    """
+    필드 추출용 텍스트 정규화 (이미 정규화된 텍스트는 그대로 반환)
+
+    Args:
+        text: PDF에서 추출한 텍스트
+
+    Returns:
+        NormalizedText: ASCII 변형 통일 + 소문자 텍스트 (줄 구분은 유지)
+    """
+    if isinstance(text, NormalizedText):
+        return text
+    if not text.isascii():
+        text = _SPECIAL.sub(lambda m: m.group().translate(_TRANSLATION), text)
+        text = _DEGREE.sub('', text)
+    text = _WORD_BREAK.sub('', text)
+    text = _HYPHEN_BREAK.sub('-', text)
+    return NormalizedText(text.lower())
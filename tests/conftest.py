@@ -0,0 +1,6 @@
+"""pytest 공통 설정 (scripts/와 같이 프로젝트 루트를 import 경로에 추가)"""
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
@@ -0,0 +1,63 @@
+"""CrossRef 일괄 조회 누락 DOI 처리 테스트"""
+from src.crossref_cache import CrossRefCache, fetch_works
+
+
+class FakeResponse:
+    def __init__(self, items):
+        self.items = items
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {'message': {'items': self.items}}
+
+
+class FakeClient:
+    """fetch_all()만 흉내 낸 HTTP 클라이언트 (배치마다 같은 결과, 요청 기록)"""
+
+    def __init__(self, items=None, error=None):
+        self.items = items or []
+        self.error = error
+        self.calls = []
+
+    def fetch_all(self, calls):
+        self.calls.extend(calls)
+        return [self.error or FakeResponse(self.items) for _ in self.calls]
+
+
+WORK = {'DOI': '10.1021/FOUND', 'author': [{'given': 'Ada', 'family': 'Kim'}],
+        'published': {'date-parts': [[2020]]}, 'container-title': ['Nano Lett.']}
+
+
+def test_fetch_works_returns_only_found_dois():
+    results = fetch_works(['10.1021/found', '10.1021/missing'], FakeClient([WORK]))
+
+    assert list(results) == ['10.1021/found']
+    assert results['10.1021/found']['year'] == 2020
+    assert results['10.1021/found']['journal'] == 'Nano Lett.'
+
+
+def test_failed_batch_returns_nothing():
+    client = FakeClient(error=ConnectionError('offline'))
+    assert fetch_works(['10.1021/found'], client) == {}
+
+
+def test_prefetch_does_not_negative_cache_batch_misses(tmp_path):
+    cache = CrossRefCache(tmp_path / 'metadata.sqlite')
+
+    results = cache.prefetch(['10.1021/found', '10.1021/missing'], FakeClient([WORK]))
+
+    assert set(results) == {'10.1021/found'}
+    assert cache.get('10.1021/found') is not None
+    # 누락 DOI는 캐시에 {}로 남기지 않음 (워커가 개별 조회로 확인)
+    assert cache.get('10.1021/missing') is None
+
+
+def test_prefetch_skips_cached_dois(tmp_path):
+    cache = CrossRefCache(tmp_path / 'metadata.sqlite')
+    cache.prefetch(['10.1021/found'], FakeClient([WORK]))
+
+    client = FakeClient([WORK])
+    assert set(cache.prefetch(['10.1021/found'], client)) == {'10.1021/found'}
+    assert client.calls == []
@@ -0,0 +1,122 @@
+"""HTTPClient 이어받기 다운로드 테스트 (로컬 HTTP 서버)"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.http_client import HTTPClient
+
+BODY = bytes(range(256)) * 200
+ETAG = '"v1"'
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Range/If-Range를 지원하는 정적 파일 서버 (server.options로 동작 변경)"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        options = self.server.options
+        requested = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        self.server.requests.append({'range': requested, 'if_range': if_range,
+                                     'accept_encoding': self.headers.get('Accept-Encoding')})
+
+        start, status = 0, 200
+        if requested and (if_range is None or if_range == options['etag']):
+            start, status = int(requested.split('=')[1].rstrip('-')), 206
+            start = max(0, start - options.get('range_shift', 0))
+        part = BODY[start:]
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('ETag', options['etag'])
+        self.send_header('Content-Length', str(len(part)))
+        if status == 206:
+            self.send_header('Content-Range', f"bytes {start}-{len(BODY) - 1}/{len(BODY)}")
+        self.end_headers()
+        self.wfile.write(part)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+    httpd.options = {'etag': ETAG}
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def client():
+    client = HTTPClient(retries=0, min_interval=0)
+    yield client
+    client.close()
+
+
+def _leave_partial(dest, url, data, validator=ETAG):
+    """이전 실행에서 끊긴 것처럼 임시 파일과 메타 파일 남기기"""
+    dest.with_name(dest.name + '.part').write_bytes(data)
+    dest.with_name(dest.name + '.part.meta').write_text(
+        json.dumps({'url': url, 'validator': validator}), encoding='utf-8')
+
+
+def test_download_writes_file_and_requests_identity(server, client, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/paper.pdf"
+    dest = tmp_path / 'paper.pdf'
+
+    assert client.download(url, dest, content_type='application/pdf') == len(BODY)
+    assert dest.read_bytes() == BODY
+    assert server.requests[0]['accept_encoding'] == 'identity'
+    assert not dest.with_name('paper.pdf.part').exists()
+    assert not dest.with_name('paper.pdf.part.meta').exists()
+
+
+def test_resume_sends_range_with_if_range(server, client, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/paper.pdf"
+    dest = tmp_path / 'paper.pdf'
+    _leave_partial(dest, url, BODY[:5000])
+
+    assert client.download(url, dest) == len(BODY) - 5000
+    assert dest.read_bytes() == BODY
+    assert server.requests == [{'range': 'bytes=5000-', 'if_range': ETAG,
+                                'accept_encoding': 'identity'}]
+
+
+def test_changed_file_restarts_from_scratch(server, client, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/paper.pdf"
+    dest = tmp_path / 'paper.pdf'
+    _leave_partial(dest, url, b'x' * 5000, validator='"old"')
+
+    # 검증자가 다르면 서버가 전체(200)를 보내고 임시 파일을 덮어씀
+    assert client.download(url, dest) == len(BODY)
+    assert dest.read_bytes() == BODY
+
+
+def test_partial_from_other_url_is_discarded(server, client, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/paper.pdf"
+    dest = tmp_path / 'paper.pdf'
+    _leave_partial(dest, url.replace('paper', 'other'), b'x' * 5000)
+
+    assert client.download(url, dest) == len(BODY)
+    assert dest.read_bytes() == BODY
+    assert server.requests[0]['range'] is None
+
+
+def test_mismatched_content_range_is_not_appended(server, client, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/paper.pdf"
+    dest = tmp_path / 'paper.pdf'
+    _leave_partial(dest, url, BODY[:5000])
+    server.options['range_shift'] = 100
+
+    # 요청한 위치가 아닌 206은 버리고 처음부터 다시 받음
+    client.download(url, dest)
+    assert dest.read_bytes() == BODY
+    assert server.requests[0]['range'] == 'bytes=5000-'
+    assert server.requests[1]['range'] is None
@@ -0,0 +1,76 @@
+"""PageFilter 상투 페이지 학습 테스트"""
+import json
+import time
+
+from src.page_filter import BOILERPLATE_MAX_CHARS, PageFilter, document_key
+
+LICENSE = "This article is licensed under a Creative Commons Attribution 4.0 License. " * 3
+
+
+class FakePage:
+    """classify()가 쓰는 pdfplumber 페이지 속성만 흉내 낸 페이지"""
+
+    def __init__(self, text: str):
+        self.chars = [{'text': char} for char in text]
+        self.images = []
+        self.width = self.height = 100
+
+
+def _doi_key(doi: str, fallback: str) -> str:
+    return document_key([f"J. Mater. Chem. 2020, doi:{doi}\nbody"], fallback)
+
+
+def test_document_key_prefers_doi_then_title():
+    assert _doi_key('10.1021/ABC.123', 'hash') == 'doi:10.1021/abc.123'
+    assert document_key(["A Study of Perovskite Nanocrystal Growth\nbody"], 'hash') == \
+        'title:astudyofperovskitenanocrystalgrowth'
+    assert document_key(["short\n", None], 'hash') == 'hash'
+
+
+def test_copies_of_one_document_are_not_promoted(tmp_path):
+    page_filter = PageFilter(tmp_path / 'boilerplate.json')
+    _, fingerprint = page_filter.classify(FakePage(LICENSE))
+
+    # 바이트가 다른 사본 (파일 해시는 다르지만 DOI가 같음)
+    for i in range(5):
+        page_filter.observe(_doi_key('10.1021/abc.123', f"hash{i}"), [fingerprint])
+
+    assert fingerprint not in page_filter.known
+    assert page_filter.classify(FakePage(LICENSE))[0] is None
+
+
+def test_page_repeated_in_distinct_documents_is_promoted(tmp_path):
+    path = tmp_path / 'boilerplate.json'
+    page_filter = PageFilter(path, min_docs=3)
+    _, fingerprint = page_filter.classify(FakePage(LICENSE))
+
+    for i in range(3):
+        page_filter.observe(_doi_key(f"10.1021/doc.{i}", f"hash{i}"), [fingerprint])
+
+    assert page_filter.classify(FakePage(LICENSE)) == ('boilerplate', fingerprint)
+    assert fingerprint in PageFilter(path).known
+
+
+def test_long_pages_are_never_fingerprinted(tmp_path):
+    page_filter = PageFilter(tmp_path / 'boilerplate.json')
+    assert page_filter.classify(FakePage("x" * (BOILERPLATE_MAX_CHARS + 1))) == (None, None)
+
+
+def test_learned_fingerprints_expire(tmp_path):
+    path = tmp_path / 'boilerplate.json'
+    old = time.time() - 200 * 24 * 3600
+    path.write_text(json.dumps({'known': {'stale': old, 'fresh': time.time()}}), encoding='utf-8')
+
+    assert list(PageFilter(path, expire_days=180).known) == ['fresh']
+
+
+def test_reset_clears_learning(tmp_path):
+    path = tmp_path / 'boilerplate.json'
+    page_filter = PageFilter(path, min_docs=1)
+    _, fingerprint = page_filter.classify(FakePage(LICENSE))
+    page_filter.observe('doi:10.1/a', [fingerprint])
+    assert fingerprint in PageFilter(path).known
+
+    PageFilter(path).reset()
+    assert PageFilter(path).known == {}
+    assert json.loads(path.read_text(encoding='utf-8')) == {'known': {}, 'seen': {}, 'docs': []}
@@ -0,0 +1,65 @@
+"""RegexBudget 시간 제한 동작 테스트"""
+import re
+import signal
+import time
+
+import pytest
+
+from src.regex_guard import RegexBudget
+
+requires_alarm = pytest.mark.skipif(not hasattr(signal, 'setitimer'),
+                                    reason="SIGALRM 타이머가 없는 플랫폼")
+
+
+def _busy(seconds: float) -> str:
+    """seconds 동안 CPU를 붙잡는 함수 (SIGALRM으로 중단 가능)"""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return 'done'
+
+
+def test_returns_result_within_budget():
+    budget = RegexBudget(pattern_timeout=1.0)
+    assert budget.run('digits', re.findall, r'\d+', 'a1b22c333') == ['1', '22', '333']
+    assert budget.timeouts == []
+    assert not budget.exhausted
+
+
+@requires_alarm
+def test_pattern_timeout_returns_default():
+    budget = RegexBudget(pattern_timeout=0.2)
+    start = time.perf_counter()
+    assert budget.run('slow', _busy, 5.0, default='timeout') == 'timeout'
+    assert time.perf_counter() - start < 2.0
+    assert budget.timeouts == ['slow']
+
+
+@requires_alarm
+def test_nested_run_keeps_outer_deadline():
+    budget = RegexBudget(pattern_timeout=0.3)
+
+    def outer():
+        assert budget.run('inner', lambda: 'inner') == 'inner'
+        return _busy(5.0)
+
+    start = time.perf_counter()
+    assert budget.run('outer', outer, default='timeout') == 'timeout'
+    elapsed = time.perf_counter() - start
+    assert elapsed < 2.0
+    assert budget.timeouts == ['outer']
+    # 안쪽 호출 시간을 따로 더하지 않음
+    assert budget.spent == pytest.approx(elapsed, abs=0.1)
+
+
+@requires_alarm
+def test_document_budget_exhausted_skips_later_patterns():
+    budget = RegexBudget(pattern_timeout=0.2, document_timeout=0.3)
+    budget.run('first', _busy, 5.0, default=None)
+    budget.run('second', _busy, 5.0, default=None)
+
+    calls = []
+    assert budget.run('third', calls.append, 'x', default='skipped') == 'skipped'
+    assert calls == []
+    assert budget.exhausted
+    assert budget.timeouts[-1] == '<document budget exhausted>'